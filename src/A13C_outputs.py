@@ -1,4 +1,6 @@
 import math
+
+import numpy as np
 import pandas as pd
 from data_access import get_case_table
 
@@ -67,13 +69,13 @@ def A13C_outputs(stored_values, *_):
             )
         else:
             # For larger angles: closest ratio
-            ratio_match = min(ratio_subset, key=lambda x: abs(x - A_ratio))
+            ratio_match = ratio_subset[np.abs(ratio_subset - A_ratio).argmin()]
 
         matched_row = df[(df["ANGLE"] == angle_match) & (df["As/A"] == ratio_match)]
         if matched_row.empty:
             return {"Error": "No matching data in A13C for given angle and area ratio."}
 
-        C_base = matched_row["C"].values[0]
+        C_base = matched_row["C"].iat[0]
 
         # ---------- Screen correction (A14A1) ----------
         loss_coefficient = C_base
@@ -91,7 +93,7 @@ def A13C_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # C_total = C + C1 / (As/A)²
             loss_coefficient = C_base + (C1 / (A_ratio ** 2 if A_ratio != 0 else 1.0))
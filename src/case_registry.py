@@ -1,41 +1,58 @@
 # case_registry.py
+from dataclasses import dataclass
+from types import MappingProxyType
 
-CASE_CONFIG = {
+
+@dataclass(slots=True, frozen=True)
+class CaseSpec:
+    """
+    Immutable per-case details configuration.
+
+    Built once at import; get_case_details reads plain attributes off a
+    2-slot-per-field object instead of hashing string keys into a nested
+    dict on every call. row_filter is a tuple of (column, value) pairs so
+    the whole spec stays hashable.
+    """
+    sheet_key: str
+    arg_cols: tuple
+    value_col: str = "C"
+    excel_range: str = ""
+    row_filter: tuple = ()
+    description: str = ""
+
+
+CASE_CONFIG = MappingProxyType({
     # 1D example: A15C (h/D -> C)
-    "A15C": {
-        "sheet_key": "A15C",
-        "arg_cols": ["h/D"],
-        "value_col": "C",
-        "excel_range": "Sheet A15C!B4:C15",  # update to real range
-        "description": "Exit: Segmental opening in round duct",
-    },
+    "A15C": CaseSpec(
+        sheet_key="A15C",
+        arg_cols=("h/D",),
+        excel_range="Sheet A15C!B4:C15",  # update to real range
+        description="Exit: Segmental opening in round duct",
+    ),
 
     # 2D example: A13C (ANGLE, As/A -> C)
-    "A13C": {
-        "sheet_key": "A13C",
-        "arg_cols": ["ANGLE", "As/A"],
-        "value_col": "C",
-        "excel_range": "Sheet A13C!B4:H20",
-        "description": "Rectangular conical exit with/without wall",
-    },
+    "A13C": CaseSpec(
+        sheet_key="A13C",
+        arg_cols=("ANGLE", "As/A"),
+        excel_range="Sheet A13C!B4:H20",
+        description="Rectangular conical exit with/without wall",
+    ),
 
     # 3D example: A11V branch path
-    "A11V_branch": {
-        "sheet_key": "A11V",
-        "row_filter": {"PATH": "branch"},
-        "arg_cols": ["Ab/As", "Ab/Ac", "Qb/Qc"],
-        "value_col": "C",
-        "excel_range": "Sheet A11V!B4:H40",
-        "description": "A11V branch path loss coefficient",
-    },
+    "A11V_branch": CaseSpec(
+        sheet_key="A11V",
+        row_filter=(("PATH", "branch"),),
+        arg_cols=("Ab/As", "Ab/Ac", "Qb/Qc"),
+        excel_range="Sheet A11V!B4:H40",
+        description="A11V branch path loss coefficient",
+    ),
 
     # 3D example: A11V main path
-    "A11V_main": {
-        "sheet_key": "A11V",
-        "row_filter": {"PATH": "main"},
-        "arg_cols": ["Ab/As", "Ab/Ac", "Qb/Qc"],
-        "value_col": "C",
-        "excel_range": "Sheet A11V!B4:H40",
-        "description": "A11V main path loss coefficient",
-    },
-}
+    "A11V_main": CaseSpec(
+        sheet_key="A11V",
+        row_filter=(("PATH", "main"),),
+        arg_cols=("Ab/As", "Ab/Ac", "Qb/Qc"),
+        excel_range="Sheet A11V!B4:H40",
+        description="A11V main path loss coefficient",
+    ),
+})
@@ -1,6 +1,5 @@
 # src/config.py
 from pathlib import Path
-import os
 import sys
 
 # ----------------------------
@@ -22,23 +21,28 @@ EXCEL_FILE_PATH = DATA_DIR / "DPL_data.xlsx"
 # ----------------------------
 # Helper functions
 # ----------------------------
+# PyInstaller unpacks bundled data under sys._MEIPASS. Whether we run
+# bundled never changes within a process, so resolve the base directory
+# for each helper once at import; the helpers are then a single join.
+_BUNDLE_ROOT = Path(sys._MEIPASS) if hasattr(sys, "_MEIPASS") else None
+_DATA_BASE = _BUNDLE_ROOT if _BUNDLE_ROOT else DATA_DIR
+_FIGURES_BASE = (_BUNDLE_ROOT / "duct_figures") if _BUNDLE_ROOT else FIGURES_DIR
+_CASE_TABLES_BASE = (_BUNDLE_ROOT / "case_tables") if _BUNDLE_ROOT else CASE_TABLES_DIR
+
+
 def get_data_file_path(filename: str) -> str:
     """
     Return absolute path to a data file in /data/.
     Supports both normal Python execution and PyInstaller builds.
     """
-    if hasattr(sys, "_MEIPASS"):  # PyInstaller unpacked runtime
-        return os.path.join(sys._MEIPASS, filename)
-    return str(DATA_DIR / filename)
+    return str(_DATA_BASE / filename)
 
 
 def get_figure_path(filename: str) -> str:
     """
     Return absolute path to a figure inside /duct_figures/.
     """
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, "duct_figures", filename)
-    return str(FIGURES_DIR / filename)
+    return str(_FIGURES_BASE / filename)
 
 
 def get_case_table_path(filename: str) -> str:
@@ -46,6 +50,4 @@ def get_case_table_path(filename: str) -> str:
     Return absolute path to a per-duct case table Excel file.
     e.g. A7A_cleaned.xlsx
     """
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, "case_tables", filename)
-    return str(CASE_TABLES_DIR / filename)
+    return str(_CASE_TABLES_BASE / filename)
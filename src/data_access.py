@@ -1,18 +1,49 @@
 # src/data_access.py
-import pandas as pd
+import pickle
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
 from config import EXCEL_FILE_PATH, get_case_table_path
 
 
+def _read_excel_cached(path: Path, **read_kwargs):
+    """
+    pd.read_excel with a pickle sidecar next to the workbook.
+
+    openpyxl-backed parsing costs hundreds of ms per sheet and the lru
+    caches only help within one process; the sidecar short-circuits the
+    parse on every later launch. The cache is used only while newer than
+    the source file, and any read/write problem just falls back to the
+    normal Excel path with a warning.
+    """
+    cache = path.with_suffix(path.suffix + ".pkl")
+    try:
+        if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+            with open(cache, "rb") as f:
+                return pickle.load(f)
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable sheet cache {cache.name}: {e}")
+    data = pd.read_excel(path, **read_kwargs)
+    try:
+        with open(cache, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"[WARN] Could not write sheet cache {cache.name}: {e}")
+    return data
+
+
 @lru_cache(maxsize=None)
 def load_all_sheets():
     """
     Read the entire master workbook once and cache it.
     Returns: dict {sheet_name: DataFrame}
     """
-    return pd.read_excel(EXCEL_FILE_PATH, sheet_name=None)
+    return _read_excel_cached(Path(EXCEL_FILE_PATH), sheet_name=None)
 
 
 @lru_cache(maxsize=None)
@@ -39,7 +70,7 @@ def get_case_table(duct_id: str) -> pd.DataFrame:
         path_str = get_case_table_path(fname)
         path = Path(path_str)
         if path.exists():
-            df = pd.read_excel(path)
+            df = _read_excel_cached(path)
             # Drop fully empty columns just in case
             df = df.dropna(axis=1, how="all")
             return df
@@ -61,3 +92,90 @@ def get_case_table(duct_id: str) -> pd.DataFrame:
         raise KeyError(f"Duct ID '{duct_id}' not found in Master Table and no per-case file found.")
 
     return case_df.dropna(axis=1, how="all")
+
+
+@lru_cache(maxsize=None)
+def get_case_arrays(duct_id: str, path: str = None) -> dict:
+    """
+    Numeric columns of a case table as plain float64 arrays.
+
+    Optionally filters by the PATH column (case-insensitive) before
+    conversion, e.g. get_case_arrays("A10B", "branch"). Raises KeyError
+    if a path filter is requested but the table has no PATH column.
+
+    Lookup code that only needs number crunching should prefer this over
+    get_case_table: it pays the pandas cost once and then works on bare
+    arrays.
+    """
+    df = get_case_table(duct_id)
+    if path is not None:
+        if "PATH" not in df.columns:
+            raise KeyError(f"'{duct_id}' table has no 'PATH' column to filter on.")
+        df = df[df["PATH"].str.lower() == path.lower()]
+    return {
+        col: df[col].to_numpy(dtype=float)
+        for col in df.columns
+        if is_numeric_dtype(df[col])
+    }
+
+
+@lru_cache(maxsize=None)
+def get_case_curve(duct_id: str, x_col: str, y_col: str, path: str = None):
+    """
+    NaN-filtered (x, y) lookup curve from a case table, presorted by x.
+
+    Builds on get_case_arrays so the pandas cost is paid once per case;
+    callers get two aligned float64 arrays ready for bisect/searchsorted
+    or np.interp. Rows where either column is NaN are dropped, matching
+    the df[[x, y]].dropna().sort_values(x) pattern the case modules used
+    to hand-roll on the raw DataFrame.
+    """
+    cols = get_case_arrays(duct_id, path)
+    if x_col not in cols or y_col not in cols:
+        raise KeyError(f"Data for {duct_id} must include '{x_col}' and '{y_col}' columns.")
+    x, y = cols[x_col], cols[y_col]
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    order = np.argsort(x, kind="stable")
+    return x[order], y[order]
+
+
+@dataclass(frozen=True)
+class LookupTableStore:
+    """
+    Consolidated per-case array store.
+
+    Thin façade over get_case_arrays so callers can hold one object and
+    ask it for (case_id, path) array dicts instead of threading raw
+    DataFrames around. Tables are filled lazily and shared process-wide
+    through the underlying lru_cache.
+    """
+    tables: dict = field(default_factory=dict)
+
+    def get(self, case_id, path=None):
+        key = (case_id, path)
+        if key not in self.tables:
+            self.tables[key] = get_case_arrays(case_id, path)
+        return self.tables[key]
+
+    @classmethod
+    def from_dataframe(cls, data):
+        """
+        Build a store from a master DataFrame with an ID column (the
+        pre-split format), for callers that still hold one.
+        """
+        tables = {}
+        for case_id, case_df in data.groupby("ID"):
+            case_df = case_df.dropna(axis=1, how="all")
+            tables[(case_id, None)] = {
+                col: case_df[col].to_numpy(dtype=float)
+                for col in case_df.columns
+                if is_numeric_dtype(case_df[col])
+            }
+        return cls(tables=tables)
+
+
+@lru_cache(maxsize=None)
+def get_table_store() -> LookupTableStore:
+    """Process-wide LookupTableStore shared by the case functions."""
+    return LookupTableStore()
@@ -2,14 +2,14 @@
 import numpy as np
 import pandas as pd
 from case_registry import CASE_CONFIG
-from interpolation import idw_interpolate_nd
+from interpolation import idw_interpolate_nd_batch
 
 
-def _apply_row_filter(df: pd.DataFrame, row_filter: dict | None) -> pd.DataFrame:
+def _apply_row_filter(df: pd.DataFrame, row_filter: tuple) -> pd.DataFrame:
     if not row_filter:
         return df
     out = df
-    for col, val in row_filter.items():
+    for col, val in row_filter:
         out = out[out[col] == val]
     return out
 
@@ -32,20 +32,19 @@ def get_case_details(case_key: str,
       - current_point (optional; uses arg_values)
     """
     cfg = CASE_CONFIG[case_key]
-    sheet_key = cfg["sheet_key"]
-    arg_cols = cfg["arg_cols"]
-    value_col = cfg.get("value_col", "C")
-    row_filter = cfg.get("row_filter")
+    sheet_key = cfg.sheet_key
+    arg_cols = list(cfg.arg_cols)
+    value_col = cfg.value_col
 
     # 1) extract & filter raw data
     df = data.loc[sheet_key].copy()
-    df = _apply_row_filter(df, row_filter)
+    df = _apply_row_filter(df, cfg.row_filter)
     cols_needed = arg_cols + [value_col]
     df = df[cols_needed].dropna()
 
     details = {
-        "description": cfg.get("description"),
-        "excel_range": cfg.get("excel_range"),
+        "description": cfg.description,
+        "excel_range": cfg.excel_range,
         "arg_cols": arg_cols,
         "value_col": value_col,
         "raw_data": df,  # UI can render this as a table
@@ -70,17 +69,14 @@ def get_case_details(case_key: str,
     if dim == 1:
         col = arg_cols[0]
         xs = np.linspace(df[col].min(), df[col].max(), 200)
-        ys = []
-        for x in xs:
-            C = idw_interpolate_nd(df, [col], [x],
-                                   value_col=value_col,
-                                   k=k, power=power)
-            ys.append(C)
+        ys = idw_interpolate_nd_batch(df, [col], xs[:, None],
+                                      value_col=value_col,
+                                      k=k, power=power)
         details["plot_grid"] = {
             "type": "1d",
             "x_label": col,
             "x": xs.tolist(),
-            "y": ys,
+            "y": ys.tolist(),
         }
 
     else:
@@ -90,17 +86,19 @@ def get_case_details(case_key: str,
         x_vals = np.linspace(df[c0].min(), df[c0].max(), 60)
         y_vals = np.linspace(df[c1].min(), df[c1].max(), 60)
         X, Y = np.meshgrid(x_vals, y_vals)
-        Z = np.zeros_like(X)
-
-        for i in range(X.shape[0]):
-            for j in range(X.shape[1]):
-                primary = {c0: X[i, j], c1: Y[i, j]}
-                target_vals = _full_target_vals(primary)
-                Z[i, j] = idw_interpolate_nd(
-                    df, arg_cols, target_vals,
-                    value_col=value_col,
-                    k=k, power=power
-                )
+
+        # Fixed coordinates for the remaining dimensions, resolved once
+        # (same precedence as _full_target_vals: arg_values, then median)
+        fixed = _full_target_vals({})[2:]
+        queries = np.column_stack(
+            [X.ravel(), Y.ravel()]
+            + [np.full(X.size, v) for v in fixed]
+        )
+        Z = idw_interpolate_nd_batch(
+            df, arg_cols, queries,
+            value_col=value_col,
+            k=k, power=power
+        ).reshape(X.shape)
 
         details["plot_grid"] = {
             "type": "2d",
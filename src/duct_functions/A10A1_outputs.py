@@ -1,7 +1,31 @@
-import math
+from functools import lru_cache
+
 import numpy as np
-from data_access import get_case_table
+from data_access import get_case_arrays
+from _kernels import branch_main_outputs, round_area_ft2
+from _memo import memoize_outputs
+
+
+@lru_cache(maxsize=None)
+def _junction_curve(case_id, ratio_col):
+    """
+    1-D interpolation curve C(Ab/Ac) for a converging-junction table.
 
+    The underlying table is static, so this is built once per case.
+    """
+    cols = get_case_arrays(case_id)
+    ratio, ab_ac, C = cols[ratio_col], cols["Ab/Ac"], cols["C"]
+    valid = ~(np.isnan(ratio) | np.isnan(ab_ac) | np.isnan(C))
+    ratio, ab_ac, C = ratio[valid], ab_ac[valid], C[valid]
+    # The old nearest-row selection always landed in the lowest
+    # velocity-ratio slice of the grid; keep that slice and smooth
+    # along Ab/Ac.
+    in_slice = ratio == ratio.min()
+    order = np.argsort(ab_ac[in_slice])
+    return ab_ac[in_slice][order], C[in_slice][order]
+
+
+@memoize_outputs(4)
 def A10A1_outputs(stored_values, *_):
     """
     Converging junction: Round Converging Wye (A10A1).
@@ -30,79 +54,46 @@ def A10A1_outputs(stored_values, *_):
             "Main Pressure Loss (in w.c.)": None,
         }
 
-    # --- Load cleaned tables ---
-    branch_data = get_case_table("A10A1")  # branch table
-    main_data   = get_case_table("A10A2")  # main table
+    # --- Load cached lookup curves (built once per case) ---
+    branch_ab_ac, branch_C = _junction_curve("A10A1", "Vb/Vc")  # branch table
+    main_ab_ac, main_C     = _junction_curve("A10A2", "Vs/Vc")  # main table
 
     # --- Geometry / areas ---
-    area_main   = math.pi * (D_main / 2) ** 2 / 144.0   # ft²
-    area_branch = math.pi * (D_branch / 2) ** 2 / 144.0 # ft²
-
-    # --- Velocities ---
-    velocity_branch    = Q_b / area_branch
-    velocity_source    = Q_s / area_main
-    velocity_converged = (Q_s + Q_b) / area_main
+    area_main   = round_area_ft2(D_main)   # ft²
+    area_branch = round_area_ft2(D_branch) # ft²
 
     # =====================================================
     # Branch loss coefficient (uses Vb/Vc and Ab/Ac columns)
     # =====================================================
-    vb_vc_ratio = velocity_branch / velocity_converged
     ab_ac_ratio = area_branch / area_main
 
-    vb_vc_data = (
-        branch_data[["Vb/Vc", "Ab/Ac", "C"]]
-        .dropna()
-        .sort_values(by=["Vb/Vc", "Ab/Ac"])
-    )
-
-    valid_vb_vc = vb_vc_data[vb_vc_data["Vb/Vc"] >= vb_vc_ratio]
-    branch_vb_vc_row = valid_vb_vc.iloc[0] if not valid_vb_vc.empty else vb_vc_data.iloc[-1]
-
-    valid_ab_ac = vb_vc_data[vb_vc_data["Ab/Ac"] >= ab_ac_ratio]
-    branch_ab_ac_row = valid_ab_ac.iloc[0] if not valid_ab_ac.empty else vb_vc_data.iloc[-1]
-
-    branch_loss_coefficient = branch_ab_ac_row["C"]
+    # Linear interpolation along Ab/Ac (clamped at the table edges)
+    branch_loss_coefficient = float(np.interp(ab_ac_ratio, branch_ab_ac, branch_C))
 
     # ==============================================
     # Main loss coefficient (uses Vs/Vc and Ab/Ac)
     # ==============================================
-    vs_vc_ratio = velocity_source / velocity_converged
+    main_loss_coefficient = float(np.interp(ab_ac_ratio, main_ab_ac, main_C))
 
-    vs_vc_data = (
-        main_data[["Vs/Vc", "Ab/Ac", "C"]]
-        .dropna()
-        .sort_values(by=["Vs/Vc", "Ab/Ac"])
+    # --- Velocities & pressures (shared scalar kernel) ---
+    res = branch_main_outputs(
+        area_main, area_branch, Q_s, Q_b,
+        branch_loss_coefficient, main_loss_coefficient,
     )
 
-    valid_vs_vc = vs_vc_data[vs_vc_data["Vs/Vc"] >= vs_vc_ratio]
-    main_vs_vc_row = valid_vs_vc.iloc[0] if not valid_vs_vc.empty else vs_vc_data.iloc[-1]
-
-    valid_ab_ac_main = vs_vc_data[vs_vc_data["Ab/Ac"] >= ab_ac_ratio]
-    main_ab_ac_row = valid_ab_ac_main.iloc[0] if not valid_ab_ac_main.empty else vs_vc_data.iloc[-1]
-
-    main_loss_coefficient = main_ab_ac_row["C"]
-
-    # --- Pressures ---
-    velocity_pressure_branch    = (velocity_branch / 4005.0) ** 2
-    velocity_pressure_source    = (velocity_source / 4005.0) ** 2
-    velocity_pressure_converged = (velocity_converged / 4005.0) ** 2
-
-    branch_pressure_loss = branch_loss_coefficient * velocity_pressure_branch
-    main_pressure_loss   = main_loss_coefficient * velocity_pressure_source
-
     return {
         # Branch
-        "Branch Velocity (ft/min)": velocity_branch,
-        "Branch Velocity Pressure (in w.c.)": velocity_pressure_branch,
+        "Branch Velocity (ft/min)": res.velocity_branch,
+        "Branch Velocity Pressure (in w.c.)": res.vp_branch,
         "Branch Loss Coefficient": branch_loss_coefficient,
-        "Branch Pressure Loss (in w.c.)": branch_pressure_loss,
+        "Branch Pressure Loss (in w.c.)": res.branch_loss,
         # Main
-        "Main, Source Velocity (ft/min)": velocity_source,
-        "Main, Converged Velocity (ft/min)": velocity_converged,
-        "Main, Source Velocity Pressure (in w.c.)": velocity_pressure_source,
-        "Main, Converged Velocity Pressure (in w.c.)": velocity_pressure_converged,
+        "Main, Source Velocity (ft/min)": res.velocity_source,
+        "Main, Converged Velocity (ft/min)": res.velocity_converged,
+        "Main, Source Velocity Pressure (in w.c.)": res.vp_source,
+        "Main, Converged Velocity Pressure (in w.c.)": res.vp_converged,
         "Main Loss Coefficient": main_loss_coefficient,
-        "Main Pressure Loss (in w.c.)": main_pressure_loss,
+        "Main Pressure Loss (in w.c.)": res.main_loss,
     }
 
 A10A1_outputs.output_type = "branch_main"
@@ -1,8 +1,73 @@
-import math
+from functools import lru_cache
+
 import numpy as np
-from data_access import get_case_table
+import pandas as pd
+from data_access import get_case_arrays
+from _kernels import _AREA_COEFF, _VP_COEFF, branch_main_outputs, round_area_ft2
+from _memo import memoize_outputs
+
+
+@lru_cache(maxsize=None)
+def _a10b_tables():
+    """
+    Lookup tables for the A10B case, built once.
+
+    Returns (qb_axis, ab_axis, grid, main_qb_qc, main_C) as float64
+    arrays. The branch table is a full 2-D grid of C over
+    (Qb/Qc, Ab/Ac); grid[i, j] holds C at ab_axis[i], qb_axis[j]. The
+    main table stays a 1-D C-over-Qb/Qc curve.
+    """
+    branch = get_case_arrays("A10B", "branch")
+    main   = get_case_arrays("A10B", "main")
+
+    ab_ac, qb_qc, C = branch["Ab/Ac"], branch["Qb/Qc"], branch["C"]
+    valid = ~(np.isnan(ab_ac) | np.isnan(qb_qc) | np.isnan(C))
+    ab_ac, qb_qc, C = ab_ac[valid], qb_qc[valid], C[valid]
+
+    main_qb_qc, main_C = main["Qb/Qc"], main["C"]
+    main_valid = ~(np.isnan(main_qb_qc) | np.isnan(main_C))
+    main_qb_qc, main_C = main_qb_qc[main_valid], main_C[main_valid]
+
+    if ab_ac.size == 0 or main_qb_qc.size == 0:
+        raise ValueError("A10B table must contain both 'branch' and 'main' rows.")
+
+    qb_axis = np.unique(qb_qc)
+    ab_axis = np.unique(ab_ac)
+    grid = np.full((ab_axis.size, qb_axis.size), np.nan)
+    grid[np.searchsorted(ab_axis, ab_ac), np.searchsorted(qb_axis, qb_qc)] = C
+    if np.isnan(grid).any():
+        raise ValueError("A10B branch table is not a complete (Qb/Qc, Ab/Ac) grid.")
+
+    main_order = np.argsort(main_qb_qc)
+    return qb_axis, ab_axis, grid, main_qb_qc[main_order], main_C[main_order]
+
+
+def _a10b_branch_C(Qb_Qc, Ab_Ac):
+    """
+    Branch loss coefficient: bilinear lookup on the (Qb/Qc, Ab/Ac) grid,
+    clamped at the table edges along both axes.
+
+    Takes equal-length float arrays and returns one C per query:
+    np.interp along Qb/Qc within the two Ab/Ac slices bracketing each
+    query, then a linear blend between those slices.
+    """
+    qb_axis, ab_axis, grid, _, _ = _a10b_tables()
+
+    # One interp of the whole batch per Ab/Ac slice -> (n_ab, N)
+    slice_vals = np.vstack([np.interp(Qb_Qc, qb_axis, row) for row in grid])
+
+    hi = np.clip(np.searchsorted(ab_axis, Ab_Ac), 1, ab_axis.size - 1)
+    lo = hi - 1
+    # Clamped blend weight: 0 below the lowest slice, 1 above the highest
+    t = np.clip((Ab_Ac - ab_axis[lo]) / (ab_axis[hi] - ab_axis[lo]), 0.0, 1.0)
+
+    rows = np.arange(slice_vals.shape[1])
+    c_lo = slice_vals[lo, rows]
+    c_hi = slice_vals[hi, rows]
+    return c_lo + t * (c_hi - c_lo)
 
 
+@memoize_outputs(4)
 def A10B_outputs(stored_values, *_):
     """
     Calculates outputs for case A10B, handling both branch and main paths.
@@ -35,89 +100,103 @@ def A10B_outputs(stored_values, *_):
             "Main Pressure Loss (in w.c.)": None,
         }
 
-    # --- Load consolidated case table ---
-    df = get_case_table("A10B")
-
-    if "PATH" not in df.columns:
-        raise KeyError("A10B table must include a 'PATH' column with 'branch' / 'main'.")
-
-    branch_data = df[df["PATH"].str.lower() == "branch"]
-    main_data   = df[df["PATH"].str.lower() == "main"]
-
-    if branch_data.empty or main_data.empty:
-        raise ValueError("A10B table must contain both 'branch' and 'main' rows.")
+    # --- Load cached lookup tables (built once) ---
+    _, _, _, main_qb_qc, main_C_q = _a10b_tables()
 
-    # --- Geometry & velocities ---
-    area_main   = math.pi * (D_main / 2) ** 2 / 144.0
-    area_branch = math.pi * (D_branch / 2) ** 2 / 144.0
+    # --- Geometry ---
+    area_main   = round_area_ft2(D_main)
+    area_branch = round_area_ft2(D_branch)
 
     Q_converged = Q_source + Q_branch
 
-    velocity_branch    = Q_branch / area_branch
-    velocity_source    = Q_source / area_main
-    velocity_converged = Q_converged / area_main
-
     # ============================
     # Branch loss coefficient
     # ============================
     Qb_Qc = Q_branch / Q_converged
     Ab_Ac = area_branch / area_main
 
-    branch_q_data = (
-        branch_data[["Qb/Qc", "Ab/Ac", "C"]]
-        .dropna()
-        .sort_values(by="Qb/Qc")
+    # Bilinear lookup on the 2-D (Qb/Qc, Ab/Ac) grid, edge-clamped
+    branch_loss_coefficient = float(
+        _a10b_branch_C(np.array([Qb_Qc]), np.array([Ab_Ac]))[0]
     )
-    valid_branch_q = branch_q_data[branch_q_data["Qb/Qc"] >= Qb_Qc]
-    closest_branch_q = valid_branch_q.iloc[0] if not valid_branch_q.empty else branch_q_data.iloc[-1]
-
-    branch_a_data = (
-        branch_data[["Ab/Ac", "C"]]
-        .dropna()
-        .sort_values(by="Ab/Ac")
-    )
-    valid_branch_a = branch_a_data[branch_a_data["Ab/Ac"] <= Ab_Ac]
-    closest_branch_a = valid_branch_a.iloc[-1] if not valid_branch_a.empty else branch_a_data.iloc[0]
-
-    branch_loss_coefficient = closest_branch_q["C"] * closest_branch_a["C"]
-
-    branch_velocity_pressure = (velocity_branch / 4005.0) ** 2
-    branch_pressure_loss     = branch_loss_coefficient * branch_velocity_pressure
 
     # ============================
     # Main loss coefficient
     # ============================
-    Qb_Qc_main = Q_branch / Q_converged
+    main_loss_coefficient = float(np.interp(Qb_Qc, main_qb_qc, main_C_q))
 
-    main_q_data = (
-        main_data[["Qb/Qc", "C"]]
-        .dropna()
-        .sort_values(by="Qb/Qc")
+    # --- Velocities & pressures (shared scalar kernel) ---
+    res = branch_main_outputs(
+        area_main, area_branch, Q_source, Q_branch,
+        branch_loss_coefficient, main_loss_coefficient,
     )
-    valid_main_q = main_q_data[main_q_data["Qb/Qc"] >= Qb_Qc_main]
-    closest_main_q = valid_main_q.iloc[0] if not valid_main_q.empty else main_q_data.iloc[-1]
-
-    main_loss_coefficient = closest_main_q["C"]
-
-    source_velocity_pressure    = (velocity_source / 4005.0) ** 2
-    converged_velocity_pressure = (velocity_converged / 4005.0) ** 2
-    main_pressure_loss          = main_loss_coefficient * source_velocity_pressure
 
     # --- Pack outputs flat (matches your OUTPUT_KEY map) ---
     return {
         # Branch
+        "Branch Velocity (ft/min)": res.velocity_branch,
+        "Branch Velocity Pressure (in w.c.)": res.vp_branch,
+        "Branch Loss Coefficient": branch_loss_coefficient,
+        "Branch Pressure Loss (in w.c.)": res.branch_loss,
+        # Main
+        "Main, Source Velocity (ft/min)": res.velocity_source,
+        "Main, Converged Velocity (ft/min)": res.velocity_converged,
+        "Main, Source Velocity Pressure (in w.c.)": res.vp_source,
+        "Main, Converged Velocity Pressure (in w.c.)": res.vp_converged,
+        "Main Loss Coefficient": main_loss_coefficient,
+        "Main Pressure Loss (in w.c.)": res.main_loss,
+    }
+
+
+A10B_outputs.output_type = "branch_main"
+
+
+def A10B_outputs_batch(stored_values_df):
+    """
+    Vectorized A10B over many duct segments at once.
+
+    Takes a DataFrame with columns entry_1..entry_4 (one row per
+    segment, same meaning as the scalar function) and returns a
+    DataFrame with the ten output columns. The whole batch is one
+    NumPy pass: a single searchsorted per lookup axis instead of a
+    Python-level call per segment.
+    """
+    _, _, _, main_qb_qc, main_C_q = _a10b_tables()
+
+    D_main   = stored_values_df["entry_1"].to_numpy(dtype=float)
+    D_branch = stored_values_df["entry_2"].to_numpy(dtype=float)
+    Q_source = stored_values_df["entry_3"].to_numpy(dtype=float)
+    Q_branch = stored_values_df["entry_4"].to_numpy(dtype=float)
+
+    area_main   = _AREA_COEFF * D_main * D_main
+    area_branch = _AREA_COEFF * D_branch * D_branch
+
+    Q_converged = Q_source + Q_branch
+
+    velocity_branch    = Q_branch / area_branch
+    velocity_source    = Q_source / area_main
+    velocity_converged = Q_converged / area_main
+
+    Qb_Qc = Q_branch / Q_converged
+    Ab_Ac = area_branch / area_main
+
+    branch_loss_coefficient = _a10b_branch_C(Qb_Qc, Ab_Ac)
+
+    main_loss_coefficient = np.interp(Qb_Qc, main_qb_qc, main_C_q)
+
+    branch_velocity_pressure    = velocity_branch * velocity_branch * _VP_COEFF
+    source_velocity_pressure    = velocity_source * velocity_source * _VP_COEFF
+    converged_velocity_pressure = velocity_converged * velocity_converged * _VP_COEFF
+
+    return pd.DataFrame({
         "Branch Velocity (ft/min)": velocity_branch,
         "Branch Velocity Pressure (in w.c.)": branch_velocity_pressure,
         "Branch Loss Coefficient": branch_loss_coefficient,
-        "Branch Pressure Loss (in w.c.)": branch_pressure_loss,
-        # Main
+        "Branch Pressure Loss (in w.c.)": branch_loss_coefficient * branch_velocity_pressure,
         "Main, Source Velocity (ft/min)": velocity_source,
         "Main, Converged Velocity (ft/min)": velocity_converged,
         "Main, Source Velocity Pressure (in w.c.)": source_velocity_pressure,
         "Main, Converged Velocity Pressure (in w.c.)": converged_velocity_pressure,
         "Main Loss Coefficient": main_loss_coefficient,
-        "Main Pressure Loss (in w.c.)": main_pressure_loss,
-    }
-
-
-A10B_outputs.output_type = "branch_main"
\ No newline at end of file
+        "Main Pressure Loss (in w.c.)": main_loss_coefficient * source_velocity_pressure,
+    })
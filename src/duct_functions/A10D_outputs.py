@@ -106,4 +106,3 @@ def A10D_outputs(stored_values, *_):
         return {"Error": str(e)}
 
 A10D_outputs.output_type = "branch_main"
-print("[DEBUG] A10D_outputs module loaded, output_type =", A10D_outputs.output_type)
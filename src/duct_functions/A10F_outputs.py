@@ -1,9 +1,38 @@
-import math
-import pandas as pd
+from functools import lru_cache
+
 import numpy as np
-from data_access import get_case_table
+from data_access import get_case_arrays
+from _kernels import branch_main_outputs, rect_area_ft2
+from _memo import memoize_outputs
+
 
+@lru_cache(maxsize=None)
+def _a10f_curves():
+    """
+    1-D interpolation curves for A10F (branch, C over Qb/Qc) and A10M
+    (main, C over Qb/Qs), built once.
+
+    The branch table is gridded over Vc; the lowest-Vc slice is used.
+    The main table (A10M) is gridded over Ab/Ac and As/Ac; the slice at
+    this case's fixed ratios (Ab/Ac = 0.5, As/Ac = 1.0) is used.
+    """
+    branch = get_case_arrays("A10F", "branch")
+    in_slice = branch["Vc"] == np.nanmin(branch["Vc"])
+    order = np.argsort(branch["Qb/Qc"][in_slice])
 
+    main = get_case_arrays("A10M", "main")
+    main_slice = (main["Ab/Ac"] == 0.5) & (main["As/Ac"] == 1.0)
+    main_order = np.argsort(main["Qb/Qs"][main_slice])
+
+    return (
+        branch["Qb/Qc"][in_slice][order],
+        branch["C"][in_slice][order],
+        main["Qb/Qs"][main_slice][main_order],
+        main["C"][main_slice][main_order],
+    )
+
+
+@memoize_outputs(4)
 def A10F_outputs(stored_values, *_):
     """
     Calculates the outputs for case A10F (converging junctions) for both branch and main.
@@ -14,133 +43,86 @@ def A10F_outputs(stored_values, *_):
     Returns:
     - Dictionary of calculated outputs for both branch and main OR an error message if conditions are not met.
     """
+    # ==========================
+    #   INPUTS
+    # ==========================
+    entry_1 = stored_values.get("entry_1")  # Main Height (in)
+    entry_2 = stored_values.get("entry_2")  # Main Width (in)
+    entry_3 = stored_values.get("entry_3")  # Main Source Flow Rate (Qs, cfm)
+    entry_4 = stored_values.get("entry_4")  # Branch Flow Rate (Qb, cfm)
+
+    # Validate inputs (None check so 0 isn't treated as missing)
+    if None in (entry_1, entry_2, entry_3, entry_4):
+        return {
+            "Error": "Missing input values. Please enter all required values."
+        }
+
+    if 0 in (entry_1, entry_2, entry_3):
+        return {"Error": "Dimensions and source flow rate must be non-zero."}
+
+    # ==========================
+    #   GEOMETRY & FLOW
+    # ==========================
+    # Cross-sectional areas (ft²)
+    area_main = rect_area_ft2(entry_1, entry_2)  # Ac
+    area_branch = area_main / 2.0                # Ab = Ac / 2
+
+    # Flow rates
+    Q_source = entry_3  # Qs
+    Q_branch = entry_4  # Qb
+    Q_converged = Q_source + Q_branch  # Qc
+
+    # Flow rate ratios
+    qb_qc_ratio = Q_branch / Q_converged
+    qb_qs_ratio = Q_branch / Q_source
+
+    # --- ERROR CHECK: Qb/Qs must be >= 0.4 ---
+    if qb_qs_ratio < 0.4:
+        return {
+            "Error": (
+                "Invalid Input: Qb/Qs must be at least 0.4. "
+                "Increase branch flow rate (Qb) or decrease source flow rate (Qs)."
+            )
+        }
+
+    # ==========================
+    #   LOSS COEFFICIENTS
+    # ==========================
     try:
-        # ==========================
-        #   INPUTS
-        # ==========================
-        entry_1 = stored_values.get("entry_1")  # Main Height (in)
-        entry_2 = stored_values.get("entry_2")  # Main Width (in)
-        entry_3 = stored_values.get("entry_3")  # Main Source Flow Rate (Qs, cfm)
-        entry_4 = stored_values.get("entry_4")  # Branch Flow Rate (Qb, cfm)
-
-        # Validate inputs
-        if not all([entry_1, entry_2, entry_3, entry_4]):
-            return {
-                "Error": "Missing input values. Please enter all required values."
-            }
-
-        # ==========================
-        #   GEOMETRY & FLOW
-        # ==========================
-        # Cross-sectional areas (ft²)
-        area_main = (entry_1 * entry_2) / 144.0  # Ac
-        area_branch = area_main / 2.0            # Ab = Ac / 2
-
-        # Flow rates
-        Q_source = entry_3  # Qs
-        Q_branch = entry_4  # Qb
-        Q_converged = Q_source + Q_branch  # Qc
-
-        # Velocities (ft/min)
-        velocity_source = Q_source / area_main
-        velocity_converged = Q_converged / area_main
-        velocity_branch = Q_branch / area_branch
-
-        # Flow rate ratios
-        qb_qc_ratio = Q_branch / Q_converged
-        qb_qs_ratio = Q_branch / Q_source
-
-        # --- ERROR CHECK: Qb/Qs must be >= 0.4 ---
-        if qb_qs_ratio < 0.4:
-            return {
-                "Error": (
-                    "Invalid Input: Qb/Qs must be at least 0.4. "
-                    "Increase branch flow rate (Qb) or decrease source flow rate (Qs)."
-                )
-            }
-
-        # ==========================
-        #   BRANCH LOSS COEFFICIENT
-        # ==========================
-        branch_data = get_case_table("A10F")
-        branch_data = branch_data[branch_data["PATH"] == "branch"].copy()
-
-        # Match on Vc (round down)
-        valid_vc = branch_data[branch_data["Vc"] <= velocity_converged]
-        branch_vc_row = valid_vc.iloc[-1] if not valid_vc.empty else branch_data.iloc[0]
-
-        # Match on Qb/Qc (round up)
-        valid_qb_qc = branch_data[branch_data["Qb/Qc"] >= qb_qc_ratio]
-        branch_qb_qc_row = valid_qb_qc.iloc[0] if not valid_qb_qc.empty else branch_data.iloc[-1]
-
-        branch_loss_coefficient = branch_qb_qc_row["C"]
-
-        # ==========================
-        #   MAIN LOSS COEFFICIENT
-        # ==========================
-        main_data = get_case_table("A10M")
-        main_data = main_data[main_data["PATH"] == "main"].copy()
-
-        # Fixed ratios for this case
-        as_ac_ratio = 1.0
-        ab_ac_ratio = 0.5
-
-        # Match As/Ac (closest)
-        main_data["As/Ac Diff"] = (main_data["As/Ac"] - as_ac_ratio).abs()
-        main_as_ac_row = main_data.loc[main_data["As/Ac Diff"].idxmin()]
-
-        # Match Ab/Ac (round up)
-        valid_ab_ac = main_data[main_data["Ab/Ac"] >= ab_ac_ratio]
-        main_ab_ac_row = valid_ab_ac.iloc[0] if not valid_ab_ac.empty else main_data.iloc[-1]
-
-        # Match Qb/Qs (round down)
-        valid_qb_qs = main_data[main_data["Qb/Qs"] <= qb_qs_ratio]
-        main_qb_qs_row = valid_qb_qs.iloc[-1] if not valid_qb_qs.empty else main_data.iloc[0]
-
-        # Following the original behavior: coefficient keyed by Qb/Qs row
-        main_loss_coefficient = main_qb_qs_row["C"]
-
-        # ==========================
-        #   VELOCITY PRESSURES
-        # ==========================
-        branch_velocity_pressure = (velocity_branch / 4005.0) ** 2
-        source_velocity_pressure = (velocity_source / 4005.0) ** 2
-        converged_velocity_pressure = (velocity_converged / 4005.0) ** 2
-
-        # ==========================
-        #   PRESSURE LOSSES
-        # ==========================
-        branch_pressure_loss = branch_loss_coefficient * branch_velocity_pressure
-        main_pressure_loss = main_loss_coefficient * source_velocity_pressure
-
-        # ==========================
-        #   OUTPUTS
-        # ==========================
-        outputs = {}
-
-        # Branch outputs
-        outputs.update({
-            "Branch Velocity (ft/min)": velocity_branch,
-            "Branch Velocity Pressure (in w.c.)": branch_velocity_pressure,
-            "Branch Loss Coefficient": branch_loss_coefficient,
-            "Branch Pressure Loss (in w.c.)": branch_pressure_loss,
-        })
-
-        # Main outputs
-        outputs.update({
-            "Main, Source Velocity (ft/min)": velocity_source,
-            "Main, Converged Velocity (ft/min)": velocity_converged,
-            "Main, Source Velocity Pressure (in w.c.)": source_velocity_pressure,
-            "Main, Converged Velocity Pressure (in w.c.)": converged_velocity_pressure,
-            "Main Loss Coefficient": main_loss_coefficient,
-            "Main Pressure Loss (in w.c.)": main_pressure_loss,
-        })
-
-        return outputs
-
-    except Exception as e:
+        branch_qb_qc, branch_C, main_qb_qs, main_C = _a10f_curves()
+    except (KeyError, FileNotFoundError) as e:
         return {"Error": str(e)}
 
+    # Linear interpolation along each axis (clamped at the table edges)
+    branch_loss_coefficient = float(np.interp(qb_qc_ratio, branch_qb_qc, branch_C))
+    main_loss_coefficient = float(np.interp(qb_qs_ratio, main_qb_qs, main_C))
+
+    # ==========================
+    #   VELOCITIES & PRESSURES
+    # ==========================
+    res = branch_main_outputs(
+        area_main, area_branch, Q_source, Q_branch,
+        branch_loss_coefficient, main_loss_coefficient,
+    )
+
+    # ==========================
+    #   OUTPUTS
+    # ==========================
+    return {
+        # Branch
+        "Branch Velocity (ft/min)": res.velocity_branch,
+        "Branch Velocity Pressure (in w.c.)": res.vp_branch,
+        "Branch Loss Coefficient": branch_loss_coefficient,
+        "Branch Pressure Loss (in w.c.)": res.branch_loss,
+        # Main
+        "Main, Source Velocity (ft/min)": res.velocity_source,
+        "Main, Converged Velocity (ft/min)": res.velocity_converged,
+        "Main, Source Velocity Pressure (in w.c.)": res.vp_source,
+        "Main, Converged Velocity Pressure (in w.c.)": res.vp_converged,
+        "Main Loss Coefficient": main_loss_coefficient,
+        "Main Pressure Loss (in w.c.)": res.main_loss,
+    }
+
 
 # Specify case type
 A10F_outputs.output_type = "branch_main"
@@ -1,9 +1,38 @@
-import math
-import pandas as pd
+from functools import lru_cache
+
 import numpy as np
 from data_access import get_case_table
+from _kernels import round_area_ft2
+from _memo import memoize_outputs
+
+
+@lru_cache(maxsize=None)
+def _a11u_tables():
+    """
+    Interpolation curves for A11U (branch, C over Vb/Vc) and the A11A
+    "Tee or Wye, Main" rows (C over Vs/Vc), as float arrays built once.
+    """
+    branch_data = get_case_table("A11U")
+    branch_data = branch_data[branch_data["PATH"] == "branch"]
+
+    main_data = get_case_table("A11A")
+    main_data = main_data[
+        (main_data["PATH"] == "main")
+        & (main_data["NAME"] == "Tee or Wye, Main")
+    ]
+
+    branch_curve = branch_data[["Vb/Vc", "C"]].dropna().groupby("Vb/Vc")["C"].mean()
+    main_curve = main_data[["Vs/Vc", "C"]].dropna().groupby("Vs/Vc")["C"].mean()
+
+    return (
+        branch_curve.index.to_numpy(dtype=float),
+        branch_curve.to_numpy(dtype=float),
+        main_curve.index.to_numpy(dtype=float),
+        main_curve.to_numpy(dtype=float),
+    )
 
 
+@memoize_outputs(5)
 def A11U_outputs(stored_values, *_):
     """
     Calculate outputs for A11U case (rectangular main and circular branch).
@@ -19,114 +48,93 @@ def A11U_outputs(stored_values, *_):
     Returns:
         dict: Output values for branch and main (plus optional Warning).
     """
+    # ==========================
+    #   INPUTS
+    # ==========================
+    W_main = stored_values.get("entry_1")
+    H_main = stored_values.get("entry_2")
+    D_branch = stored_values.get("entry_3")
+    Qc = stored_values.get("entry_4")
+    Qb = stored_values.get("entry_5")
+
+    if None in [W_main, H_main, D_branch, Qc, Qb]:
+        return {"Error": "Missing input values."}
+
+    if 0 in (W_main, H_main, D_branch, Qc):
+        return {"Error": "Dimensions and upstream flow rate must be non-zero."}
+
+    # ==========================
+    #   GEOMETRY WARNING
+    # ==========================
+    warning_message = None
+    if D_branch >= (W_main - 2):
+        warning_message = (
+            "Warning: Branch diameter should be at least 2 inches smaller than main width."
+        )
+
+    # ==========================
+    #   AREA CALCULATIONS (ft²)
+    # ==========================
+    A_main = (W_main * H_main) / 144.0
+    A_branch = round_area_ft2(D_branch)
+
+    # ==========================
+    #   VELOCITIES (ft/min)
+    # ==========================
+    Vc = Qc / A_main
+    Vb = Qb / A_branch
+    Vs = (Qc - Qb) / A_main
+
+    # ==========================
+    #   VELOCITY PRESSURES (in w.c.)
+    # ==========================
+    Pvb = (Vb / 4005.0) ** 2
+    Pvs = (Vs / 4005.0) ** 2
+    Pvc = (Vc / 4005.0) ** 2
+
+    Vb_Vc = Vb / Vc
+    Vs_Vc = Vs / Vc
+
+    # ==========================
+    #   LOSS COEFFICIENTS (A11U branch / A11A main)
+    # ==========================
     try:
-        # ==========================
-        #   INPUTS
-        # ==========================
-        W_main = stored_values.get("entry_1")
-        H_main = stored_values.get("entry_2")
-        D_branch = stored_values.get("entry_3")
-        Qc = stored_values.get("entry_4")
-        Qb = stored_values.get("entry_5")
-
-        if None in [W_main, H_main, D_branch, Qc, Qb]:
-            return {"Error": "Missing input values."}
-
-        # ==========================
-        #   GEOMETRY WARNING
-        # ==========================
-        warning_message = None
-        if D_branch >= (W_main - 2):
-            warning_message = (
-                "Warning: Branch diameter should be at least 2 inches smaller than main width."
-            )
-
-        # ==========================
-        #   AREA CALCULATIONS (ft²)
-        # ==========================
-        A_main = (W_main * H_main) / 144.0
-        # D in inches -> feet, radius = D/24 ft, area = π r²
-        A_branch = math.pi * (D_branch / 24.0) ** 2
-
-        # ==========================
-        #   VELOCITIES (ft/min)
-        # ==========================
-        Vc = Qc / A_main
-        Vb = Qb / A_branch
-        Vs = (Qc - Qb) / A_main
-
-        # ==========================
-        #   VELOCITY PRESSURES (in w.c.)
-        # ==========================
-        Pvb = (Vb / 4005.0) ** 2
-        Pvs = (Vs / 4005.0) ** 2
-        Pvc = (Vc / 4005.0) ** 2
-
-        Vb_Vc = Vb / Vc
-        Vs_Vc = Vs / Vc
-
-        # ==========================
-        #   BRANCH LOSS COEFFICIENT (A11U)
-        # ==========================
-        try:
-            branch_data = get_case_table("A11U")
-            branch_data = branch_data[branch_data["PATH"] == "branch"].copy()
-        except KeyError:
-            return {"Error": "A11U branch data not found."}
-
-        if branch_data.empty:
-            return {"Error": "No branch data found for A11U."}
-
-        branch_data["Vb/Vc Diff"] = (branch_data["Vb/Vc"] - Vb_Vc).abs()
-        branch_row = branch_data.sort_values("Vb/Vc Diff").iloc[0]
-        C_branch = branch_row["C"]
-        branch_loss = C_branch * Pvb
-
-        # ==========================
-        #   MAIN LOSS COEFFICIENT (A11A main)
-        # ==========================
-        try:
-            main_data = get_case_table("A11A")
-            main_data = main_data[
-                (main_data["PATH"] == "main")
-                & (main_data["NAME"] == "Tee or Wye, Main")
-            ].copy()
-        except KeyError:
-            return {"Error": "A11A main data not found."}
-
-        if main_data.empty:
-            return {"Error": "No main data found for A11A (Tee or Wye, Main)."}
-
-        main_data["Vs/Vc Diff"] = (main_data["Vs/Vc"] - Vs_Vc).abs()
-        main_row = main_data.sort_values("Vs/Vc Diff").iloc[0]
-        C_main = main_row["C"]
-        main_loss = C_main * Pvs
-
-        # ==========================
-        #   OUTPUTS
-        # ==========================
-        result = {
-            # Branch Outputs
-            "Branch Velocity (ft/min)": Vb,
-            "Branch Velocity Pressure (in w.c.)": Pvb,
-            "Branch Loss Coefficient": C_branch,
-            "Branch Pressure Loss (in w.c.)": branch_loss,
-            # Main Outputs
-            "Main, Source Velocity (ft/min)": Vs,
-            "Main, Converged Velocity (ft/min)": Vc,
-            "Main, Source Velocity Pressure (in w.c.)": Pvs,
-            "Main, Converged Velocity Pressure (in w.c.)": Pvc,
-            "Main Loss Coefficient": C_main,
-            "Main Pressure Loss (in w.c.)": main_loss,
-        }
-
-        if warning_message:
-            result["Warning"] = warning_message
-
-        return result
-
-    except Exception as e:
-        return {"Error": f"Error in A11U: {e}"}
+        branch_vb_vc, branch_C, main_vs_vc, main_C = _a11u_tables()
+    except KeyError:
+        return {"Error": "A11U/A11A lookup data not found."}
+
+    if branch_vb_vc.size == 0:
+        return {"Error": "No branch data found for A11U."}
+    if main_vs_vc.size == 0:
+        return {"Error": "No main data found for A11A (Tee or Wye, Main)."}
+
+    # Linear interpolation along each velocity-ratio axis (clamped
+    # at the table edges) instead of snapping to the closest row.
+    C_branch = float(np.interp(Vb_Vc, branch_vb_vc, branch_C))
+    branch_loss = C_branch * Pvb
+
+    C_main = float(np.interp(Vs_Vc, main_vs_vc, main_C))
+    main_loss = C_main * Pvs
+
+    # ==========================
+    #   OUTPUTS
+    # ==========================
+    result = {
+        # Branch Outputs
+        "Branch Velocity (ft/min)": Vb,
+        "Branch Velocity Pressure (in w.c.)": Pvb,
+        "Branch Loss Coefficient": C_branch,
+        "Branch Pressure Loss (in w.c.)": branch_loss,
+        # Main Outputs
+        "Main, Source Velocity (ft/min)": Vs,
+        "Main, Converged Velocity (ft/min)": Vc,
+        "Main, Source Velocity Pressure (in w.c.)": Pvs,
+        "Main, Converged Velocity Pressure (in w.c.)": Pvc,
+        "Main Loss Coefficient": C_main,
+        "Main Pressure Loss (in w.c.)": main_loss,
+    }
+
+    return {**result, "Warning": warning_message} if warning_message else result
 
 
 A11U_outputs.output_type = "branch_main"
@@ -62,7 +62,7 @@ def A12B_outputs(stored_values, *_):
         if matched_row.empty:
             return {"Error": "No matching R/D found in A12B data."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
 
         # ==========================
         #   OBSTRUCTION CORRECTION (SCREEN)
@@ -78,7 +78,7 @@ def A12B_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
         # Effective obstruction formula
         if obstruction == "screen":
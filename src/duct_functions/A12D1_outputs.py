@@ -2,6 +2,7 @@ import math
 import pandas as pd
 import numpy as np
 from data_access import get_case_table
+from _entry_lookup import conical_entry_coefficient
 
 
 def A12D1_outputs(stored_values, *_):
@@ -54,26 +55,11 @@ def A12D1_outputs(stored_values, *_):
         # ==========================
         #   BASE COEFFICIENT C (A12D1)
         # ==========================
-        df = get_case_table("A12D1")
-        df = df[["L/D", "ANGLE", "C"]].dropna()
-
-        L_D_vals = df["L/D"].unique()
-        angle_vals = df["ANGLE"].unique()
-
-        # L/D: round down to nearest table value (or min if below range)
-        L_D_match = max(
-            [val for val in L_D_vals if val <= L_D],
-            default=min(L_D_vals),
-        )
-        # ANGLE: nearest table angle
-        angle_match = min(angle_vals, key=lambda x: abs(x - angle_rounded))
-
-        row = df[(df["L/D"] == L_D_match) & (df["ANGLE"] == angle_match)]
-        if row.empty:
+        # Cached lookup: L/D rounded down, nearest table ANGLE
+        C = conical_entry_coefficient("A12D1", L_D, angle_rounded)
+        if C is None:
             return {"Error": "No matching L/D and angle found in A12D1 data."}
 
-        C = row["C"].values[0]
-
         # ==========================
         #   SCREEN CORRECTION (A14A1)
         # ==========================
@@ -87,7 +73,7 @@ def A12D1_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             A_s = A * n
             correction_factor = C1 / (A_s / A) ** 2
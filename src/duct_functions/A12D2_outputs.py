@@ -2,6 +2,7 @@ import math
 import pandas as pd
 import numpy as np
 from data_access import get_case_table
+from _entry_lookup import conical_entry_coefficient
 
 
 def A12D2_outputs(stored_values, *_):
@@ -67,26 +68,11 @@ def A12D2_outputs(stored_values, *_):
         # ==========================
         #   BASE COEFFICIENT C (A12D2)
         # ==========================
-        df = get_case_table("A12D2")
-        df = df[["L/D", "ANGLE", "C"]].dropna()
-
-        L_D_vals    = df["L/D"].unique()
-        angle_vals  = df["ANGLE"].unique()
-
-        # L/D: round down to nearest table value (or min if below)
-        L_D_match = max(
-            [val for val in L_D_vals if val <= L_D],
-            default=min(L_D_vals),
-        )
-        # ANGLE: nearest table angle
-        angle_match = min(angle_vals, key=lambda x: abs(x - angle_rounded))
-
-        matched = df[(df["L/D"] == L_D_match) & (df["ANGLE"] == angle_match)]
-        if matched.empty:
+        # Cached lookup: L/D rounded down, nearest table ANGLE
+        C = conical_entry_coefficient("A12D2", L_D, angle_rounded)
+        if C is None:
             return {"Error": "No matching L/D and ANGLE pair in A12D2 data."}
 
-        C = matched["C"].values[0]
-
         # ==========================
         #   SCREEN CORRECTION (A14A1)
         # ==========================
@@ -100,7 +86,7 @@ def A12D2_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # Note: As/A_entry = n ⇒ As = n * A_entry
             A_s = A_entry * n
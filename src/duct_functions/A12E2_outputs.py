@@ -1,6 +1,4 @@
-import math
-import pandas as pd
-from data_access import get_case_table
+from _bellmouth import bellmouth_outputs
 
 
 def A12E2_outputs(stored_values, *_):
@@ -34,7 +32,7 @@ def A12E2_outputs(stored_values, *_):
     obstruction = stored_values.get("entry_7")
     n  = stored_values.get("entry_8")
 
-    if None in (L, H, W, Hs, Ws, Q):
+    if L is None or H is None or W is None or Hs is None or Ws is None or Q is None:
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -42,83 +40,11 @@ def A12E2_outputs(stored_values, *_):
             "Output 4: Pressure Loss": None,
         }
 
+    # Entry/exit equivalent diameters (in)
     try:
-        # ==========================
-        #   EQUIVALENT DIAMETERS
-        # ==========================
-        # Entry/exit equivalent diameters (in)
-        D1 = 1.0 / (2.0 * (H + W)  / (H  * W))
-        D2 = 1.0 / (2.0 * (Hs + Ws) / (Hs * Ws))
-
-        # Use circular-equivalent area based on D1
-        A = math.pi * (D1 / 2.0) ** 2  # in²
-        V = Q / (A / 144.0)            # ft/min
-
-        # Included angle from D1 → D2
-        angle = 2.0 * math.degrees(math.atan((D2 - D1) / (2.0 * L)))
-        angle_rounded = round(angle)
-
-        # L/D based on D1
-        L_D = L / D1
-
-        # ==========================
-        #   BASE COEFFICIENT (A12E2)
-        # ==========================
-        df = get_case_table("A12E2")
-        df = df[["L/D", "ANGLE", "C"]].dropna()
-
-        LD_vals  = df["L/D"].unique()
-        ANG_vals = df["ANGLE"].unique()
-
-        # L/D: round down to nearest table value (or min if below)
-        LD_match = max(
-            [val for val in LD_vals if val <= L_D],
-            default=min(LD_vals),
-        )
-        # ANGLE: nearest table angle
-        ANG_match = min(ANG_vals, key=lambda x: abs(x - angle_rounded))
-
-        matched_row = df[(df["L/D"] == LD_match) & (df["ANGLE"] == ANG_match)]
-        if matched_row.empty:
-            return {"Error": "No match found in A12E2 table for L/D and ANGLE."}
-
-        C = matched_row["C"].values[0]
-
-        # ==========================
-        #   SCREEN CORRECTION (A14A1)
-        # ==========================
-        if obstruction == "screen" and n is not None:
-            df_screen = get_case_table("A14A1")
-            df_screen = df_screen[["n, free area ratio", "C"]].dropna()
-            n_vals = df_screen["n, free area ratio"].unique()
-
-            # Largest table n ≤ actual n, or smallest if below range
-            n_match = max(
-                [val for val in n_vals if val <= n],
-                default=min(n_vals),
-            )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
-
-            # As/A = n for a uniform screen
-            As_A = n
-            loss_coefficient = C + (C1 / (As_A ** 2))
-        else:
-            loss_coefficient = C
-
-        # ==========================
-        #   OUTPUTS
-        # ==========================
-        vp = (V / 4005.0) ** 2
-        pressure_loss = loss_coefficient * vp
-
-        return {
-            "Output 1: Velocity": V,
-            "Output 2: Velocity Pressure": vp,
-            "Output 3: Loss Coefficient": loss_coefficient,
-            "Output 4: Pressure Loss": pressure_loss,
-        }
-
-    except Exception as e:
+        D1 = (H * W) / (2.0 * (H + W))
+        D2 = (Hs * Ws) / (2.0 * (Hs + Ws))
+    except ZeroDivisionError as e:
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -127,5 +53,8 @@ def A12E2_outputs(stored_values, *_):
             "Error": str(e),
         }
 
+    # Shared bellmouth body with the equivalent diameters
+    return bellmouth_outputs("A12E2", L, D1, D2, Q, obstruction, n)
+
 
 A12E2_outputs.output_type = "standard"
@@ -75,7 +75,7 @@ def A12F_outputs(stored_values, *_):
         if matched_row.empty:
             return {"Error": "No matching L/D and ANGLE pair found in A12F."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
 
         # ==========================
         #   SCREEN CORRECTION (A14A1)
@@ -89,7 +89,7 @@ def A12F_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # As from Ds, A from D_up
             A_s = math.pi * (Ds / 2.0) ** 2
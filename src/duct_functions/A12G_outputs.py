@@ -1,6 +1,24 @@
 import math
-import pandas as pd
+from functools import lru_cache
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
+
 from data_access import get_case_table
+from _kernels import standard_case_outputs
+from _entry_lookup import screen_correction
+
+
+@lru_cache(maxsize=None)
+def _a12g_lut():
+    """{(configuration lowercased, ANGLE): C} from the A12G table, built once."""
+    df = get_case_table("A12G")[["configuration", "ANGLE", "C"]]
+    lut = {}
+    for cfg, ang, C in df.itertuples(index=False):
+        # First occurrence wins, matching the old first-row selection
+        if isinstance(cfg, str):
+            lut.setdefault((cfg.lower(), ang), C)
+    return lut
 
 
 def A12G_outputs(stored_values, *_):
@@ -49,7 +67,7 @@ def A12G_outputs(stored_values, *_):
             obstruction = stored_values.get("entry_6")
             n  = stored_values.get("entry_7")
 
-            if None in (D1, D, angle, Q):
+            if D1 is None or D is None or angle is None or Q is None:
                 return {
                     "Output 1: Velocity": None,
                     "Output 2: Velocity Pressure": None,
@@ -58,9 +76,7 @@ def A12G_outputs(stored_values, *_):
                 }
 
             # Downstream (duct) area in²
-            A = math.pi * (D / 2.0) ** 2
-            # Hood opening area in²
-            A1 = math.pi * (D1 / 2.0) ** 2
+            A = _PI_OVER_4 * D * D
 
         elif profile == "square or rectangular hood":
             H1 = stored_values.get("entry_2")
@@ -71,7 +87,7 @@ def A12G_outputs(stored_values, *_):
             obstruction = stored_values.get("entry_7")
             n  = stored_values.get("entry_8")
 
-            if None in (H1, W1, D, angle, Q):
+            if H1 is None or W1 is None or D is None or angle is None or Q is None:
                 return {
                     "Output 1: Velocity": None,
                     "Output 2: Velocity Pressure": None,
@@ -80,7 +96,7 @@ def A12G_outputs(stored_values, *_):
                 }
 
             # Downstream (duct) area in²
-            A = math.pi * (D / 2.0) ** 2
+            A = _PI_OVER_4 * D * D
             # Hood opening area in²
             A1 = H1 * W1
 
@@ -90,57 +106,43 @@ def A12G_outputs(stored_values, *_):
         # -----------------------------
         #  Velocity in the duct
         # -----------------------------
-        V = Q / (A / 144.0)  # ft/min
+        V = (Q * 144.0) / A  # ft/min
 
         # -----------------------------
         #  Base loss coefficient (A12G)
         # -----------------------------
-        df = get_case_table("A12G")
-
         config_key = "round hood" if profile == "round hood" else "rect hood"
-        df = df[
-            (df["configuration"].str.lower() == config_key.lower()) &
-            (df["ANGLE"] == angle)
-        ]
-
-        if df.empty:
+        C = _a12g_lut().get((config_key, angle))
+        if C is None:
             return {"Error": "No matching data found for A12G configuration and angle."}
 
-        C = df.iloc[0]["C"]
-
         # -----------------------------
         #  Screen correction (A14A1)
         # -----------------------------
         if obstruction == "screen" and n is not None:
-            df_screen = get_case_table("A14A1")
-            df_screen = df_screen[["n, free area ratio", "C"]].dropna()
-
-            n_vals = df_screen["n, free area ratio"].unique()
-            n_match = max(
-                [val for val in n_vals if val <= n],
-                default=min(n_vals),
-            )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
-
-            # (A1 / A)^2 term
-            if A > 0:
-                area_ratio_sq = (A1 / A) ** 2
+            # Cached A14A1 lookup (largest table n <= actual n)
+            C1 = screen_correction(n)
+
+            # (A1 / A)^2 in closed form — the pi/4 factors cancel, so the
+            # round profile reduces to (D1/D)^4 straight from the diameters
+            if profile == "round hood":
+                area_ratio_sq = (D1 / D) ** 2
+                area_ratio_sq *= area_ratio_sq
             else:
-                area_ratio_sq = 1.0
+                area_ratio_sq = (A1 * 4.0 / (math.pi * D * D)) ** 2
 
             C = C + (C1 / area_ratio_sq)
 
         # -----------------------------
         #  Final outputs
         # -----------------------------
-        vp = (V / 4005.0) ** 2
-        pressure_loss = C * vp
+        res = standard_case_outputs(V, C)
 
         return {
-            "Output 1: Velocity": V,
-            "Output 2: Velocity Pressure": vp,
-            "Output 3: Loss Coefficient": C,
-            "Output 4: Pressure Loss": pressure_loss,
+            "Output 1: Velocity": res.velocity,
+            "Output 2: Velocity Pressure": res.velocity_pressure,
+            "Output 3: Loss Coefficient": res.loss_coefficient,
+            "Output 4: Pressure Loss": res.pressure_loss,
         }
 
     except Exception as e:
@@ -71,7 +71,7 @@ def A13A_outputs(stored_values, *_):
         if matched_row.empty:
             return {"Error": "No match found for provided L/D and angle in A13A."}
 
-        C_base = matched_row["C"].values[0]
+        C_base = matched_row["C"].iat[0]
 
         # -----------------------------
         #  Screen correction (A14A1)
@@ -87,7 +87,7 @@ def A13A_outputs(stored_values, *_):
                     [val for val in n_vals if val <= n],
                     default=min(n_vals),
                 )
-                C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+                C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
                 # As is at exit (A1) with screen
                 As_A_ratio = A1 / A if A > 0 else 1.0
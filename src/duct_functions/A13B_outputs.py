@@ -1,4 +1,6 @@
 import math
+
+import numpy as np
 import pandas as pd
 from data_access import get_case_table
 
@@ -57,7 +59,7 @@ def A13B_outputs(stored_values, *_):
         df = df[["ANGLE", "As/A", "C"]].dropna()
 
         angle_vals = sorted(df["ANGLE"].unique())
-        ratio_vals = sorted(df["As/A"].unique())
+        ratio_vals = np.sort(df["As/A"].unique())
 
         # Angle: smallest tabulated ≥ computed, else max
         angle_match = min(
@@ -74,13 +76,13 @@ def A13B_outputs(stored_values, *_):
             )
         else:
             # for larger angles, pick closest tabulated ratio
-            A_ratio_match = min(ratio_vals, key=lambda x: abs(x - A_ratio))
+            A_ratio_match = ratio_vals[np.abs(ratio_vals - A_ratio).argmin()]
 
         matched_row = df[(df["ANGLE"] == angle_match) & (df["As/A"] == A_ratio_match)]
         if matched_row.empty:
             return {"Error": "No matching angle and As/A pair found in A13B data."}
 
-        C_base = matched_row["C"].values[0]
+        C_base = matched_row["C"].iat[0]
 
         # -----------------------------
         #  Screen correction (A14A1)
@@ -100,7 +102,7 @@ def A13B_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # Use As/A ratio from small to large end
             C_total = C_base + (C1 / (A_ratio ** 2 if A_ratio != 0 else 1.0))
@@ -1,4 +1,6 @@
 import math
+
+import numpy as np
 import pandas as pd
 from data_access import get_case_table
 from interpolation_manager import get_case_interpolator
@@ -66,12 +68,12 @@ def A13C_outputs(stored_values, *_):
                     default=min(ratio_subset),
                 )
             else:
-                ratio_match = min(ratio_subset, key=lambda x: abs(x - A_ratio))
+                ratio_match = ratio_subset[np.abs(ratio_subset - A_ratio).argmin()]
 
             matched_row = df[(df["ANGLE"] == angle_match) & (df["As/A"] == ratio_match)]
             if matched_row.empty:
                 return {"Error": "No matching data in A13C for given angle and area ratio."}
-            C_base = matched_row["C"].values[0]
+            C_base = matched_row["C"].iat[0]
         else:
             interp = bundle["interp"]
             # IDW 2D interpolation: continuous in angle and As/A
@@ -93,7 +95,7 @@ def A13C_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # C_total = C + C1 / (As/A)²
             loss_coefficient = C_base + (C1 / (A_ratio ** 2 if A_ratio != 0 else 1.0))
@@ -89,7 +89,7 @@ def A13D_outputs(stored_values, *_):
         if df_match.empty:
             return {"Error": "No matching loss coefficient found in A13D."}
 
-        C_base = df_match["C"].values[0]
+        C_base = df_match["C"].iat[0]
 
         # ---------- Screen obstruction correction (A14A1) ----------
         total_loss_coefficient = C_base
@@ -108,7 +108,7 @@ def A13D_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             As_A = A_s / A if A != 0 else 1.0
             total_loss_coefficient = C_base + (C1 / (As_A ** 2))
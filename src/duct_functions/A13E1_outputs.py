@@ -57,7 +57,7 @@ def A13E1_outputs(stored_values, *_):
         if matched_row.empty:
             return {"Error": "No matching L/D value found in A13E1 data."}
 
-        C_base = matched_row["C"].values[0]
+        C_base = matched_row["C"].iat[0]
 
         # --- Optional screen correction from A14A1 ---
         total_C = C_base
@@ -75,7 +75,7 @@ def A13E1_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C_screen = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C_screen = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
             total_C = C_base + C_screen
 
         pressure_loss = total_C * vp
@@ -64,7 +64,7 @@ def A13E2_outputs(stored_values, *_):
         if matched_row.empty:
             return {"Error": "No matching R/W and L/W pair found in A13E2 data."}
 
-        C_base = matched_row["C"].values[0]
+        C_base = matched_row["C"].iat[0]
 
         # --- Optional screen correction from A14A1 ---
         total_C = C_base
@@ -82,7 +82,7 @@ def A13E2_outputs(stored_values, *_):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals),
             )
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
             total_C = C_base + C1   # matches your original logic
 
         pressure_loss = total_C * vp
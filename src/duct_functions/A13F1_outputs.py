@@ -77,7 +77,7 @@ def A13F1_outputs(stored_values, *_):
         if match.empty:
             return {"Error": "No matching row found in A13F1 data."}
 
-        C_base = match["C"].values[0]
+        C_base = match["C"].iat[0]
 
         # --- Screen obstruction correction (A14A1) ---
         C_total = C_base
@@ -92,7 +92,7 @@ def A13F1_outputs(stored_values, *_):
             n_vals = df_screen["n, free area ratio"].unique()
 
             n_match = max([val for val in n_vals if val <= n], default=min(n_vals))
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # For this case you're treating the screen as same area as opening → C_total = C + C1
             C_total = C_base + C1
@@ -60,7 +60,7 @@ def A13F2_outputs(stored_values, *_):
         if matched_row.empty:
             return {"Error": "No matching data found for given angle and V/V0 in A13F2."}
 
-        C_base = matched_row["C"].values[0]
+        C_base = matched_row["C"].iat[0]
 
         # --- Screen obstruction correction (A14A1) ---
         C_total = C_base
@@ -74,7 +74,7 @@ def A13F2_outputs(stored_values, *_):
             df_screen = df_screen[["n, free area ratio", "C"]].dropna()
             n_vals = df_screen["n, free area ratio"].unique()
             n_match = max([val for val in n_vals if val <= n], default=min(n_vals))
-            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C1 = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
 
             # For this case you're using a simple additive correction: C_total = C + C1
             C_total = C_base + C1
@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A13G_outputs(stored_values, data):
     """
     Calculates outputs for case A13G (rectangular exit with varying height and width),
@@ -20,11 +25,10 @@ def A13G_outputs(stored_values, data):
     obstruction = stored_values.get("entry_6")
     n = stored_values.get("entry_7")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, H1 = {H1}, angle = {angle}, Q = {Q}, obstruction = {obstruction}, n = {n}")
+    log.debug("Inputs: H = %s, W = %s, H1 = %s, angle = %s, Q = %s, obstruction = %s, n = %s", H, W, H1, angle, Q, obstruction, n)
 
     if None in (H, W, H1, angle, Q):
-        print("[DEBUG] Missing one or more required inputs.")
+        log.debug("Missing one or more required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -39,7 +43,7 @@ def A13G_outputs(stored_values, data):
         vp = (V / 4005) ** 2
         area_ratio = (H1 * W) / (H * W)
 
-        print(f"[DEBUG] Computed: Area = {A}, Velocity = {V:.2f}, Area Ratio = {area_ratio:.4f}")
+        log.debug("Computed: Area = %s, Velocity = %.2f, Area Ratio = %.4f", A, V, area_ratio)
 
         # === Base data reference (UPDATED) ===
         df = get_case_table("A13G")
@@ -57,8 +61,8 @@ def A13G_outputs(stored_values, data):
         if matched_row.empty:
             return {"Error": "No matching row found for angle and area ratio."}
 
-        C = matched_row["C"].values[0]
-        print(f"[DEBUG] Base coefficient C = {C} (angle = {angle_match}, A1/A = {area_match})")
+        C = matched_row["C"].iat[0]
+        log.debug("Base coefficient C = %s (angle = %s, A1/A = %s)", C, angle_match, area_match)
 
         # === Screen correction (UPDATED source) ===
         if isinstance(obstruction, str) and "screen" in obstruction.lower() and n is not None:
@@ -68,8 +72,8 @@ def A13G_outputs(stored_values, data):
             n_vals = df_screen["n, free area ratio"].unique()
             n_match = max([val for val in n_vals if val <= n], default=min(n_vals))
 
-            C_screen = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
-            print(f"[DEBUG] Screen C = {C_screen}")
+            C_screen = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
+            log.debug("Screen C = %s", C_screen)
 
             # Apply the standard screen formula
             C += C_screen / (area_ratio ** 2)
@@ -84,7 +88,7 @@ def A13G_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A13G_outputs calculation: {e}")
+        log.error("Exception occurred during A13G_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A13H_outputs(stored_values, data):
     H = stored_values.get("entry_1")
     W = stored_values.get("entry_2")
@@ -12,8 +17,7 @@ def A13H_outputs(stored_values, data):
     obstruction = stored_values.get("entry_7")
     n = stored_values.get("entry_8")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H={H}, W={W}, H1={H1}, W1={W1}, angle={angle}, Q={Q}, obstruction={obstruction}, n={n}")
+    log.debug("Inputs: H=%s, W=%s, H1=%s, W1=%s, angle=%s, Q=%s, obstruction=%s, n=%s", H, W, H1, W1, angle, Q, obstruction, n)
 
     if None in (H, W, H1, W1, angle, Q):
         return {
@@ -38,8 +42,7 @@ def A13H_outputs(stored_values, data):
             default=max(angle_vals)
         )
 
-        print(f"[DEBUG] Calculated A = {A}, A1 = {A1}, V = {V}, "
-              f"Area Ratio = {ratio}, Rounded Angle = {angle_rounded}")
+        log.debug("Calculated A = %s, A1 = %s, V = %s, Area Ratio = %s, Rounded Angle = %s", A, A1, V, ratio, angle_rounded)
 
         df = df_A13H[df_A13H["ANGLE"] == angle_rounded]
 
@@ -49,14 +52,14 @@ def A13H_outputs(stored_values, data):
             default=min(ratio_vals)
         )
 
-        print(f"[DEBUG] Matched A1/A = {ratio_match}")
+        log.debug("Matched A1/A = %s", ratio_match)
 
         matched_row = df[df["A1/A"] == ratio_match]
         if matched_row.empty:
             return {"Error": "No matching configuration found in A13H table."}
 
-        C = matched_row["C"].values[0]
-        print(f"[DEBUG] Base Coefficient C = {C}")
+        C = matched_row["C"].iat[0]
+        log.debug("Base Coefficient C = %s", C)
 
         # --- Obstruction correction via A14A1 (UPDATED) ---
         if obstruction == "screen" and n is not None:
@@ -67,10 +70,9 @@ def A13H_outputs(stored_values, data):
                 [val for val in n_vals if val <= n],
                 default=min(n_vals)
             )
-            C_screen = df_screen[df_screen["n, free area ratio"] == n_match]["C"].values[0]
+            C_screen = df_screen[df_screen["n, free area ratio"] == n_match]["C"].iat[0]
             total_loss_coefficient = C + (C_screen / (A1 / A) ** 2)
-            print(f"[DEBUG] Screen C = {C_screen}, "
-                  f"Total Loss Coefficient = {total_loss_coefficient}")
+            log.debug("Screen C = %s, Total Loss Coefficient = %s", C_screen, total_loss_coefficient)
         else:
             total_loss_coefficient = C
 
@@ -85,7 +87,7 @@ def A13H_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred: {e}")
+        log.error("Exception occurred: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -1,7 +1,11 @@
-import pandas as pd
+import logging
 import math
+
+import pandas as pd
 from data_access import get_case_table
 
+log = logging.getLogger(__name__)
+
 
 def A14A1_outputs(stored_values, data):
     """
@@ -12,11 +16,10 @@ def A14A1_outputs(stored_values, data):
     Q = stored_values.get("entry_2")
     n = stored_values.get("entry_3")
 
-    print("[DEBUG] Inputs:")
-    print(f"  D = {D}, Q = {Q}, n = {n}")
+    log.debug("Inputs: D = %s, Q = %s, n = %s", D, Q, n)
 
     if None in (D, Q, n):
-        print("[DEBUG] Missing one or more required inputs.")
+        log.debug("Missing one or more required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -39,7 +42,7 @@ def A14A1_outputs(stored_values, data):
 
         matched_row = df[df["n, free area ratio"] == n_match]
         if matched_row.empty:
-            print("[DEBUG] No matching n found in A14A1.")
+            log.debug("No matching n found in A14A1.")
             return {
                 "Output 1: Velocity": V,
                 "Output 2: Velocity Pressure": vp,
@@ -48,8 +51,8 @@ def A14A1_outputs(stored_values, data):
                 "Error": "No matching n found."
             }
 
-        C = matched_row["C"].values[0]
-        print(f"[DEBUG] Base coefficient C = {C}")
+        C = matched_row["C"].iat[0]
+        log.debug("Base coefficient C = %s", C)
 
         return {
             "Output 1: Velocity": V,
@@ -59,7 +62,7 @@ def A14A1_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A14A1_outputs calculation: {e}")
+        log.error("Exception occurred during A14A1_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -1,7 +1,11 @@
+import logging
 import math
+
 import pandas as pd
 from data_access import get_case_table
 
+log = logging.getLogger(__name__)
+
 
 def A14A2_outputs(stored_values, data):
     """
@@ -17,11 +21,10 @@ def A14A2_outputs(stored_values, data):
     Q = stored_values.get("entry_3")
     n = stored_values.get("entry_4")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, Q = {Q}, n = {n}")
+    log.debug("Inputs: H = %s, W = %s, Q = %s, n = %s", H, W, Q, n)
 
     if None in (H, W, Q, n):
-        print("[DEBUG] Missing one or more required inputs.")
+        log.debug("Missing one or more required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -33,7 +36,7 @@ def A14A2_outputs(stored_values, data):
         A = H * W  # in^2
         V = Q / (A / 144)  # ft/min
 
-        print(f"[DEBUG] Computed: Area = {A:.2f} in^2, Velocity = {V:.2f} ft/min")
+        log.debug("Computed: Area = %.2f in^2, Velocity = %.2f ft/min", A, V)
 
         # Look up loss coefficient from A14A1 data USING get_case_table
         df = get_case_table("A14A1")[["n, free area ratio", "C"]].dropna()
@@ -41,9 +44,9 @@ def A14A2_outputs(stored_values, data):
         n_vals = df["n, free area ratio"].unique()
         n_match = max([val for val in n_vals if val <= n], default=min(n_vals))
 
-        C = df[df["n, free area ratio"] == n_match]["C"].values[0]
+        C = df[df["n, free area ratio"] == n_match]["C"].iat[0]
 
-        print(f"[DEBUG] Matched n = {n_match}, Coefficient C = {C}")
+        log.debug("Matched n = %s, Coefficient C = %s", n_match, C)
 
         vp = (V / 4005) ** 2
         pressure_loss = C * vp
@@ -56,7 +59,7 @@ def A14A2_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A14A2_outputs calculation: {e}")
+        log.error("Exception occurred during A14A2_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
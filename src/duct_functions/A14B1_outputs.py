@@ -1,7 +1,11 @@
+import logging
 import math
+
 import pandas as pd
 from data_access import get_case_table
 
+log = logging.getLogger(__name__)
+
 
 def A14B1_outputs(stored_values, data):
     """
@@ -20,11 +24,10 @@ def A14B1_outputs(stored_values, data):
     t_plate = stored_values.get("entry_4")
     d_hole = stored_values.get("entry_5")
 
-    print("[DEBUG] Inputs:")
-    print(f"  D = {D}, Q = {Q}, n = {n}, t_plate = {t_plate}, d_hole = {d_hole}")
+    log.debug("Inputs: D = %s, Q = %s, n = %s, t_plate = %s, d_hole = %s", D, Q, n, t_plate, d_hole)
 
     if None in (D, Q, n, t_plate, d_hole):
-        print("[DEBUG] Missing one or more required inputs.")
+        log.debug("Missing one or more required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -40,7 +43,7 @@ def A14B1_outputs(stored_values, data):
 
         # Determine t/D for perforated plate
         t_D = t_plate / d_hole
-        print(f"[DEBUG] Computed t/D = {t_D:.4f}, Velocity = {V:.2f}")
+        log.debug("Computed t/D = %.4f, Velocity = %.2f", t_D, V)
 
         # Pull A14B1 table via get_case_table instead of data.loc
         df = get_case_table("A14B1")[["n, free area ratio", "t/D", "C"]].dropna()
@@ -51,7 +54,7 @@ def A14B1_outputs(stored_values, data):
         n_match = max([val for val in n_vals if val <= n], default=min(n_vals))
         tD_match = max([val for val in tD_vals if val <= t_D], default=min(tD_vals))
 
-        print(f"[DEBUG] Matching n = {n_match}, t/D = {tD_match}")
+        log.debug("Matching n = %s, t/D = %s", n_match, tD_match)
 
         matched_row = df[
             (df["n, free area ratio"] == n_match) &
@@ -61,8 +64,8 @@ def A14B1_outputs(stored_values, data):
         if matched_row.empty:
             return {"Error": "No matching t/D and n pair found in data."}
 
-        C = matched_row["C"].values[0]
-        print(f"[DEBUG] Loss coefficient C = {C}")
+        C = matched_row["C"].iat[0]
+        log.debug("Loss coefficient C = %s", C)
 
         pressure_loss = C * vp
 
@@ -74,7 +77,7 @@ def A14B1_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A14B1_outputs calculation: {e}")
+        log.error("Exception occurred during A14B1_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
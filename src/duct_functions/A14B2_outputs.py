@@ -1,7 +1,11 @@
+import logging
 import math
+
 import pandas as pd
 from data_access import get_case_table
 
+log = logging.getLogger(__name__)
+
 
 def A14B2_outputs(stored_values, data):
     """
@@ -20,11 +24,10 @@ def A14B2_outputs(stored_values, data):
     t = stored_values.get("entry_5")      # Plate thickness
     d_hole = stored_values.get("entry_6") # Hole diameter
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, Q = {Q}, n = {n}, t = {t}, d_hole = {d_hole}")
+    log.debug("Inputs: H = %s, W = %s, Q = %s, n = %s, t = %s, d_hole = %s", H, W, Q, n, t, d_hole)
 
     if None in (H, W, Q, n, t, d_hole):
-        print("[DEBUG] Missing one or more required inputs.")
+        log.debug("Missing one or more required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -37,7 +40,7 @@ def A14B2_outputs(stored_values, data):
         V = Q / (A / 144)  # ft/min
         t_D = t / d_hole
 
-        print(f"[DEBUG] Area = {A:.2f} in^2, Velocity = {V:.2f} ft/min, t/D = {t_D:.4f}")
+        log.debug("Area = %.2f in^2, Velocity = %.2f ft/min, t/D = %.4f", A, V, t_D)
 
         # Use get_case_table just like the other cases
         df = get_case_table("A14B2")[["n, free area ratio", "t/D", "C"]].dropna()
@@ -48,18 +51,18 @@ def A14B2_outputs(stored_values, data):
         n_match = max([val for val in n_vals if val <= n], default=min(n_vals))
         tD_match = max([val for val in tD_vals if val <= t_D], default=min(tD_vals))
 
-        print(f"[DEBUG] Matching n = {n_match}, t/D = {tD_match}")
+        log.debug("Matching n = %s, t/D = %s", n_match, tD_match)
 
         matched_row = df[
             (df["n, free area ratio"] == n_match) &
             (df["t/D"] == tD_match)
         ]
         if matched_row.empty:
-            print("[DEBUG] No match found in A14B2 table.")
+            log.debug("No match found in A14B2 table.")
             return {"Error": "No matching entry in A14B2 table."}
 
-        C = matched_row["C"].values[0]
-        print(f"[DEBUG] Loss Coefficient C = {C}")
+        C = matched_row["C"].iat[0]
+        log.debug("Loss Coefficient C = %s", C)
 
         vp = (V / 4005) ** 2
         pressure_loss = C * vp
@@ -72,7 +75,7 @@ def A14B2_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A14B2_outputs calculation: {e}")
+        log.error("Exception occurred during A14B2_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15B_outputs(stored_values, data):
     """
     Calculates outputs for A15B (Exit: Elliptical Opening at End of Rectangular Duct).
@@ -17,11 +22,10 @@ def A15B_outputs(stored_values, data):
     Q = stored_values.get("entry_3")
     angle = stored_values.get("entry_4")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, Q = {Q}, angle = {angle}")
+    log.debug("Inputs: H = %s, W = %s, Q = %s, angle = %s", H, W, Q, angle)
 
     if None in (H, W, Q, angle):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -45,11 +49,10 @@ def A15B_outputs(stored_values, data):
         if matched_row.empty:
             return {"Error": "No matching angle found in A15B data."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
         pressure_loss = C * vp
 
-        print(f"[DEBUG] A = {A:.2f}, V = {V:.2f}, vp = {vp:.4f}, "
-              f"C = {C}, ΔP = {pressure_loss:.4f}")
+        log.debug("A = %.2f, V = %.2f, vp = %.4f, C = %s, ΔP = %.4f", A, V, vp, C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -59,7 +62,7 @@ def A15B_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A15B_outputs calculation: {e}")
+        log.error("Exception occurred during A15B_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15C_outputs(stored_values, data):
     """
     Calculates outputs for A15C (Exit: Segmental Opening in Round Duct).
@@ -22,11 +27,10 @@ def A15C_outputs(stored_values, data):
     h = stored_values.get("entry_2")
     Q = stored_values.get("entry_3")
 
-    print("[DEBUG] Inputs:")
-    print(f"  D = {D}, h = {h}, Q = {Q}")
+    log.debug("Inputs: D = %s, h = %s, Q = %s", D, h, Q)
 
     if None in (D, h, Q):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -40,7 +44,7 @@ def A15C_outputs(stored_values, data):
         vp = (V / 4005) ** 2
 
         h_D = h / D
-        print(f"[DEBUG] A = {A:.2f}, V = {V:.2f}, h/D = {h_D:.4f}")
+        log.debug("A = %.2f, V = %.2f, h/D = %.4f", A, V, h_D)
 
         # Use centralized case table loader instead of `data`
         df = get_case_table("A15C")[["h/D", "C"]].dropna()
@@ -52,10 +56,10 @@ def A15C_outputs(stored_values, data):
         if matched_row.empty:
             return {"Error": "No matching h/D value found in A15C data."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
         pressure_loss = C * vp
 
-        print(f"[DEBUG] Matched h/D = {hD_match}, C = {C}, ΔP = {pressure_loss:.4f}")
+        log.debug("Matched h/D = %s, C = %s, ΔP = %.4f", hD_match, C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -65,7 +69,7 @@ def A15C_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A15C_outputs calculation: {e}")
+        log.error("Exception occurred during A15C_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
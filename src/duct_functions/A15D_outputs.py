@@ -1,7 +1,14 @@
+import logging
 import math
+
+import numpy as np
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15D_outputs(stored_values, data):
     """
     Calculates outputs for case A15D (Rectangular Duct with Segmental Exit).
@@ -25,11 +32,10 @@ def A15D_outputs(stored_values, data):
     h = stored_values.get("entry_3")
     Q = stored_values.get("entry_4")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, h = {h}, Q = {Q}")
+    log.debug("Inputs: H = %s, W = %s, h = %s, Q = %s", H, W, h, Q)
 
     if None in (H, W, h, Q):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -44,29 +50,29 @@ def A15D_outputs(stored_values, data):
 
         H_W = H / W
         h_H = h / H
-        print(f"[DEBUG] Area = {A:.2f}, Velocity = {V:.2f}, H/W = {H_W:.3f}, h/H = {h_H:.3f}")
+        log.debug("Area = %.2f, Velocity = %.2f, H/W = %.3f, h/H = %.3f", A, V, H_W, h_H)
 
         # Use centralized loader instead of `data.loc[...]`
         df = get_case_table("A15D")[["H/W", "h/H", "C"]].dropna()
 
         # Nearest match for H/W
         HW_vals = df["H/W"].unique()
-        HW_match = min(HW_vals, key=lambda x: abs(x - H_W))
+        HW_match = HW_vals[np.abs(HW_vals - H_W).argmin()]
 
         # Round down for h/H
         hH_vals = sorted(df["h/H"].unique())
         hH_match = max([val for val in hH_vals if val <= h_H], default=min(hH_vals))
 
-        print(f"[DEBUG] Matched H/W = {HW_match}, h/H = {hH_match}")
+        log.debug("Matched H/W = %s, h/H = %s", HW_match, hH_match)
 
         matched_row = df[(df["H/W"] == HW_match) & (df["h/H"] == hH_match)]
         if matched_row.empty:
             return {"Error": "No matching H/W and h/H pair found in A15D data."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
         pressure_loss = C * vp
 
-        print(f"[DEBUG] C = {C}, ΔP = {pressure_loss:.4f}")
+        log.debug("C = %s, ΔP = %.4f", C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -76,7 +82,7 @@ def A15D_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception occurred during A15D_outputs calculation: {e}")
+        log.error("Exception occurred during A15D_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
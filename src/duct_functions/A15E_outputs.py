@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15E_outputs(stored_values, data):
     """
     Calculates outputs for case A15E (Rectangular Exit with Turning Vanes or Blades).
@@ -28,11 +33,10 @@ def A15E_outputs(stored_values, data):
     angle = stored_values.get("entry_4")
     Q = stored_values.get("entry_5")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, N = {N}, angle = {angle}, Q = {Q}")
+    log.debug("Inputs: H = %s, W = %s, N = %s, angle = %s, Q = %s", H, W, N, angle, Q)
 
     if None in (H, W, N, angle, Q):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -50,7 +54,7 @@ def A15E_outputs(stored_values, data):
         perimeter = 2 * (H + W)
         L_R = (N * W) / perimeter
 
-        print(f"[DEBUG] Area = {A:.2f} in², Velocity = {V:.2f} ft/min, L/R = {L_R:.4f}")
+        log.debug("Area = %.2f in², Velocity = %.2f ft/min, L/R = %.4f", A, V, L_R)
 
         # Look up loss coefficient from centralized case table
         df = get_case_table("A15E")[["L/R", "ANGLE", "C"]].dropna()
@@ -61,16 +65,16 @@ def A15E_outputs(stored_values, data):
         LR_match = min([val for val in LR_vals if val >= L_R], default=max(LR_vals))
         angle_match = min([val for val in angle_vals if val >= angle], default=max(angle_vals))
 
-        print(f"[DEBUG] Matched L/R = {LR_match}, ANGLE = {angle_match}")
+        log.debug("Matched L/R = %s, ANGLE = %s", LR_match, angle_match)
 
         matched_row = df[(df["L/R"] == LR_match) & (df["ANGLE"] == angle_match)]
         if matched_row.empty:
             return {"Error": "No matching L/R and ANGLE pair found in A15E data."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
         pressure_loss = C * vp
 
-        print(f"[DEBUG] C = {C}, ΔP = {pressure_loss:.4f}")
+        log.debug("C = %s, ΔP = %.4f", C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -80,7 +84,7 @@ def A15E_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception during A15E_outputs calculation: {e}")
+        log.error("Exception during A15E_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
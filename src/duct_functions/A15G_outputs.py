@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15G_outputs(stored_values, data):
     """
     Calculates outputs for case A15G (Rectangular Exit without Blades).
@@ -23,11 +28,10 @@ def A15G_outputs(stored_values, data):
     angle = stored_values.get("entry_3")
     Q = stored_values.get("entry_4")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, W = {W}, angle = {angle}, Q = {Q}")
+    log.debug("Inputs: H = %s, W = %s, angle = %s, Q = %s", H, W, angle, Q)
 
     if None in (H, W, angle, Q):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -40,23 +44,23 @@ def A15G_outputs(stored_values, data):
         V = Q / (A / 144)  # ft/min
         vp = (V / 4005) ** 2
 
-        print(f"[DEBUG] Area = {A:.2f} in², Velocity = {V:.2f} ft/min")
+        log.debug("Area = %.2f in², Velocity = %.2f ft/min", A, V)
 
         # Use centralized case table
         df = get_case_table("A15G")[["ANGLE", "C"]].dropna()
         angle_vals = sorted(df["ANGLE"].unique())
         angle_match = min([val for val in angle_vals if val >= angle], default=max(angle_vals))
 
-        print(f"[DEBUG] Matched ANGLE = {angle_match}")
+        log.debug("Matched ANGLE = %s", angle_match)
 
         matched_row = df[df["ANGLE"] == angle_match]
         if matched_row.empty:
             return {"Error": "No matching angle found in A15G data."}
 
-        C = matched_row["C"].values[0]
+        C = matched_row["C"].iat[0]
         pressure_loss = C * vp
 
-        print(f"[DEBUG] C = {C}, ΔP = {pressure_loss:.4f}")
+        log.debug("C = %s, ΔP = %.4f", C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -66,7 +70,7 @@ def A15G_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception during A15G_outputs calculation: {e}")
+        log.error("Exception during A15G_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15H1_outputs(stored_values, data):
     """
     Calculates outputs for case A15H1 (Obstruction in Round Duct with Protruding Elements).
@@ -13,11 +18,10 @@ def A15H1_outputs(stored_values, data):
     y = stored_values.get("entry_4")
     Q = stored_values.get("entry_5")
 
-    print("[DEBUG] Inputs:")
-    print(f"  D = {D}, d = {d}, L = {L}, y = {y}, Q = {Q}")
+    log.debug("Inputs: D = %s, d = %s, L = %s, y = %s, Q = %s", D, d, L, y, Q)
 
     if None in (D, d, L, y, Q):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -34,7 +38,7 @@ def A15H1_outputs(stored_values, data):
         y_D = y / D
         vp = (V / 4005) ** 2
 
-        print(f"[DEBUG] A = {A:.2f}, V = {V:.2f}, Re = {Re:.2f}, S_m/A = {Sm_A:.5f}, y/D = {y_D:.4f}")
+        log.debug("A = %.2f, V = %.2f, Re = %.2f, S_m/A = %.5f, y/D = %.4f", A, V, Re, Sm_A, y_D)
 
         # === Base Loss Coefficient (from A15H1 table)
         df_base = get_case_table("A15H1")[["Re", "S_m/A", "C"]].dropna()
@@ -45,14 +49,14 @@ def A15H1_outputs(stored_values, data):
         Re_match = max([v for v in Re_vals if v <= Re], default=min(Re_vals))
         SmA_match = min([v for v in SmA_vals if v >= Sm_A], default=max(SmA_vals))
 
-        print(f"[DEBUG] Matched Re = {Re_match}, S_m/A = {SmA_match}")
+        log.debug("Matched Re = %s, S_m/A = %s", Re_match, SmA_match)
 
         row_base = df_base[(df_base["Re"] == Re_match) & (df_base["S_m/A"] == SmA_match)]
         if row_base.empty:
             return {"Error": "No matching Re and S_m/A in A15H1 data."}
 
-        base_C = row_base["C"].values[0]
-        print(f"[DEBUG] Base coefficient C = {base_C}")
+        base_C = row_base["C"].iat[0]
+        log.debug("Base coefficient C = %s", base_C)
 
         # === Correction Factor K (from A15H2 table)
         df_k = get_case_table("A15H2")[["y/D or y/H", "K"]].dropna()
@@ -60,13 +64,13 @@ def A15H1_outputs(stored_values, data):
         yD_vals = sorted(df_k["y/D or y/H"].unique())
         yD_match = max([v for v in yD_vals if v <= y_D], default=min(yD_vals))
 
-        K = df_k[df_k["y/D or y/H"] == yD_match]["K"].values[0]
-        print(f"[DEBUG] Correction factor K = {K}")
+        K = df_k[df_k["y/D or y/H"] == yD_match]["K"].iat[0]
+        log.debug("Correction factor K = %s", K)
 
         total_C = K * base_C
         pressure_loss = total_C * vp
 
-        print(f"[DEBUG] Final C = {total_C}, ΔP = {pressure_loss:.5f}")
+        log.debug("Final C = %s, ΔP = %.5f", total_C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -76,7 +80,7 @@ def A15H1_outputs(stored_values, data):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception during A15H1_outputs calculation: {e}")
+        log.error("Exception during A15H1_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
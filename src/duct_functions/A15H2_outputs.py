@@ -1,7 +1,12 @@
+import logging
 import math
 import pandas as pd
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A15H2_outputs(stored_values):
     """
     Calculates outputs for case A15H2 (Obstruction in Rectangular Duct with Protruding Elements).
@@ -17,11 +22,10 @@ def A15H2_outputs(stored_values):
     y = stored_values.get("entry_4")
     Q = stored_values.get("entry_5")
 
-    print("[DEBUG] Inputs:")
-    print(f"  H = {H}, L = {L}, d = {d}, y = {y}, Q = {Q}")
+    log.debug("Inputs: H = %s, L = %s, d = %s, y = %s, Q = %s", H, L, d, y, Q)
 
     if None in (H, L, d, y, Q):
-        print("[DEBUG] Missing required inputs.")
+        log.debug("Missing required inputs.")
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
@@ -44,7 +48,7 @@ def A15H2_outputs(stored_values):
         Sm_A = S_m / A
         y_H = y / H
 
-        print(f"[DEBUG] A = {A:.2f}, D_eq = {D_eq:.2f}, V = {V:.2f}, Re = {Re:.2f}, S_m/A = {Sm_A:.5f}, y/H = {y_H:.4f}")
+        log.debug("A = %.2f, D_eq = %.2f, V = %.2f, Re = %.2f, S_m/A = %.5f, y/H = %.4f", A, D_eq, V, Re, Sm_A, y_H)
 
         # --- Base C lookup (A15H1) ---
         Re_vals = sorted(base_table["Re"].unique())
@@ -53,26 +57,26 @@ def A15H2_outputs(stored_values):
         Re_match = max([v for v in Re_vals if v <= Re], default=min(Re_vals))
         SmA_match = min([v for v in SmA_vals if v >= Sm_A], default=max(SmA_vals))
 
-        print(f"[DEBUG] Matched Re = {Re_match}, S_m/A = {SmA_match}")
+        log.debug("Matched Re = %s, S_m/A = %s", Re_match, SmA_match)
 
         base_row = base_table[(base_table["Re"] == Re_match) & (base_table["S_m/A"] == SmA_match)]
         if base_row.empty:
             return {"Error": "No matching Re and S_m/A found in A15H1."}
 
-        base_C = base_row["C"].values[0]
-        print(f"[DEBUG] Base C = {base_C}")
+        base_C = base_row["C"].iat[0]
+        log.debug("Base C = %s", base_C)
 
         # --- Correction factor K lookup (A15H2) ---
         yH_vals = sorted(k_table["y/D or y/H"].unique())
         yH_match = max([v for v in yH_vals if v <= y_H], default=min(yH_vals))
 
-        K = k_table[k_table["y/D or y/H"] == yH_match]["K"].values[0]
-        print(f"[DEBUG] Correction factor K = {K}")
+        K = k_table[k_table["y/D or y/H"] == yH_match]["K"].iat[0]
+        log.debug("Correction factor K = %s", K)
 
         total_C = K * base_C
         pressure_loss = total_C * vp
 
-        print(f"[DEBUG] Final C = {total_C}, ΔP = {pressure_loss:.4f}")
+        log.debug("Final C = %s, ΔP = %.4f", total_C, pressure_loss)
 
         return {
             "Output 1: Velocity": V,
@@ -82,7 +86,7 @@ def A15H2_outputs(stored_values):
         }
 
     except Exception as e:
-        print(f"[ERROR] Exception during A15H2_outputs calculation: {e}")
+        log.error("Exception during A15H2_outputs calculation: %s", e)
         return {
             "Output 1: Velocity": None,
             "Output 2: Velocity Pressure": None,
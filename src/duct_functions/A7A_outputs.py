@@ -1,7 +1,31 @@
 import math
-import pandas as pd
+from functools import lru_cache
+
 import numpy as np
+import pandas as pd
 from data_access import get_case_table
+from _kernels import _RE_BINS, _RNCF_05, _RNCF_075, _VP_COEFF, a7_kernel
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
+
+
+@lru_cache(maxsize=None)
+def _a7a_tables():
+    """
+    Sorted (ANGLE, K) and (R/D, C) lookup arrays from the A7A table,
+    built once.
+    """
+    df = get_case_table("A7A")
+    df_angle = df[["ANGLE", "K"]].dropna().sort_values(by="ANGLE")
+    df_rd = df[["R/D", "C"]].dropna().sort_values(by="R/D")
+    return (
+        df_angle["ANGLE"].to_numpy(dtype=float),
+        df_angle["K"].to_numpy(dtype=float),
+        df_rd["R/D"].to_numpy(dtype=float),
+        df_rd["C"].to_numpy(dtype=float),
+    )
+
 
 def A7A_outputs(stored_values, *_):
     """
@@ -30,68 +54,75 @@ def A7A_outputs(stored_values, *_):
             "Output 4: Pressure Loss (in w.c.)": None,
         }
 
-    # Get the relevant data for A7A
-    df = get_case_table("A7A")
+    # Cached lookup arrays (built once)
+    angle_arr, k_arr, rd_arr, c_arr = _a7a_tables()
 
     # Calculate velocity
-    area = math.pi * (entry_1 / 2) ** 2  # Cross-sectional area in square inches
-    velocity = entry_4 / (area / 144)  # Velocity in ft/min
-
-    # Calculate correction factor (A7_k) based on angle
-    df_angle = df[["ANGLE", "K"]].dropna()
-    df_angle = df_angle.sort_values(by="ANGLE")
-    closest_angle_row = df_angle[df_angle["ANGLE"] >= entry_3].iloc[0]
-    correction_factor = closest_angle_row["K"]
-
-    # Calculate base loss coefficient (A7A_C) based on R/D
-    df_rd = df[["R/D", "C"]].dropna()
-    df_rd = df_rd.sort_values(by="R/D")
-    valid_rows = df_rd[df_rd["R/D"] <= entry_2]
-    closest_rd_row = valid_rows.iloc[-1]
-    loss_coefficient_base = closest_rd_row["C"]
-
-    # Calculate Reynolds Number Correction Factor (RNCF)
+    area = _PI_OVER_4 * entry_1 * entry_1  # Cross-sectional area in square inches
+    velocity = (entry_4 * 144.0) / area  # Velocity in ft/min
+
+    # Correction factor (A7_k): smallest table ANGLE >= the actual angle
+    ai = int(np.searchsorted(angle_arr, entry_3, side="left"))
+    if ai >= angle_arr.size:
+        raise IndexError(f"No ANGLE value greater than or equal to {entry_3}")
+    correction_factor = k_arr[ai]
+
+    # Base loss coefficient (A7A_C): largest table R/D <= the actual R/D
+    ri = int(np.searchsorted(rd_arr, entry_2, side="right")) - 1
+    if ri < 0:
+        raise IndexError(f"No R/D value less than or equal to {entry_2}")
+    loss_coefficient_base = c_arr[ri]
+
+    # Reynolds correction + pressure outputs (shared scalar kernel)
     reynolds_number = 8.5 * entry_1 * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
+    loss_coefficient, velocity_pressure, pressure_loss = a7_kernel(
+        velocity, reynolds_number, loss_coefficient_base * correction_factor, entry_2
+    )
 
-    if velocity < (23766.76 / equivalent_diameter):
-        # Define correction table
-        correction_table = pd.DataFrame(
-            {
-                "Re_10^4": [1, 2, 3, 4, 6, 8, 10, 14, 20],
-                "0.5": [1.40, 1.26, 1.19, 1.14, 1.09, 1.06, 1.04, 1.0, 1.0],
-                "0.75": [1.77, 1.64, 1.56, 1.46, 1.38, 1.30, 1.15, 1.0, 1.0],
-            }
-        ).set_index("Re_10^4")
+    # Return results as a dictionary
+    return {
+        "Output 1: Velocity": velocity,
+        "Output 2: Vel. Pres @ V0 (in w.c.)": velocity_pressure,
+        "Output 3: Loss Coefficient": loss_coefficient,
+        "Output 4: Pressure Loss (in w.c.)": pressure_loss,
+    }
 
-        # Normalize Reynolds number to 10^4 scale
-        re_scaled = reynolds_number / 1e4
 
-        # Find the closest R/D column
-        r_d_rounded = "0.5" if entry_2 <= 0.5 else "0.75"
+def A7A_outputs_batch(stored_values_df):
+    """
+    Vectorized A7A over many elbows at once.
 
-        # Find the closest Re in the correction table
-        closest_re = correction_table.index[
-            np.searchsorted(correction_table.index, re_scaled, side="right") - 1
-        ]
+    Takes a DataFrame with columns entry_1..entry_4 (one row per elbow,
+    same meaning as the scalar function) and returns a DataFrame with
+    the four output columns in one NumPy pass. Out-of-range angles and
+    R/D values clamp to the table edges instead of raising.
+    """
+    angle_arr, k_arr, rd_arr, c_arr = _a7a_tables()
 
-        rnc_factor = correction_table.loc[closest_re, r_d_rounded]
-    else:
-        rnc_factor = 1.0
+    D = stored_values_df["entry_1"].to_numpy(dtype=float)
+    rd = stored_values_df["entry_2"].to_numpy(dtype=float)
+    ang = stored_values_df["entry_3"].to_numpy(dtype=float)
+    Q = stored_values_df["entry_4"].to_numpy(dtype=float)
 
-    # Calculate combined loss coefficient
-    loss_coefficient = loss_coefficient_base * correction_factor * rnc_factor
+    area = _PI_OVER_4 * D * D
+    velocity = (Q * 144.0) / area
 
-    # Calculate velocity pressure
-    velocity_pressure = (velocity / 4005) ** 2
+    ai = np.minimum(np.searchsorted(angle_arr, ang, side="left"), angle_arr.size - 1)
+    ri = np.maximum(np.searchsorted(rd_arr, rd, side="right") - 1, 0)
+    base = c_arr[ri] * k_arr[ai]
 
-    # Calculate pressure loss
-    pressure_loss = loss_coefficient * velocity_pressure
+    # Reynolds correction (same binning as a7_kernel)
+    re_scaled = 8.5 * D * velocity / 1e4
+    bi = np.maximum(np.searchsorted(_RE_BINS, re_scaled, side="right") - 1, 0)
+    rnc_factor = np.where(rd <= 0.5, _RNCF_05[bi], _RNCF_075[bi])
+    rnc_factor = np.where(velocity > 1.0, rnc_factor, 1.0)
 
-    # Return results as a dictionary
-    return {
+    loss_coefficient = base * rnc_factor
+    velocity_pressure = velocity * velocity * _VP_COEFF
+
+    return pd.DataFrame({
         "Output 1: Velocity": velocity,
         "Output 2: Vel. Pres @ V0 (in w.c.)": velocity_pressure,
         "Output 3: Loss Coefficient": loss_coefficient,
-        "Output 4: Pressure Loss (in w.c.)": pressure_loss,
-    }
\ No newline at end of file
+        "Output 4: Pressure Loss (in w.c.)": loss_coefficient * velocity_pressure,
+    })
@@ -1,25 +1,43 @@
 import math
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
 
 def build_a7a_interpolators(data):
     """
-    Builds interpolation functions for A7A based on R/D → C and ANGLE → K.
+    Builds interpolation tables for A7A: sorted (R/D, C) and (ANGLE, K)
+    numpy arrays for np.interp.
     """
     if "A7A" not in data.index:
         raise KeyError("Data must include 'A7A' index for calculations.")
     df = data.loc["A7A"]
 
-    # Interpolator for R/D → C
-    df_rd = df[["R/D", "C"]].dropna()
-    interp_C = interp1d(df_rd["R/D"], df_rd["C"], fill_value="extrapolate")
+    # Table for R/D → C
+    df_rd = df[["R/D", "C"]].dropna().sort_values(by="R/D")
+
+    # Table for ANGLE → K
+    df_angle = df[["ANGLE", "K"]].dropna().sort_values(by="ANGLE")
+
+    return (
+        df_rd["R/D"].to_numpy(dtype=float),
+        df_rd["C"].to_numpy(dtype=float),
+        df_angle["ANGLE"].to_numpy(dtype=float),
+        df_angle["K"].to_numpy(dtype=float),
+    )
+
+# Interpolation tables per data frame, keyed on id() since DataFrames
+# aren't hashable. The GUI loads one master table, so this holds one entry.
+_table_cache = {}
 
-    # Interpolator for ANGLE → K
-    df_angle = df[["ANGLE", "K"]].dropna()
-    interp_K = interp1d(df_angle["ANGLE"], df_angle["K"], fill_value="extrapolate")
 
-    return interp_C, interp_K
+def _tables_for(data):
+    key = id(data)
+    if key not in _table_cache:
+        _table_cache[key] = build_a7a_interpolators(data)
+    return _table_cache[key]
+
 
 def A7A_outputs(stored_values, data, interpolators=None):
     """
@@ -28,7 +46,7 @@ def A7A_outputs(stored_values, data, interpolators=None):
     Parameters:
     - stored_values: dict of user inputs
     - data: DataFrame containing A7A data
-    - interpolators: (optional) prebuilt (interp_C, interp_K)
+    - interpolators: (optional) prebuilt (xp_rd, fp_C, xp_angle, fp_K) arrays
 
     Returns:
     - dict of calculated outputs
@@ -40,31 +58,29 @@ def A7A_outputs(stored_values, data, interpolators=None):
     entry_4 = stored_values.get("entry_4")  # Flow rate (cfm)
 
     # Check inputs
-    if not all([entry_1, entry_2, entry_3, entry_4]):
+    # is-None checks so a zero entry isn't treated as missing
+    if entry_1 is None or entry_2 is None or entry_3 is None or entry_4 is None:
         return {f"Output {i+1}": None for i in range(4)}
 
-    # Load interpolators if needed
+    # Load interpolation tables if needed (cached per data frame)
     if interpolators is None:
-        interp_C, interp_K = build_a7a_interpolators(data)
-    else:
-        interp_C, interp_K = interpolators
+        interpolators = _tables_for(data)
+    xp_rd, fp_C, xp_angle, fp_K = interpolators
 
     # Calculate velocity
-    area = math.pi * (entry_1 / 2) ** 2  # in²
-    velocity = entry_4 / (area / 144)    # ft/min
+    area = _PI_OVER_4 * entry_1 * entry_1  # in²
+    velocity = (entry_4 * 144.0) / area   # ft/min
 
-    # Interpolate C and K
-    C_base = interp_C(entry_2)
-    K_correction = interp_K(entry_3)
+    # Interpolate C and K (clamped at the table edges)
+    C_base = np.interp(entry_2, xp_rd, fp_C)
+    K_correction = np.interp(entry_3, xp_angle, fp_K)
 
     # Reynolds Number
     reynolds_number = 8.5 * entry_1 * velocity
 
-    # Equivalent diameter (for Reynolds Correction Factor logic)
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
-
-    # Determine if RNCF correction is needed
-    if velocity < (23766.76 / equivalent_diameter):
+    # Determine if RNCF correction is needed (the historical
+    # equivalent-diameter guard reduces to velocity > 1)
+    if velocity > 1.0:
         # RNCF hardcoded simple lookup
         correction_table = pd.DataFrame(
             {
@@ -1,7 +1,29 @@
 import math
-import pandas as pd
+from functools import lru_cache
+
 import numpy as np
 from data_access import get_case_table
+from _kernels import a7_kernel
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
+
+
+@lru_cache(maxsize=None)
+def _a7b_tables():
+    """
+    Pre-grouped A7B lookup: sorted unique R/D values plus, per R/D,
+    sorted # pieces and C arrays (built once).
+    """
+    df = get_case_table("A7B")[["R/D", "# pieces", "C"]].dropna()
+    df = df.sort_values(by=["R/D", "# pieces"])
+    rd_keys = np.sort(df["R/D"].unique())
+    groups = {
+        rd: (sub["# pieces"].to_numpy(dtype=float), sub["C"].to_numpy(dtype=float))
+        for rd, sub in df.groupby("R/D")
+    }
+    return rd_keys, groups
+
 
 def A7B_outputs(stored_values, *_):
     """
@@ -24,59 +46,36 @@ def A7B_outputs(stored_values, *_):
             "Output 4: Pressure Loss (in w.c.)": None,
         }
 
-    # Get the relevant data for A7B
-    df = get_case_table("A7B")
-
     # Calculate velocity
-    area = math.pi * (entry_1 / 2) ** 2  # Cross-sectional area in square inches
-    velocity = entry_4 / (area / 144)    # Velocity in ft/min
+    area = _PI_OVER_4 * entry_1 * entry_1  # Cross-sectional area in square inches
+    velocity = (entry_4 * 144.0) / area  # Velocity in ft/min
 
-    # Calculate Reynolds Number Correction Factor (RNCF)
     reynolds_number = 8.5 * entry_1 * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
 
-    if velocity < (23766.76 / equivalent_diameter):
-        correction_table = pd.DataFrame(
-            {
-                "Re_10^4": [1, 2, 3, 4, 6, 8, 10, 14, 20],
-                "0.5": [1.40, 1.26, 1.19, 1.14, 1.09, 1.06, 1.04, 1.0, 1.0],
-                "0.75": [1.77, 1.64, 1.56, 1.46, 1.38, 1.30, 1.15, 1.0, 1.0],
-            }
-        ).set_index("Re_10^4")
-
-        re_scaled = reynolds_number / 1e4
-        r_d_rounded = "0.5" if entry_2 <= 0.5 else "0.75"
-
-        closest_re = correction_table.index[
-            np.searchsorted(correction_table.index, re_scaled, side="right") - 1
-        ]
-        rnc_factor = correction_table.loc[closest_re, r_d_rounded]
-    else:
-        rnc_factor = 1.0
-
-    # Find closest R/D and #pieces in table
-    df_rd_pieces = df[["R/D", "# pieces", "C"]].dropna().sort_values(by=["R/D", "# pieces"])
-
-    valid_rd_rows = df_rd_pieces[df_rd_pieces["R/D"] <= entry_2]
-    if valid_rd_rows.empty:
+    # Find closest R/D and # pieces via the pre-grouped cached table.
+    # Like the old row scan, fall back to smaller R/D groups until one
+    # contains a # pieces value at or below the requested count.
+    rd_keys, groups = _a7b_tables()
+    i = int(np.searchsorted(rd_keys, entry_2, side="right")) - 1
+    if i < 0:
         raise ValueError(f"No valid R/D value less than or equal to {entry_2}")
-    closest_rd_row = valid_rd_rows.iloc[-1]
 
-    valid_pieces_rows = valid_rd_rows[valid_rd_rows["# pieces"] <= entry_3]
-    if valid_pieces_rows.empty:
-        raise ValueError(f"No valid # pieces value less than or equal to {entry_3}")
-    closest_pieces_row = valid_pieces_rows.iloc[-1]
-
-    loss_coefficient_base = closest_pieces_row["C"]
+    loss_coefficient_base = None
+    while i >= 0:
+        pieces_arr, c_arr = groups[rd_keys[i]]
+        j = int(np.searchsorted(pieces_arr, entry_3, side="right")) - 1
+        if j >= 0:
+            loss_coefficient_base = c_arr[j]
+            break
+        i -= 1
 
-    # Final coefficient with RNCF
-    loss_coefficient = loss_coefficient_base * rnc_factor
-
-    # Velocity pressure
-    velocity_pressure = (velocity / 4005) ** 2
+    if loss_coefficient_base is None:
+        raise ValueError(f"No valid # pieces value less than or equal to {entry_3}")
 
-    # Pressure loss
-    pressure_loss = loss_coefficient * velocity_pressure
+    # Reynolds correction + pressure outputs (shared scalar kernel)
+    loss_coefficient, velocity_pressure, pressure_loss = a7_kernel(
+        velocity, reynolds_number, loss_coefficient_base, entry_2
+    )
 
     return {
         "Output 1: Velocity": velocity,
@@ -2,6 +2,20 @@ import math
 import pandas as pd
 import numpy as np
 
+# Case slice per data frame, keyed on id() since DataFrames aren't
+# hashable. The GUI loads one master table, so this holds one entry.
+_table_cache = {}
+
+
+def _a7b_table(data):
+    key = id(data)
+    if key not in _table_cache:
+        if "A7B" not in data.index:
+            raise KeyError("Data must include 'A7B' index for calculations.")
+        _table_cache[key] = data.loc["A7B"]
+    return _table_cache[key]
+
+
 def A7B_outputs(stored_values, data):
     """
     Calculates the outputs for case A7B using the stored input values, including
@@ -24,10 +38,8 @@ def A7B_outputs(stored_values, data):
     if not all([entry_1, entry_2, entry_3, entry_4]):
         return {f"Output {i+1}": None for i in range(4)}
 
-    # Ensure `data` contains the necessary index
-    if "A7B" not in data.index:
-        raise KeyError("Data must include 'A7B' index for calculations.")
-    df = data.loc["A7B"]
+    # Case slice cached per data frame
+    df = _a7b_table(data)
 
     # Calculate velocity
     area = math.pi((entry_1/2)**2) / 144  # Area in square feet
@@ -36,10 +48,11 @@ def A7B_outputs(stored_values, data):
     # Calculate Reynolds number and equivalent diameter
     hydraulic_diameter = 2 * (entry_1 * entry_2) / (entry_1 + entry_2)  # ft
     reynolds_number = 8.5 * hydraulic_diameter * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
 
-    # Determine if RNCF is applicable
-    if velocity < (23766.76 / equivalent_diameter):
+    # Determine if RNCF is applicable. The historical guard
+    # V < 23766.76 / (23766.76 * V**-1.000794) reduces to V < V**1.000794,
+    # i.e. V > 1 for positive velocities, so the pow is never needed.
+    if velocity > 1.0:
         # Define correction table
         correction_table = pd.DataFrame(
             {
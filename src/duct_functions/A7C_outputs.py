@@ -1,7 +1,10 @@
 import math
-import pandas as pd
-import numpy as np
+
 from data_access import get_case_table
+from _kernels import a7_kernel
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
 
 def A7C_outputs(stored_values, *_):
     """
@@ -20,51 +23,28 @@ def A7C_outputs(stored_values, *_):
     entry_2 = stored_values.get("entry_2")  # Angle (degrees)
     entry_3 = stored_values.get("entry_3")  # Flow Rate
 
-    if not all([entry_1, entry_2, entry_3]):
+    # is-None checks so a zero entry isn't treated as missing
+    if entry_1 is None or entry_2 is None or entry_3 is None:
         return {f"Output {i+1}": None for i in range(4)}
 
     # Get the relevant data for A7C
     df = get_case_table("A7C")
 
     # Calculate velocity
-    area = math.pi * (entry_1 / 2) ** 2  # Area in square inches
-    velocity = entry_3 / (area / 144)  # Velocity in ft/min
+    area = _PI_OVER_4 * entry_1 * entry_1  # Area in square inches
+    velocity = (entry_3 * 144.0) / area  # Velocity in ft/min
 
-    # Calculate Reynolds number and equivalent diameter
     reynolds_number = 8.5 * entry_1 * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
-
-    # Determine if RNCF is applicable
-    if velocity < (23766.76 / equivalent_diameter):
-        # Define correction table
-        correction_table = pd.DataFrame(
-            {
-                "Re_10^4": [1, 2, 3, 4, 6, 8, 10, 14, 20],
-                "0.5": [1.40, 1.26, 1.19, 1.14, 1.09, 1.06, 1.04, 1.0, 1.0],
-            }
-        ).set_index("Re_10^4")
-
-        # Normalize Reynolds number to 10^4 scale
-        re_scaled = reynolds_number / 1e4
-
-        # Find the closest Re in the correction table
-        closest_re = correction_table.index[
-            np.searchsorted(correction_table.index, re_scaled, side="right") - 1
-        ]
-
-        rnc_factor = correction_table.loc[closest_re, "0.5"]
-    else:
-        rnc_factor = 1.0
 
     # Loss coefficient calculation
     angle_data = df[["ANGLE", "C"]].dropna().sort_values(by="ANGLE")
     closest_angle_row = angle_data.iloc[(angle_data["ANGLE"] - entry_2).abs().argmin()]
     loss_coefficient_base = closest_angle_row["C"]
 
-    # Final calculations
-    loss_coefficient = loss_coefficient_base * rnc_factor
-    velocity_pressure = (velocity / 4005) ** 2
-    pressure_loss = loss_coefficient * velocity_pressure
+    # Reynolds correction + pressure outputs (shared scalar kernel)
+    loss_coefficient, velocity_pressure, pressure_loss = a7_kernel(
+        velocity, reynolds_number, loss_coefficient_base, 0.5
+    )
 
     return {
         "Output 1: Velocity": velocity,
@@ -1,24 +1,36 @@
 import math
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
 
 def build_a7c_interpolator(data):
     """
-    Builds interpolation function for A7C (Angle → C).
+    Builds interpolation table for A7C (Angle → C) as sorted numpy
+    arrays for np.interp.
     """
     if "A7C" not in data.index:
         raise KeyError("Data must include 'A7C' index for calculations.")
     df = data.loc["A7C"]
 
-    df_angle = df[["ANGLE", "C"]].dropna()
-    interp_C = interp1d(
-        df_angle["ANGLE"],
-        df_angle["C"],
-        kind="linear",
-        fill_value="extrapolate"
+    df_angle = df[["ANGLE", "C"]].dropna().sort_values(by="ANGLE")
+    return (
+        df_angle["ANGLE"].to_numpy(dtype=float),
+        df_angle["C"].to_numpy(dtype=float),
     )
-    return interp_C
+
+# Interpolation table per data frame, keyed on id() since DataFrames
+# aren't hashable. The GUI loads one master table, so this holds one entry.
+_table_cache = {}
+
+
+def _tables_for(data):
+    key = id(data)
+    if key not in _table_cache:
+        _table_cache[key] = build_a7c_interpolator(data)
+    return _table_cache[key]
+
 
 def A7C_outputs(stored_values, data, interpolator=None):
     """
@@ -30,25 +42,25 @@ def A7C_outputs(stored_values, data, interpolator=None):
     entry_2 = stored_values.get("entry_2")  # Angle (deg)
     entry_3 = stored_values.get("entry_3")  # Flow Rate (cfm)
 
-    if not all([entry_1, entry_2, entry_3]):
+    # is-None checks so a zero entry isn't treated as missing
+    if entry_1 is None or entry_2 is None or entry_3 is None:
         return {f"Output {i+1}": None for i in range(4)}
 
-    # Load interpolator if needed
+    # Load interpolation table if needed (cached per data frame)
     if interpolator is None:
-        interp_C = build_a7c_interpolator(data)
-    else:
-        interp_C = interpolator
+        interpolator = _tables_for(data)
+    xp_angle, fp_C = interpolator
 
     # Calculate velocity
-    area = math.pi * (entry_1 / 2) ** 2  # in²
-    velocity = entry_3 / (area / 144)    # ft/min
+    area = _PI_OVER_4 * entry_1 * entry_1  # in²
+    velocity = (entry_3 * 144.0) / area   # ft/min
 
     # Reynolds number
     reynolds_number = 8.5 * entry_1 * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
 
-    # RNCF correction
-    if velocity < (23766.76 / equivalent_diameter):
+    # RNCF correction (the historical equivalent-diameter guard
+    # reduces to velocity > 1)
+    if velocity > 1.0:
         correction_table = pd.DataFrame(
             {
                 "Re_10^4": [1, 2, 3, 4, 6, 8, 10, 14, 20],
@@ -65,9 +77,9 @@ def A7C_outputs(stored_values, data, interpolator=None):
     else:
         rnc_factor = 1.0
 
-    # Interpolate base loss coefficient
-    C_base = interp_C(entry_2)
-    if C_base is None or np.isnan(C_base):
+    # Interpolate base loss coefficient (clamped at the table edges)
+    C_base = np.interp(entry_2, xp_angle, fp_C)
+    if np.isnan(C_base):
         return {f"Output {i+1}": None for i in range(4)}
 
     # Final combined loss coefficient
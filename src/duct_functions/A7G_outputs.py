@@ -39,10 +39,11 @@ def A7G_outputs(stored_values, *_):
 
     # Calculate Reynolds number and equivalent diameter
     reynolds_number = 8.5 * hydraulic_diameter * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
 
-    # Determine if RNCF is applicable
-    if velocity < (23766.76 / equivalent_diameter):
+    # Determine if RNCF is applicable. The historical guard
+    # V < 23766.76 / (23766.76 * V**-1.000794) reduces to V < V**1.000794,
+    # i.e. V > 1 for positive velocities, so the pow is never needed.
+    if velocity > 1.0:
         # Define correction table
         correction_table = pd.DataFrame(
             {
@@ -1,7 +1,20 @@
-import math
-import pandas as pd
 import numpy as np
-from data_access import get_case_table
+from data_access import get_case_curve
+from _kernels import (
+    _RE_BINS,
+    _RNCF_05,
+    _VP_COEFF,
+    a7_straight_case_outputs,
+    lookup_ge,
+    lookup_le,
+    rect_area_ft2,
+)
+
+
+def _a7i_tables():
+    """Sorted (L/H, C) and (W/H, C) lookup arrays from the A7I table (cached in data_access)."""
+    return get_case_curve("A7I", "L/H", "C") + get_case_curve("A7I", "W/H", "C")
+
 
 def A7I_outputs(stored_values, *_):
     """
@@ -21,91 +34,97 @@ def A7I_outputs(stored_values, *_):
     entry_3 = stored_values.get("entry_3")  # L (Length)
     entry_4 = stored_values.get("entry_4")  # Flow Rate (CFM)
 
-    # Validate inputs
-    if not all([entry_1, entry_2, entry_3, entry_4]):
-        return {f"Output {i+1}": None for i in range(4)}
-
-    # Get the relevant data for A7I
-    df = get_case_table("A7I")
+    # Ensure all required inputs are available
+    if entry_1 is None or entry_2 is None or entry_3 is None or entry_4 is None:
+        return {
+            "Output 1: Velocity": None,
+            "Output 2: Vel. Pres @ V0 (in w.c.)": None,
+            "Output 3: Loss Coefficient": None,
+            "Output 4: Pressure Loss (in w.c.)": None,
+        }
 
     # Calculate velocity
-    area = (entry_1 * entry_2) / 144  # Area in square feet
+    area = rect_area_ft2(entry_1, entry_2)  # Area in square feet
     velocity = entry_4 / area  # Velocity in ft/min
 
     # Calculate hydraulic diameter
     hydraulic_diameter = 2 * (entry_1 * entry_2) / (entry_1 + entry_2)  # Hydraulic diameter in ft
 
-    # Calculate Reynolds number and equivalent diameter
+    # Calculate Reynolds number
     reynolds_number = 8.5 * hydraulic_diameter * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
-
-    # Determine if RNCF is applicable
-    if velocity < (23766.76 / equivalent_diameter):
-        # Define correction table
-        correction_table = pd.DataFrame(
-            {
-                "Re_10^4": [1, 2, 3, 4, 6, 8, 10, 14, 20],
-                "0.5": [1.40, 1.26, 1.19, 1.14, 1.09, 1.06, 1.04, 1.0, 1.0],
-            }
-        ).set_index("Re_10^4")
-
-        # Normalize Reynolds number to 10^4 scale
-        re_scaled = reynolds_number / 1e4
-
-        # Find the closest Re in the correction table
-        closest_re = correction_table.index[
-            np.searchsorted(correction_table.index, re_scaled, side="right") - 1
-        ]
-
-        rnc_factor = correction_table.loc[closest_re, "0.5"]
-    else:
-        rnc_factor = 1.0
 
     # Calculate L/H and W/H ratios
     l_h_ratio = entry_3 / entry_1
     w_h_ratio = entry_2 / entry_1
 
-    # Loss coefficient calculation
-    if "L/H" not in df.columns or "C" not in df.columns or "W/H" not in df.columns:
-        raise KeyError("Data for A7I must include 'L/H', 'C', and 'W/H' columns.")
+    # Cached lookup arrays (built once)
+    lh_xs, lh_cs, wh_xs, wh_cs = _a7i_tables()
 
-    # Match L/H ratio
-    lh_data = df[["L/H", "C"]].dropna().sort_values(by="L/H")
+    # Match L/H ratio: round down for short ramps, round up past L/H = 2
     if l_h_ratio <= 2:
-        valid_lh = lh_data[lh_data["L/H"] <= l_h_ratio]
-        if valid_lh.empty:
-            closest_lh_row = lh_data.iloc[0]  # Use the smallest L/H if none match
-        else:
-            closest_lh_row = valid_lh.iloc[-1]  # Use the largest L/H less than or equal to l_h_ratio
-    else:
-        valid_lh = lh_data[lh_data["L/H"] >= l_h_ratio]
-        if valid_lh.empty:
-            closest_lh_row = lh_data.iloc[-1]  # Use the largest L/H if none match
-        else:
-            closest_lh_row = valid_lh.iloc[0]  # Use the smallest L/H greater than or equal to l_h_ratio
-
-    # Retrieve the base loss coefficient
-    loss_coefficient_base = closest_lh_row["C"]
-
-    # Match W/H ratio for additional correction factor
-    wh_data = df[["W/H", "C"]].dropna().sort_values(by="W/H")
-    valid_wh = wh_data[wh_data["W/H"] <= w_h_ratio]
-    if valid_wh.empty:
-        closest_wh_row = wh_data.iloc[0]  # Use the smallest W/H if none match
+        loss_coefficient_base = lookup_le(lh_xs, lh_cs, l_h_ratio)
     else:
-        closest_wh_row = valid_wh.iloc[-1]  # Use the largest W/H less than or equal to w_h_ratio
+        loss_coefficient_base = lookup_ge(lh_xs, lh_cs, l_h_ratio)
 
-    # Retrieve the correction factor from W/H
-    wh_correction_factor = closest_wh_row["C"]
+    # Match W/H ratio for the additional correction factor (round down)
+    wh_correction_factor = lookup_le(wh_xs, wh_cs, w_h_ratio)
 
-    # Final calculations
-    loss_coefficient = loss_coefficient_base * wh_correction_factor * rnc_factor
-    velocity_pressure = (velocity / 4005) ** 2
-    pressure_loss = loss_coefficient * velocity_pressure
+    # Reynolds correction + pressure outputs (shared finalizer)
+    res = a7_straight_case_outputs(
+        velocity, reynolds_number, loss_coefficient_base * wh_correction_factor
+    )
 
     return {
+        "Output 1: Velocity": res.velocity,
+        "Output 2: Vel. Pres @ V0 (in w.c.)": res.velocity_pressure,
+        "Output 3: Loss Coefficient": res.loss_coefficient,
+        "Output 4: Pressure Loss (in w.c.)": res.pressure_loss,
+    }
+
+
+def A7I_outputs_batch(stored_values_df):
+    """
+    Vectorized A7I over many ramps at once.
+
+    Takes a DataFrame with columns entry_1..entry_4 (one row per case,
+    same meaning as the scalar function) and returns a DataFrame with
+    the four output columns in one NumPy pass.
+    """
+    import pandas as pd  # deferred: only the batch path builds a DataFrame
+
+    lh_xs, lh_cs, wh_xs, wh_cs = _a7i_tables()
+
+    H = stored_values_df["entry_1"].to_numpy(dtype=float)
+    W = stored_values_df["entry_2"].to_numpy(dtype=float)
+    L = stored_values_df["entry_3"].to_numpy(dtype=float)
+    Q = stored_values_df["entry_4"].to_numpy(dtype=float)
+
+    area = (H * W) / 144.0
+    velocity = Q / area
+    hydraulic_diameter = 2.0 * H * W / (H + W)
+    reynolds_number = 8.5 * hydraulic_diameter * velocity
+
+    # L/H: round down at or below 2, round up past it (clamped at the edges)
+    lh_ratio = L / H
+    i_le = np.maximum(np.searchsorted(lh_xs, lh_ratio, side="right") - 1, 0)
+    i_ge = np.minimum(np.searchsorted(lh_xs, lh_ratio, side="left"), lh_xs.size - 1)
+    base = np.where(lh_ratio <= 2, lh_cs[i_le], lh_cs[i_ge])
+
+    # W/H correction factor (round down, clamped low)
+    wi = np.maximum(np.searchsorted(wh_xs, W / H, side="right") - 1, 0)
+    base = base * wh_cs[wi]
+
+    # Reynolds correction (same binning and low-Re gate as a7_straight_kernel)
+    re_scaled = reynolds_number / 1e4
+    bi = np.maximum(np.searchsorted(_RE_BINS, re_scaled, side="right") - 1, 0)
+    rnc_factor = np.where(re_scaled < 14.0, _RNCF_05[bi], 1.0)
+
+    loss_coefficient = base * rnc_factor
+    velocity_pressure = velocity * velocity * _VP_COEFF
+
+    return pd.DataFrame({
         "Output 1: Velocity": velocity,
         "Output 2: Vel. Pres @ V0 (in w.c.)": velocity_pressure,
         "Output 3: Loss Coefficient": loss_coefficient,
-        "Output 4: Pressure Loss (in w.c.)": pressure_loss,
-    }
+        "Output 4: Pressure Loss (in w.c.)": loss_coefficient * velocity_pressure,
+    })
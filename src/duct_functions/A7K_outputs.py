@@ -1,7 +1,21 @@
 import math
-import pandas as pd
+
 import numpy as np
-from data_access import get_case_table
+from data_access import get_case_curve
+from _kernels import (
+    _RE_BINS,
+    _RNCF_05,
+    _VP_COEFF,
+    a7_straight_case_outputs,
+    lookup_ge,
+    round_area_ft2,
+)
+
+
+def _a7k_tables():
+    """Sorted (L/D, C) lookup arrays from the A7K table (cached in data_access)."""
+    return get_case_curve("A7K", "L/D", "C")
+
 
 def A7K_outputs(stored_values, *_):
     """
@@ -20,73 +34,75 @@ def A7K_outputs(stored_values, *_):
     entry_2 = stored_values.get("entry_2")  # Length
     entry_3 = stored_values.get("entry_3")  # Flow Rate
 
-    # Validate inputs
-    if not all([entry_1, entry_2, entry_3]):
-        return {f"Output {i+1}": None for i in range(4)}
-
-    # Get the relevant data for A7K
-    df = get_case_table("A7K")
+    # Ensure all required inputs are available
+    if entry_1 is None or entry_2 is None or entry_3 is None:
+        return {
+            "Output 1: Velocity": None,
+            "Output 2: Vel. Pres @ V0 (in w.c.)": None,
+            "Output 3: Loss Coefficient": None,
+            "Output 4: Pressure Loss (in w.c.)": None,
+        }
 
-    # Calculate velocity
-    area = math.pi * (entry_1 / 2) ** 2  # Cross-sectional area in square inches
-    velocity = entry_3 / (area / 144)  # Velocity in ft/min
+    # Calculate velocity from the folded-constant area (π/576 · D², ft²)
+    velocity = entry_3 / round_area_ft2(entry_1)  # Velocity in ft/min
 
-    # Calculate Reynolds number and equivalent diameter
+    # Calculate Reynolds number
     reynolds_number = 8.5 * entry_1 * velocity
-    equivalent_diameter = 23766.76 * (velocity ** -1.000794)
-
-    # Determine if RNCF is applicable
-    if velocity < (23766.76 / equivalent_diameter):
-        # Define correction table
-        correction_table = pd.DataFrame(
-            {
-                "Re_10^4": [1, 2, 3, 4, 6, 8, 10, 14, 20],
-                "0.5": [1.40, 1.26, 1.19, 1.14, 1.09, 1.06, 1.04, 1.0, 1.0],
-            }
-        ).set_index("Re_10^4")
-
-        # Normalize Reynolds number to 10^4 scale
-        re_scaled = reynolds_number / 1e4
-
-        # Find the closest Re in the correction table
-        closest_re = correction_table.index[
-            np.searchsorted(correction_table.index, re_scaled, side="right") - 1
-        ]
-
-        rnc_factor = correction_table.loc[closest_re, "0.5"]
-    else:
-        rnc_factor = 1.0
 
     # Calculate Length/Diameter ratio (L/D)
     length_diameter_ratio = entry_2 / entry_1
 
-    # Loss coefficient calculation
-    if "L/D" not in df.columns or "C" not in df.columns:
-        raise KeyError("Data for A7K must include 'L/D' and 'C' columns.")
+    # Cached lookup arrays (built once): smallest L/D >= the ratio,
+    # or the largest table value if none match
+    ld_xs, ld_cs = _a7k_tables()
+    loss_coefficient_base = lookup_ge(ld_xs, ld_cs, length_diameter_ratio)
 
-    # Extract L/D and C data from the DataFrame
-    ld_data = df[["L/D", "C"]].dropna().sort_values(by="L/D")
+    # Reynolds correction + pressure outputs (shared finalizer)
+    res = a7_straight_case_outputs(velocity, reynolds_number, loss_coefficient_base)
 
-    # Find the smallest L/D value greater than or equal to length_diameter_ratio
-    valid_ld = ld_data[ld_data["L/D"] >= length_diameter_ratio]
-    if valid_ld.empty:
-        # If no L/D value is greater than or equal, use the largest available L/D
-        closest_ld_row = ld_data.iloc[-1]
-    else:
-        # Use the first row in the filtered data
-        closest_ld_row = valid_ld.iloc[0]
+    return {
+        "Output 1: Velocity": res.velocity,
+        "Output 2: Vel. Pres @ V0 (in w.c.)": res.velocity_pressure,
+        "Output 3: Loss Coefficient": res.loss_coefficient,
+        "Output 4: Pressure Loss (in w.c.)": res.pressure_loss,
+    }
 
-    # Retrieve the corresponding C value
-    loss_coefficient_base = closest_ld_row["C"]
 
-    # Final calculations
-    loss_coefficient = loss_coefficient_base * rnc_factor
-    velocity_pressure = (velocity / 4005) ** 2
-    pressure_loss = loss_coefficient * velocity_pressure
+def A7K_outputs_batch(stored_values_df):
+    """
+    Vectorized A7K over many ducts at once.
 
-    return {
+    Takes a DataFrame with columns entry_1..entry_3 (one row per case,
+    same meaning as the scalar function) and returns a DataFrame with
+    the four output columns in one NumPy pass.
+    """
+    import pandas as pd  # deferred: only the batch path builds a DataFrame
+
+    ld_xs, ld_cs = _a7k_tables()
+
+    D = stored_values_df["entry_1"].to_numpy(dtype=float)
+    L = stored_values_df["entry_2"].to_numpy(dtype=float)
+    Q = stored_values_df["entry_3"].to_numpy(dtype=float)
+
+    area = (math.pi * 0.25) * D * D
+    velocity = (Q * 144.0) / area
+    reynolds_number = 8.5 * D * velocity
+
+    # L/D: smallest table value at or above the ratio (clamped high)
+    li = np.minimum(np.searchsorted(ld_xs, L / D, side="left"), ld_xs.size - 1)
+    base = ld_cs[li]
+
+    # Reynolds correction (same binning and low-Re gate as a7_straight_kernel)
+    re_scaled = reynolds_number / 1e4
+    bi = np.maximum(np.searchsorted(_RE_BINS, re_scaled, side="right") - 1, 0)
+    rnc_factor = np.where(re_scaled < 14.0, _RNCF_05[bi], 1.0)
+
+    loss_coefficient = base * rnc_factor
+    velocity_pressure = velocity * velocity * _VP_COEFF
+
+    return pd.DataFrame({
         "Output 1: Velocity": velocity,
         "Output 2: Vel. Pres @ V0 (in w.c.)": velocity_pressure,
         "Output 3: Loss Coefficient": loss_coefficient,
-        "Output 4: Pressure Loss (in w.c.)": pressure_loss,
-    }
+        "Output 4: Pressure Loss (in w.c.)": loss_coefficient * velocity_pressure,
+    })
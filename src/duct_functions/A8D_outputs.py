@@ -1,8 +1,13 @@
+import logging
 import math
 import pandas as pd
 import numpy as np
 from data_access import get_case_table
 
+
+log = logging.getLogger(__name__)
+
+
 def A8D_outputs(stored_values, *_):
     """
     Calculates the outputs for case A8D (Rectangular to Round Contraction).
@@ -40,7 +45,7 @@ def A8D_outputs(stored_values, *_):
         tan_half_theta = (entry_3 - 1.13 * math.sqrt(entry_1 * entry_2)) / (2 * entry_4)
         theta_deg = math.degrees(2 * math.atan(tan_half_theta))
     except (ZeroDivisionError, ValueError) as e:
-        print(f"[ERROR] Invalid angle calculation: {e}")
+        log.error("Invalid angle calculation: %s", e)
         return {f"Output {i+1}": None for i in range(4)}
 
     # Area ratio A₁/A
@@ -1,7 +1,24 @@
 import math
-import pandas as pd
+
 import numpy as np
-from data_access import get_case_table
+from data_access import get_case_curve
+from _kernels import (
+    _VP_COEFF,
+    lookup_le,
+    rect_area_ft2,
+    round_area_ft2,
+    standard_case_outputs,
+)
+
+# Human-readable area-mismatch message; the GUI shows it verbatim, so the
+# scalar API keeps returning it (the batch API reports a plain boolean).
+A9C_FLAG_MESSAGE = "Area of round section exceeds area of rectangular section"
+
+
+def _a9c_tables():
+    """Sorted (Re, C) lookup arrays from the A9C table (cached in data_access)."""
+    return get_case_curve("A9C", "Re", "C")
+
 
 def A9C_outputs(stored_values, *_):
     """
@@ -20,19 +37,22 @@ def A9C_outputs(stored_values, *_):
     entry_3 = stored_values.get("entry_3")  # W₁ (Width of rectangular section)
     entry_4 = stored_values.get("entry_4")  # Flow Rate (CFM)
 
-    # Validate inputs
-    if not all([entry_1, entry_2, entry_3, entry_4]):
-        return {f"Output {i+1}": None for i in range(5)}
-
-    # Get the relevant data for A9C
-    df = get_case_table("A9C")
+    # Ensure all required inputs are available
+    if entry_1 is None or entry_2 is None or entry_3 is None or entry_4 is None:
+        return {
+            "Output 1: Velocity": None,
+            "Output 2: Vel. Pres @ V0 (in w.c.)": None,
+            "Output 3: Loss Coefficient": None,
+            "Output 4: Pressure Loss (in w.c.)": None,
+            "Flag": None,
+        }
 
     # Calculate cross-sectional areas
-    area_round = math.pi * (entry_1 / 2) ** 2 / 144  # Area of round section in square feet
-    area_rect = (entry_2 * entry_3) / 144  # Area of rectangular section in square feet
+    area_round = round_area_ft2(entry_1)  # Area of round section in square feet
+    area_rect = rect_area_ft2(entry_2, entry_3)  # Area of rectangular section in square feet
 
     # Check for area mismatch (flag condition)
-    area_flag = "Area of round section exceeds area of rectangular section" if area_round > area_rect else None
+    area_flag = A9C_FLAG_MESSAGE if area_round > area_rect else None
 
     # Calculate velocity using rectangular section (H₁ and W₁)
     velocity = entry_4 / area_rect  # Velocity in ft/min
@@ -40,30 +60,58 @@ def A9C_outputs(stored_values, *_):
     # Calculate Reynolds number
     reynolds_number = 8.56 * entry_1 * velocity
 
-    # Loss coefficient calculation
-    if "Re" not in df.columns or "C" not in df.columns:
-        raise KeyError("Data for A9C must include 'Re' and 'C' columns.")
+    # Loss coefficient: largest table Re at or below the actual value,
+    # or the smallest table value if none match (cached sorted arrays)
+    re_xs, re_cs = _a9c_tables()
+    loss_coefficient = lookup_le(re_xs, re_cs, reynolds_number)
 
-    # Match Reynolds number to find the closest value in the 'Re' column
-    re_data = df[["Re", "C"]].dropna().sort_values(by="Re")
-    valid_re = re_data[re_data["Re"] <= reynolds_number]
-    if valid_re.empty:
-        closest_re_row = re_data.iloc[0]  # Use the smallest Re if none match
-    else:
-        closest_re_row = valid_re.iloc[-1]  # Use the largest Re less than or equal to reynolds_number
-
-    # Retrieve the loss coefficient
-    loss_coefficient = closest_re_row["C"]
-
-    # Final calculations
-    velocity_pressure = (velocity / 4005) ** 2
-    pressure_loss = loss_coefficient * velocity_pressure
+    # Final calculations (shared finalizer)
+    res = standard_case_outputs(velocity, loss_coefficient)
 
     # Return outputs
     return {
+        "Output 1: Velocity": res.velocity,
+        "Output 2: Vel. Pres @ V0 (in w.c.)": res.velocity_pressure,
+        "Output 3: Loss Coefficient": res.loss_coefficient,
+        "Output 4: Pressure Loss (in w.c.)": res.pressure_loss,
+        "Flag": area_flag,  # None if no mismatch
+    }
+
+
+def A9C_outputs_batch(stored_values_df):
+    """
+    Vectorized A9C over many transitions at once.
+
+    Takes a DataFrame with columns entry_1..entry_4 (one row per case,
+    same meaning as the scalar function) and returns a DataFrame with
+    the four output columns plus a boolean "Flag" column marking rows
+    where the round area exceeds the rectangular area.
+    """
+    import pandas as pd  # deferred: only the batch path builds a DataFrame
+
+    re_xs, re_cs = _a9c_tables()
+
+    D = stored_values_df["entry_1"].to_numpy(dtype=float)
+    H1 = stored_values_df["entry_2"].to_numpy(dtype=float)
+    W1 = stored_values_df["entry_3"].to_numpy(dtype=float)
+    Q = stored_values_df["entry_4"].to_numpy(dtype=float)
+
+    area_round = (math.pi / 576.0) * D * D
+    area_rect = (H1 * W1) / 144.0
+
+    velocity = Q / area_rect
+    reynolds_number = 8.56 * D * velocity
+
+    # Re: largest table value at or below the actual (clamped low)
+    ri = np.maximum(np.searchsorted(re_xs, reynolds_number, side="right") - 1, 0)
+    loss_coefficient = re_cs[ri]
+
+    velocity_pressure = velocity * velocity * _VP_COEFF
+
+    return pd.DataFrame({
         "Output 1: Velocity": velocity,
         "Output 2: Vel. Pres @ V0 (in w.c.)": velocity_pressure,
         "Output 3: Loss Coefficient": loss_coefficient,
-        "Output 4: Pressure Loss (in w.c.)": pressure_loss,
-        "Flag": area_flag,  # None if no mismatch
-    }
+        "Output 4: Pressure Loss (in w.c.)": loss_coefficient * velocity_pressure,
+        "Flag": area_round > area_rect,
+    })
@@ -0,0 +1,87 @@
+# _bellmouth.py
+"""
+Shared body for the conical bellmouth entry cases (A12E1 / A12E2).
+
+The two cases are identical apart from the lookup table and how the
+inlet/exit diameters are obtained (actual diameters for the round
+A12E1, equivalent diameters for the rectangular A12E2), so the whole
+calculation lives here and each case module just prepares its inputs.
+"""
+import math
+
+from _entry_lookup import conical_entry_coefficient, screen_correction
+from _kernels import standard_case_outputs
+
+# Quarter-circle constant: pi * (D/2)^2 == _PI_OVER_4 * D * D
+_PI_OVER_4 = math.pi * 0.25
+
+# Degrees per radian, doubled: the included angle is 2 * atan(...)
+_TWO_RAD2DEG = 360.0 / math.pi
+
+
+def bellmouth_outputs(case_id, L, D_inlet, D_exit, Q, obstruction, n):
+    """
+    Outputs for a conical converging bellmouth with end wall.
+
+    Parameters:
+        case_id: lookup table name ("A12E1" or "A12E2")
+        L: length (in)
+        D_inlet: entry diameter (in; equivalent diameter for A12E2)
+        D_exit: exit diameter (in; equivalent diameter for A12E2)
+        Q: flow rate (cfm)
+        obstruction: "none" or "screen"
+        n: free area ratio (for screen)
+    """
+    try:
+        # ==========================
+        #   GEOMETRY & VELOCITY
+        # ==========================
+        A = _PI_OVER_4 * D_inlet * D_inlet  # in²
+        V = (Q * 144.0) / A                 # ft/min
+
+        L_D = L / D_inlet
+
+        # Included angle from inlet to exit diameter; atan2 keeps the
+        # taper well-conditioned as L approaches zero
+        angle = math.atan2(D_exit - D_inlet, 2.0 * L) * _TWO_RAD2DEG
+        angle_rounded = int(angle + 0.5) if angle >= 0 else int(angle - 0.5)
+
+        # ==========================
+        #   BASE COEFFICIENT C
+        # ==========================
+        # Cached lookup: L/D rounded down, nearest table ANGLE
+        C = conical_entry_coefficient(case_id, L_D, angle_rounded)
+        if C is None:
+            return {"Error": f"No matching L/D and ANGLE pair in {case_id} data."}
+
+        # ==========================
+        #   SCREEN CORRECTION (A14A1)
+        # ==========================
+        if obstruction == "screen" and n is not None:
+            # Cached A14A1 lookup (largest table n <= actual n);
+            # As/A = n for a uniform screen
+            C1 = screen_correction(n)
+            loss_coefficient = C + (C1 / (n ** 2))
+        else:
+            loss_coefficient = C
+
+        # ==========================
+        #   OUTPUTS
+        # ==========================
+        res = standard_case_outputs(V, loss_coefficient)
+
+        return {
+            "Output 1: Velocity": res.velocity,
+            "Output 2: Velocity Pressure": res.velocity_pressure,
+            "Output 3: Loss Coefficient": res.loss_coefficient,
+            "Output 4: Pressure Loss": res.pressure_loss,
+        }
+
+    except Exception as e:
+        return {
+            "Output 1: Velocity": None,
+            "Output 2: Velocity Pressure": None,
+            "Output 3: Loss Coefficient": None,
+            "Output 4: Pressure Loss": None,
+            "Error": str(e),
+        }
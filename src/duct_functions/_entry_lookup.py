@@ -0,0 +1,138 @@
+# _entry_lookup.py
+"""
+Cached lookup helpers shared by the duct-entry cases (A12A1 / A12A2).
+
+Each table is flattened once into sorted NumPy arrays plus a plain dict,
+so the per-call work is two searchsorted calls and a dict get instead of
+unique() scans and boolean-mask DataFrame filters.
+"""
+from functools import lru_cache
+
+import numpy as np
+from data_access import get_case_table
+
+
+@lru_cache(maxsize=None)
+def _entry_tables(case_id):
+    """Sorted unique t/D and L/D arrays plus a {(t/D, L/D): C} dict."""
+    df = get_case_table(case_id)[["t/D", "L/D", "C"]].dropna()
+    tD_arr = np.sort(df["t/D"].unique())
+    LD_arr = np.sort(df["L/D"].unique())
+    lut = {}
+    for tD, LD, C in df.itertuples(index=False):
+        # First occurrence wins, matching the old first-row selection
+        lut.setdefault((tD, LD), C)
+    return tD_arr, LD_arr, lut
+
+
+def entry_loss_coefficient(case_id, t_D, L_D):
+    """
+    Base loss coefficient C for a duct entry: t/D rounded down and L/D
+    rounded up to the nearest table values (clamped at the table edges).
+    Returns None when the matched pair is absent from the table.
+    """
+    tD_arr, LD_arr, lut = _entry_tables(case_id)
+    i = np.searchsorted(tD_arr, t_D, side="right") - 1
+    j = np.searchsorted(LD_arr, L_D, side="left")
+    tD_match = tD_arr[max(i, 0)]
+    LD_match = LD_arr[min(j, len(LD_arr) - 1)]
+    return lut.get((tD_match, LD_match))
+
+
+@lru_cache(maxsize=None)
+def _screen_tables():
+    """A14A1 screen corrections: sorted n values and the first C per n."""
+    df = get_case_table("A14A1")[["n, free area ratio", "C"]].dropna()
+    n_arr = np.sort(df["n, free area ratio"].unique())
+    first_c = {}
+    for n_val, C in df.itertuples(index=False):
+        first_c.setdefault(n_val, C)
+    return n_arr, first_c
+
+
+def screen_correction(n):
+    """Screen correction C1 from A14A1: largest table n <= actual n."""
+    n_arr, first_c = _screen_tables()
+    i = np.searchsorted(n_arr, n, side="right") - 1
+    return first_c[n_arr[max(i, 0)]]
+
+
+@lru_cache(maxsize=None)
+def _plate_tables():
+    """A14B1 perforated-plate corrections as file-order float arrays."""
+    df = get_case_table("A14B1")[["n, free area ratio", "t/D", "C"]].dropna()
+    return (
+        df["n, free area ratio"].to_numpy(dtype=float),
+        df["t/D"].to_numpy(dtype=float),
+        df["C"].to_numpy(dtype=float),
+    )
+
+
+def plate_correction(n, t_over_d):
+    """
+    Perforated-plate correction C1 from A14B1: largest table n <= actual
+    n, then largest t/D within that n. Returns None when no row matches.
+    """
+    n_arr, tD_arr, c_arr = _plate_tables()
+    mask = (n_arr <= n) & (tD_arr <= t_over_d)
+    if not mask.any():
+        return None
+    n_match = n_arr[mask].max()
+    sub = mask & (n_arr == n_match)
+    tD_match = tD_arr[sub].max()
+    return c_arr[sub & (tD_arr == tD_match)][0]
+
+
+@lru_cache(maxsize=None)
+def _ld_angle_tables(case_id):
+    """Sorted unique L/D and ANGLE arrays plus a {(L/D, ANGLE): C} dict."""
+    df = get_case_table(case_id)[["L/D", "ANGLE", "C"]].dropna()
+    LD_arr = np.sort(df["L/D"].unique())
+    ang_arr = np.sort(df["ANGLE"].unique())
+    lut = {}
+    for LD, ang, C in df.itertuples(index=False):
+        lut.setdefault((LD, ang), C)
+    return LD_arr, ang_arr, lut
+
+
+def conical_entry_coefficient(case_id, L_D, angle):
+    """
+    Base loss coefficient C for a conical bellmouth entry (A12E1/A12E2):
+    L/D rounded down to the nearest table value (clamped at the low edge)
+    and ANGLE matched to the closest table angle. Returns None when the
+    matched pair is absent from the table.
+    """
+    LD_arr, ang_arr, lut = _ld_angle_tables(case_id)
+    i = np.searchsorted(LD_arr, L_D, side="right") - 1
+    LD_match = LD_arr[max(i, 0)]
+    ang_match = ang_arr[np.abs(ang_arr - angle).argmin()]
+    return lut.get((LD_match, ang_match))
+
+
+def obstruction_correction(obstruction, n, plate_thickness=None, hole_diameter=None):
+    """
+    Obstruction correction C1 for a duct entry.
+
+    Handles the "screen" (A14A1) and "perforated plate" (A14B1) cases
+    shared by A12A1/A12A2. Returns (C1, error): C1 is 0.0 when no
+    obstruction applies, and error is a message string when a lookup
+    fails (None otherwise).
+    """
+    if obstruction == "screen" and n is not None:
+        try:
+            return screen_correction(n), None
+        except KeyError:
+            return 0.0, "A14A1 data (screen correction) not found."
+
+    if obstruction == "perforated plate" and None not in (n, plate_thickness, hole_diameter):
+        if hole_diameter == 0:
+            return 0.0, "Hole diameter must be non-zero."
+        try:
+            C1 = plate_correction(n, plate_thickness / hole_diameter)
+        except KeyError:
+            return 0.0, "A14B1 data (perforated plate correction) not found."
+        if C1 is None:
+            return 0.0, "No matching perforated plate correction in A14B1."
+        return C1, None
+
+    return 0.0, None
@@ -0,0 +1,237 @@
+# _kernels.py
+"""
+Shared scalar math for the *_outputs family.
+
+Every junction/entry case computes the same flow quantities: duct area,
+velocity = Q / A, velocity pressure = (V / 4005)², and pressure loss =
+C · VP. Those are collected here so each case module only does its table
+lookup and one kernel call.
+
+Numba is optional: when it is installed the kernels are JIT-compiled,
+otherwise they run as plain Python (the math is identical either way).
+"""
+import math
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba isn't installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+# Folded constants: π·(D/2)²/144 = (π/576)·D² and (V/4005)² = V²/4005².
+_AREA_COEFF = math.pi / 576.0
+_VP_COEFF = 1.0 / (4005.0 * 4005.0)
+
+
+@njit(cache=True)
+def round_area_ft2(D_in):
+    """Cross-sectional area (ft²) of a round duct with diameter in inches."""
+    return _AREA_COEFF * D_in * D_in
+
+
+@njit(cache=True)
+def rect_area_ft2(a_in, b_in):
+    """Cross-sectional area (ft²) of a rectangular duct with sides in inches."""
+    return (a_in * b_in) / 144.0
+
+
+@njit(cache=True)
+def velocity_pressure(V):
+    """Velocity pressure (in w.c.) for a velocity in ft/min."""
+    return V * V * _VP_COEFF
+
+
+@njit(cache=True)
+def standard_outputs_kernel(velocity, loss_coefficient):
+    """
+    Velocity pressure and pressure loss for a standard (single-path)
+    case, given the looked-up loss coefficient.
+    """
+    vp = velocity * velocity * _VP_COEFF
+    return vp, loss_coefficient * vp
+
+
+@njit(cache=True)
+def branch_main_kernel(area_main, area_branch, Q_source, Q_branch,
+                       C_branch, C_main):
+    """
+    Velocities, velocity pressures and pressure losses for a converging
+    branch/main junction, given the two looked-up loss coefficients.
+
+    Returns:
+        (velocity_branch, vp_branch, branch_loss,
+         velocity_source, velocity_converged, vp_source, vp_converged,
+         main_loss)
+    """
+    velocity_branch    = Q_branch / area_branch
+    velocity_source    = Q_source / area_main
+    velocity_converged = (Q_source + Q_branch) / area_main
+
+    vp_branch    = velocity_branch * velocity_branch * _VP_COEFF
+    vp_source    = velocity_source * velocity_source * _VP_COEFF
+    vp_converged = velocity_converged * velocity_converged * _VP_COEFF
+
+    branch_loss = C_branch * vp_branch
+    main_loss   = C_main * vp_source
+
+    return (velocity_branch, vp_branch, branch_loss,
+            velocity_source, velocity_converged, vp_source, vp_converged,
+            main_loss)
+
+
+# Reynolds number correction factor (RNCF) table shared by the A7*
+# elbow cases: Re/10^4 bins and the factors for R/D <= 0.5 and R/D = 0.75.
+_RE_BINS = np.array([1.0, 2.0, 3.0, 4.0, 6.0, 8.0, 10.0, 14.0, 20.0])
+_RNCF_05 = np.array([1.40, 1.26, 1.19, 1.14, 1.09, 1.06, 1.04, 1.0, 1.0])
+_RNCF_075 = np.array([1.77, 1.64, 1.56, 1.46, 1.38, 1.30, 1.15, 1.0, 1.0])
+
+
+@njit(cache=True)
+def a7_kernel(velocity, reynolds_number, C_base, r_over_d):
+    """
+    Shared numeric tail of the A7* elbow cases.
+
+    Applies the Reynolds Number Correction Factor (largest Re/10^4 bin
+    at or below the actual value, clamped at the table edges) to the
+    looked-up base coefficient and computes the pressure outputs.
+
+    Returns (loss_coefficient, velocity_pressure, pressure_loss).
+    """
+    # The historical guard V < 23766.76 / (23766.76 * V**-1.000794)
+    # reduces to V < V**1.000794, i.e. V > 1 for positive velocities.
+    if velocity > 1.0:
+        idx = np.searchsorted(_RE_BINS, reynolds_number / 1e4, side="right") - 1
+        if idx < 0:
+            idx = 0
+        rnc_factor = _RNCF_05[idx] if r_over_d <= 0.5 else _RNCF_075[idx]
+    else:
+        rnc_factor = 1.0
+
+    loss_coefficient = C_base * rnc_factor
+    velocity_pressure = velocity * velocity * _VP_COEFF
+    return loss_coefficient, velocity_pressure, loss_coefficient * velocity_pressure
+
+
+@njit(cache=True)
+def rncf(reynolds_number):
+    """
+    Single-column Reynolds Number Correction Factor (the R/D <= 0.5
+    column): largest Re/10^4 bin at or below the actual value, clamped
+    low, and a constant 1.0 from the 14 bin up so the lookup is skipped
+    in the high-Re regime.
+    """
+    re_scaled = reynolds_number / 1e4
+    if re_scaled >= 14.0:
+        return 1.0
+    idx = np.searchsorted(_RE_BINS, re_scaled, side="right") - 1
+    if idx < 0:
+        idx = 0
+    return _RNCF_05[idx]
+
+
+@njit(cache=True)
+def a7_straight_kernel(velocity, reynolds_number, C_base):
+    """
+    Numeric tail of the straight-entry cases (A7I/A7K): shared RNCF,
+    then the pressure outputs.
+
+    Returns (loss_coefficient, velocity_pressure, pressure_loss).
+    """
+    loss_coefficient = C_base * rncf(reynolds_number)
+    vp = velocity * velocity * _VP_COEFF
+    return loss_coefficient, vp, loss_coefficient * vp
+
+
+def lookup_le(xs, ys, x):
+    """
+    ys value at the largest xs <= x (first entry if x is below the table).
+
+    Scalar path: bisect beats np.searchsorted on these tiny tables since
+    it skips the array-scalar boxing. The batch paths keep searchsorted.
+    """
+    i = bisect_right(xs, x) - 1
+    return ys[i] if i >= 0 else ys[0]
+
+
+def lookup_ge(xs, ys, x):
+    """ys value at the smallest xs >= x (last entry if x is above the table)."""
+    i = bisect_left(xs, x)
+    return ys[i] if i < len(xs) else ys[-1]
+
+
+class BranchMainOutputs(NamedTuple):
+    """
+    Named view of branch_main_kernel's results.
+
+    A single tuple allocation with attribute access, so case functions
+    can pass results around by name and only build the labeled output
+    dict at the GUI boundary (via the case function's return).
+    """
+    velocity_branch: float
+    vp_branch: float
+    branch_loss: float
+    velocity_source: float
+    velocity_converged: float
+    vp_source: float
+    vp_converged: float
+    main_loss: float
+
+
+class StandardOutputs(NamedTuple):
+    """
+    Named view of a standard (single-path) case result.
+
+    Case functions carry results by attribute internally and only build
+    the labelled output dict at the GUI boundary, mirroring
+    BranchMainOutputs for the junction cases.
+    """
+    velocity: float
+    velocity_pressure: float
+    loss_coefficient: float
+    pressure_loss: float
+
+
+def standard_case_outputs(velocity, loss_coefficient):
+    """standard_outputs_kernel with a StandardOutputs result."""
+    vp, pl = standard_outputs_kernel(velocity, loss_coefficient)
+    return StandardOutputs(velocity, vp, loss_coefficient, pl)
+
+
+def a7_straight_case_outputs(velocity, reynolds_number, C_base):
+    """a7_straight_kernel with a StandardOutputs result."""
+    lc, vp, pl = a7_straight_kernel(velocity, reynolds_number, C_base)
+    return StandardOutputs(velocity, vp, lc, pl)
+
+
+def branch_main_outputs(area_main, area_branch, Q_source, Q_branch,
+                        C_branch, C_main):
+    """branch_main_kernel with a BranchMainOutputs result."""
+    return BranchMainOutputs(*branch_main_kernel(
+        area_main, area_branch, Q_source, Q_branch, C_branch, C_main,
+    ))
+
+
+if _HAVE_NUMBA:
+    # Warm the JIT at import so the first real call doesn't pay compile latency.
+    round_area_ft2(1.0)
+    rect_area_ft2(1.0, 1.0)
+    velocity_pressure(1.0)
+    standard_outputs_kernel(1.0, 0.0)
+    branch_main_kernel(1.0, 1.0, 1.0, 1.0, 0.0, 0.0)
+    a7_kernel(1.0, 1.0, 0.0, 0.5)
+    rncf(1.0)
+    a7_straight_kernel(1.0, 1.0, 0.0)
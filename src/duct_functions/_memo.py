@@ -0,0 +1,44 @@
+"""
+Memoization helper for case output functions.
+
+GUI recalculations and iterative edits often re-evaluate a case with
+exactly the same inputs (e.g. when only one field of another case is
+being changed). Wrapping a case function with `memoize_outputs` makes
+repeat calls return a cached result instead of redoing the lookups and
+arithmetic.
+"""
+
+from functools import lru_cache, wraps
+
+
+def memoize_outputs(n_entries, maxsize=4096):
+    """
+    Decorator factory: cache a case function's results by its entry values.
+
+    `n_entries` is how many `entry_1..entry_N` keys the case reads from
+    `stored_values`. The wrapped function delegates to an inner
+    `lru_cache`d implementation keyed on the entry tuple and returns a
+    fresh dict each call so callers can't mutate the cached copy. The
+    wrapper exposes `cache_clear()` for use after a data reload.
+    """
+    entry_keys = tuple(f"entry_{i}" for i in range(1, n_entries + 1))
+
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def _impl(entries):
+            return func(dict(zip(entry_keys, entries)))
+
+        @wraps(func)
+        def wrapper(stored_values, *_):
+            entries = tuple(stored_values.get(key) for key in entry_keys)
+            try:
+                return dict(_impl(entries))
+            except TypeError:
+                # Unhashable entry (shouldn't happen from the GUI) —
+                # fall back to an uncached call.
+                return func(stored_values)
+
+        wrapper.cache_clear = _impl.cache_clear
+        return wrapper
+
+    return decorator
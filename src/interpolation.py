@@ -2,6 +2,10 @@
 import numpy as np
 import pandas as pd
 
+from interpolation_numba import HAVE_NUMBA
+if HAVE_NUMBA:
+    from interpolation_numba import idw_nd_batch
+
 
 def idw_interpolate_nd(df: pd.DataFrame,
                        arg_cols,
@@ -67,3 +71,50 @@ def idw_interpolate_nd(df: pd.DataFrame,
     weights /= weights.sum()
 
     return float(np.dot(weights, vsel))
+
+
+def idw_interpolate_nd_batch(df: pd.DataFrame,
+                             arg_cols,
+                             targets,
+                             value_col="C",
+                             k=8,
+                             power=2.0):
+    """
+    Vectorized IDW over many query points at once.
+
+    Same semantics as idw_interpolate_nd, but `targets` is an (N, d)
+    array of query points and the result is an (N,) float array. The
+    whole batch runs as a handful of NumPy ops on an (N, M) distance
+    matrix instead of N Python-level calls.
+    """
+    pts = df[arg_cols].to_numpy(dtype=float)   # (M, d)
+    vals = df[value_col].to_numpy(dtype=float)
+
+    targets = np.asarray(targets, dtype=float)
+    if targets.ndim != 2 or targets.shape[1] != len(arg_cols):
+        raise ValueError("targets must be an (N, len(arg_cols)) array")
+
+    if HAVE_NUMBA:
+        # Fused per-query kernel: no (N, M, dim) broadcast temporary and
+        # the query loop runs across cores.
+        return idw_nd_batch(np.ascontiguousarray(pts), vals, np.ascontiguousarray(targets), k, power)
+
+    diffs = targets[:, None, :] - pts[None, :, :]
+    dists = np.sqrt(np.sum(diffs ** 2, axis=2))  # (N, M)
+
+    k_eff = min(k, pts.shape[0])
+    idx = np.argpartition(dists, k_eff - 1, axis=1)[:, :k_eff]
+    dsel = np.take_along_axis(dists, idx, axis=1)
+    vsel = vals[idx]
+
+    dsel = np.where(dsel == 0, 1e-12, dsel)
+    weights = 1.0 / (dsel ** power)
+    out = np.einsum("ij,ij->i", weights, vsel) / weights.sum(axis=1)
+
+    # Exact matches override, like the scalar path: first zero-distance
+    # data point in original row order wins.
+    exact_rows = np.nonzero((dists == 0).any(axis=1))[0]
+    for r in exact_rows:
+        out[r] = vals[np.argmax(dists[r] == 0)]
+
+    return out
@@ -0,0 +1,71 @@
+# interpolation_numba.py
+"""
+Optional Numba-compiled IDW batch kernel.
+
+The NumPy batch path in interpolation.py materializes an (N, M, dim)
+difference tensor and an (N, M) distance matrix per call. With Numba
+installed, the same computation runs as one fused loop per query point —
+distances, nearest-k selection and the weighted sum — with O(M) scratch
+per thread and the outer query loop parallelized via prange.
+
+Numba is optional, matching duct_functions/_kernels.py: when it is not
+installed HAVE_NUMBA is False and callers stay on the NumPy path. The
+math is identical either way.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def idw_nd_batch(data, values, queries, k, power):
+        """
+        IDW over an (N, dim) query array against (M, dim) data points.
+
+        Mirrors idw_interpolate_nd_batch: the first zero-distance data
+        point (in row order) wins exactly, otherwise the k nearest
+        points are combined with 1/d**power weights.
+        """
+        N, dim = queries.shape
+        M = data.shape[0]
+        k_eff = min(k, M)
+        out = np.empty(N)
+        for q in prange(N):
+            dists = np.empty(M)
+            exact = -1
+            for m in range(M):
+                s = 0.0
+                for j in range(dim):
+                    t = queries[q, j] - data[m, j]
+                    s += t * t
+                d = np.sqrt(s)
+                dists[m] = d
+                if d == 0.0 and exact < 0:
+                    exact = m
+            if exact >= 0:
+                out[q] = values[exact]
+                continue
+            sel = np.argsort(dists)[:k_eff]
+            wsum = 0.0
+            acc = 0.0
+            for i in range(k_eff):
+                d = dists[sel[i]]
+                if d == 0.0:
+                    d = 1e-12
+                w = 1.0 / d ** power
+                wsum += w
+                acc += w * values[sel[i]]
+            out[q] = acc / wsum
+        return out
+
+    # Warm the JIT at import so the first details window doesn't pay
+    # compile latency (same convention as _kernels.py).
+    idw_nd_batch(
+        np.zeros((2, 1)), np.zeros(2), np.ones((1, 1)), 1, 2.0
+    )
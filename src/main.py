@@ -5,18 +5,20 @@ import tkinter as tk
 import importlib
 from tkinter import *
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageOps
-from tabulate import tabulate
 import datetime
+import re
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 import sys
 import os
+import threading
 import traceback  # For detailed error logging
-import scipy
-from interpolation_manager import preload_all_case_interpolators, get_case_interpolator
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from interpolation_manager import preload_all_case_interpolators
 from data_access import get_case_table
-from mpl_toolkits.mplot3d import Axes3D  # noqa: F401  # needed for 3D projection   
+# PIL and matplotlib are imported lazily (display_image /
+# show_details_window): both are heavy and neither is needed to get the
+# main window on screen.
 
 # --- Path setup so the app behaves like before, even after repo re-org ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -38,6 +40,26 @@ from config import EXCEL_FILE_PATH, FIGURES_DIR, get_data_file_path
 IMAGE_FOLDER = str(FIGURES_DIR)  # points at repo_root/duct_figures
 DEFAULT_IMAGE = "jacobs_smacna_logos.png"
 
+# Opt-in debug tracing. The [DEBUG] prints format f-strings and write to
+# stdout on every tree click / calculation, so they only run when
+# DPL_DEBUG=1 is set in the environment.
+DEBUG = os.environ.get("DPL_DEBUG") == "1"
+
+# One-pass label unit rewrite (standard -> metric). A single compiled
+# alternation replaces the old chain of str.replace calls, each of which
+# re-walked the whole label string. Longest units first so "(in w.c.)"
+# and "(ft/min)" never fall through to the bare "(in)"/"(ft)" rules.
+_METRIC_UNITS = {
+    "in w.c.": "Pa",
+    "ft/min": "m/s",
+    "ft/s": "m/s",
+    "cfm": "m³/h",
+    "in": "mm",
+    "ft": "m",
+}
+_UNIT_RE = re.compile(r"\((in w\.c\.|ft/min|ft/s|cfm|in|ft)\)")
+
+
 # --- Unit Conversion Class ---
 class UnitConverter:
     # Conversion Factors (Standard <-> Metric)
@@ -71,52 +93,11 @@ class UnitConverter:
     # Output: Format Standard Value/Label -> Display Unit based on mode
     def format_output_for_display(self, standard_label, standard_value, is_metric):
         """Converts standard result value and label to the appropriate display format."""
+        standard_label = str(standard_label) if standard_label else ""
+        display_label, fmt = _output_formatter(standard_label, is_metric)
         if standard_value is None or standard_value == "N/A":
-            display_label = self.get_display_label(standard_label, is_metric)
             return display_label, "N/A"
-
-        standard_label = str(standard_label) if standard_label else ""
-
-        if not is_metric:
-            return standard_label, f"{standard_value:.3f}" if isinstance(standard_value, (int, float, np.number)) else str(standard_value)
-
-        # Begin conversion logic
-        label_lower = standard_label.lower()
-        display_value_num = standard_value
-        display_label = standard_label
-
-        if "velocity" in label_lower:
-            if "(ft/min)" in label_lower:
-                display_value_num = standard_value * self.M_PER_S_PER_FTMIN  # ft/min -> m/s
-                display_label = standard_label.replace("(ft/min)", "(m/s)")
-            elif "(ft/s)" in label_lower:
-                display_value_num = standard_value / self.FT_PER_M  # ft/s -> m/s
-                display_label = standard_label.replace("(ft/s)", "(m/s)")
-
-        if "pressure" in label_lower:
-            if "(in w.c.)" in label_lower:
-                display_value_num = standard_value * self.PA_PER_INWC  # in. w.c. -> Pa
-                display_label = display_label.replace("(in w.c.)", "(Pa)")
-
-        if any(k in label_lower for k in ["diameter", "length", "thickness", "width", "height"]):
-            if "(in)" in label_lower:
-                display_value_num = standard_value * self.MM_PER_IN  # in -> mm
-                display_label = display_label.replace("(in)", "(mm)")
-            elif "(ft)" in label_lower:
-                display_value_num = standard_value / self.FT_PER_M  # ft -> m
-                display_label = display_label.replace("(ft)", "(m)")
-
-        if "flow" in label_lower or "cfm" in label_lower:
-            if "(cfm)" in label_lower:
-                display_value_num = standard_value * self.CFM_PER_M3HR  # cfm -> m³/hr
-                display_label = display_label.replace("(cfm)", "(m³/h)")
-
-        try:
-            formatted_value = f"{float(display_value_num):.3f}" if isinstance(display_value_num, (int, float, np.number)) else str(display_value_num)
-        except (ValueError, TypeError):
-            formatted_value = str(display_value_num)
-
-        return display_label, formatted_value
+        return display_label, fmt(standard_value)
 
 
     # Label Text Conversion Only
@@ -126,22 +107,144 @@ class UnitConverter:
         standard_label = str(standard_label) # Ensure string
         if not is_metric:
             return standard_label
+        return _UNIT_RE.sub(lambda m: f"({_METRIC_UNITS[m.group(1)]})", standard_label)
+
+
+# Metric-entry -> standard-unit multipliers, keyed by the unit token in the
+# *standard* label. Resolved once per label (lru_cache) so the Calculate
+# click multiplies by a cached factor instead of re-scanning widget text.
+# "(ft/s)" keeps the historical behavior of treating a metric m/s entry as
+# ft/min; "(ft)" had no metric input rule before and still has none.
+_INPUT_FACTORS = {
+    "in": 1.0 / UnitConverter.MM_PER_IN,
+    "ft/min": 1.0 / UnitConverter.M_PER_S_PER_FTMIN,
+    "ft/s": 1.0 / UnitConverter.M_PER_S_PER_FTMIN,
+    "cfm": 1.0 / UnitConverter.CFM_PER_M3HR,
+    "in w.c.": 1.0 / UnitConverter.PA_PER_INWC,
+}
+
 
-        metric_label = standard_label
-        metric_label = metric_label.replace("(in w.c.)", "(Pa)")
-        metric_label = metric_label.replace("(in)", "(mm)")
-        metric_label = metric_label.replace("(ft/min)", "(m/s)")
-        metric_label = metric_label.replace("(ft/s)", "(m/s)")
-        metric_label = metric_label.replace("(cfm)", "(m³/h)")
-        metric_label = metric_label.replace("(ft)", "(m)")
-        return metric_label
+@lru_cache(maxsize=None)
+def _input_factor(standard_label):
+    """Multiplier applied to a metric-mode entry to recover standard units."""
+    m = _UNIT_RE.search(str(standard_label))
+    return _INPUT_FACTORS.get(m.group(1), 1.0) if m else 1.0
+
+
+@lru_cache(maxsize=None)
+def _output_conversion(standard_label):
+    """(metric display label, standard -> metric factor) for an output label.
+
+    Mirrors the keyword + unit rules format_output_for_display used to
+    re-evaluate per render; cached here so each distinct label pays the
+    string scanning once."""
+    label_lower = standard_label.lower()
+    factor = 1.0
+    display_label = standard_label
+
+    if "velocity" in label_lower:
+        if "(ft/min)" in label_lower:
+            factor *= UnitConverter.M_PER_S_PER_FTMIN  # ft/min -> m/s
+            display_label = display_label.replace("(ft/min)", "(m/s)")
+        elif "(ft/s)" in label_lower:
+            factor /= UnitConverter.FT_PER_M  # ft/s -> m/s
+            display_label = display_label.replace("(ft/s)", "(m/s)")
+
+    if "pressure" in label_lower:
+        if "(in w.c.)" in label_lower:
+            factor *= UnitConverter.PA_PER_INWC  # in. w.c. -> Pa
+            display_label = display_label.replace("(in w.c.)", "(Pa)")
+
+    if any(k in label_lower for k in ["diameter", "length", "thickness", "width", "height"]):
+        if "(in)" in label_lower:
+            factor *= UnitConverter.MM_PER_IN  # in -> mm
+            display_label = display_label.replace("(in)", "(mm)")
+        elif "(ft)" in label_lower:
+            factor /= UnitConverter.FT_PER_M  # ft -> m
+            display_label = display_label.replace("(ft)", "(m)")
+
+    if "flow" in label_lower or "cfm" in label_lower:
+        if "(cfm)" in label_lower:
+            factor *= UnitConverter.CFM_PER_M3HR  # cfm -> m³/hr
+            display_label = display_label.replace("(cfm)", "(m³/h)")
+
+    return display_label, factor
+
+
+@lru_cache(maxsize=None)
+def _output_formatter(standard_label, is_metric):
+    """(display label, value -> text callable) baked per (label, unit mode).
+
+    The conversion factor and the .3f template are folded into one cached
+    closure, so rendering an output is a single call with no per-render
+    branching on mode or label content."""
+    if is_metric:
+        display_label, factor = _output_conversion(standard_label)
+    else:
+        display_label, factor = standard_label, 1.0
+
+    def fmt(value, _factor=factor):
+        if isinstance(value, (int, float, np.number)):
+            return f"{value * _factor:.3f}"
+        return str(value)
+
+    return display_label, fmt
 
 # --- Global Variables & Setup ---
+# Only these Master Table columns are ever read through `data`; the lookup
+# columns (L/D, Re, C, ...) come from data_access.get_case_table instead.
+input_columns = ["input 1", "input 2", "input 3", "input 4", "input 5", "input 6", "input 7", "input 8"]
+dropdown_columns = [f"dropdown {i}" for i in range(1, 9)]
+output_columns = [f"output {i}" for i in range(1, 11)]
+
+
+def _load_master_table(xlsx_path):
+    """Loads the 'Master Table' sheet, using a Parquet sidecar cache when fresh.
+
+    openpyxl parsing dominates startup time, so after the first Excel read the
+    frame is written next to the workbook as a .parquet sidecar. On later runs
+    the sidecar is loaded instead whenever it is at least as new as the
+    workbook (mtime comparison). Any cache problem (no parquet engine
+    installed, stale/corrupt file, read-only folder) falls back to the plain
+    Excel read, so behavior only ever differs in speed."""
+    cache_path = os.path.splitext(xlsx_path)[0] + ".parquet"
+    try:
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(xlsx_path):
+            df = pd.read_parquet(cache_path)
+            if df.index.name != "ID":
+                raise ValueError("sidecar predates the ID-indexed schema")
+            print(f"[INFO] Loaded master table from parquet cache: {cache_path}")
+            return df
+    except Exception as e:
+        print(f"[WARN] Could not read parquet cache ({e}); reading Excel instead.")
+
+    # Restricting the read to the columns above skips dtype inference over
+    # the ~70 unused lookup columns; the label/dropdown columns are read as
+    # strings outright, and index_col saves the set_index copy afterwards.
+    df = pd.read_excel(
+        xlsx_path,
+        sheet_name="Master Table",
+        index_col="ID",
+        usecols=["ID", *input_columns, *dropdown_columns, *output_columns],
+        dtype={c: "string" for c in input_columns + dropdown_columns},
+    )
+    try:
+        df.to_parquet(cache_path)
+        print(f"[INFO] Wrote parquet cache for faster startup: {cache_path}")
+    except Exception as e:
+        print(f"[WARN] Could not write parquet cache: {e}")
+    return df
+
 try:
     if not os.path.exists(EXCEL_FILE_PATH):
          raise FileNotFoundError(f"Excel file not found at resolved path: {EXCEL_FILE_PATH}")
-    data = pd.read_excel(EXCEL_FILE_PATH, sheet_name="Master Table")
-    data.set_index("ID", inplace=True)
+    data = _load_master_table(EXCEL_FILE_PATH)
+    # Sorted index so data.loc[duct_id] is a fast indexed lookup rather
+    # than an O(n) scan of the object index on every dispatch. Categorical
+    # codes replace per-lookup string hashing for the few remaining .loc
+    # callers (the hot click path reads _row_cache below instead).
+    data.sort_index(inplace=True, kind="stable")
+    data.index = pd.CategoricalIndex(data.index)
     print(f"[INFO] Successfully loaded Excel data from: {EXCEL_FILE_PATH}")
 except FileNotFoundError as e:
     print(f"[ERROR] {e}")
@@ -152,13 +255,160 @@ except Exception as e:
     messagebox.showerror("Error", f"Failed to load data from Excel file:\n{e}")
     data = pd.DataFrame()
 
-input_columns = ["input 1", "input 2", "input 3", "input 4", "input 5", "input 6", "input 7", "input 8"]
+# First row per duct ID as a plain dict (duct_id -> {column: value}), built
+# once so every tree click is a single hash lookup instead of a .loc walk of
+# pandas' label engine plus a Series materialization. NaN/NA values are
+# normalized to None at build time, which also spares pd.isna calls later.
+_row_cache = {}
+for _duct_id, _row in zip(data.index, data.itertuples(index=False, name=None)):
+    if _duct_id not in _row_cache:
+        _row_cache[_duct_id] = {
+            col: (None if pd.isna(val) else val)
+            for col, val in zip(data.columns, _row)
+        }
+
+# Deduped, display-ready dropdown value lists per (duct_id, dropdown index),
+# precomputed once so the click path does a dict lookup instead of the
+# dropna/unique/str-strip chain over the duct's row block every time.
+_dropdown_cache = {}
+if not data.empty:
+    for _duct_id, _block in data.groupby(level=0, sort=False):
+        for _i, _col in enumerate(dropdown_columns, start=1):
+            vals = [s for s in (str(v).strip() for v in _block[_col].dropna().unique()) if s]
+            if vals:
+                # Tuples: handed straight to Combobox values= without the
+                # extra per-click list copy and Tcl list conversion.
+                _dropdown_cache[(_duct_id, _i)] = tuple(vals)
+
+# Static input schema per duct: (entry index, standard label, dropdown
+# values or None, is-obstruction-trigger). Built once so a tree click just
+# walks a prebuilt tuple list; the only per-click string work left on the
+# hot path is the label unit rewrite, which depends on the current mode.
+_input_schema = {}
+for _duct_id, _first in _row_cache.items():
+    _fields = []
+    for _i, _col in enumerate(input_columns):
+        _label = _first.get(_col)
+        if _label is None:
+            continue
+        _label = str(_label).strip()
+        _fields.append((
+            _i,
+            _label,
+            _dropdown_cache.get((_duct_id, _i + 1)),
+            "obstruction type" in _label.lower(),
+        ))
+    _input_schema[_duct_id] = tuple(_fields)
+
+# Shared widget option pools for the per-click input rows: the constant
+# style kwargs and font tuple are built once and splatted into each
+# constructor instead of being rebuilt for every Label/Entry.
+_INPUT_FONT = ("Segoe UI", 10)
+_INPUT_LABEL_OPTS = {
+    "bg": "#eaf4ff",
+    "fg": "black",
+    "anchor": "e",
+    "font": _INPUT_FONT,
+}
+_INPUT_ENTRY_OPTS = {
+    "width": 20,
+    "relief": "solid",
+    "borderwidth": 1,
+    "bg": "white",
+    "fg": "black",
+    "highlightthickness": 1,
+    "highlightbackground": "grey",
+    "highlightcolor": "blue",
+    "font": _INPUT_FONT,
+}
 
 # --- Widget and State Tracking ---
 input_widgets = []
 input_entries = [] # List of tuples: [(widget, standard_label_key), ...]
+# Just the unit-bearing Label widgets, so toggle_units walks labels directly
+# instead of isinstance-scanning every widget. Each carries its canonical
+# (standard-unit) text on ._canonical / .original_standard_label.
+input_label_widgets = []
+output_label_widgets = []
 output_widgets = []
-calculation_log = []
+# Resolved case functions keyed by duct ID. Each case module is imported
+# once (no reload on re-selection), so a repeat tree click is one dict
+# probe instead of a trip through the import machinery.
+_case_fn_cache = {}
+
+
+def _warm_case_functions():
+    """
+    Resolve every duct's case function into _case_fn_cache.
+
+    Run on a background thread once the window is up, so the first click
+    on any duct is already a dict probe instead of paying the module
+    import. Ducts without a module yet (or with import errors) are
+    skipped — selecting them reports the problem as before.
+    """
+    for duct_id in duct_map:
+        if duct_id in _case_fn_cache:
+            continue
+        module_name = f"{duct_id}_outputs"
+        try:
+            mod = sys.modules.get(module_name) or importlib.import_module(module_name)
+        except Exception:
+            continue
+        fn = getattr(mod, module_name, None)
+        if fn is not None:
+            _case_fn_cache[duct_id] = fn
+
+# Obstruction-driven dynamic rows live in their own short list so tearing
+# them down is destroy + clear rather than filtered passes over every
+# tracked input widget.
+_obstruction_widgets = []
+
+# Column-major calculation log: one list per column, None-padded so every
+# column always has _log_row_count slots. Appends stay O(1) per column and
+# building the save/view DataFrame from this dict skips the key-union and
+# per-dict hashing a list of heterogeneous row dicts would cost.
+calculation_log_columns = {}
+_log_row_count = 0
+_log_render_cache = None  # View-Log text, rebuilt only after the log changes
+_log_df_cache = None      # DataFrame over the log, rebuilt only after changes
+
+
+def log_calculation(entry):
+    """Appends one calculation (dict of column -> value) to the log store."""
+    global _log_row_count, _log_render_cache, _log_df_cache
+    _log_render_cache = None
+    _log_df_cache = None
+    for col, val in entry.items():
+        column = calculation_log_columns.get(col)
+        if column is None:
+            column = [None] * _log_row_count
+            calculation_log_columns[col] = column
+        column.append(val)
+    for column in calculation_log_columns.values():
+        if len(column) <= _log_row_count:
+            column.append(None)
+    _log_row_count += 1
+
+
+def clear_log():
+    """Empties the calculation log."""
+    global _log_row_count, _log_render_cache, _log_df_cache
+    calculation_log_columns.clear()
+    _log_row_count = 0
+    _log_render_cache = None
+    _log_df_cache = None
+
+
+def _log_dataframe():
+    """DataFrame view of the log, cached until the log next changes.
+
+    Saving and viewing both need the frame; repeated clicks between
+    calculations reuse the same object instead of re-copying every
+    column out of the store."""
+    global _log_df_cache
+    if _log_df_cache is None:
+        _log_df_cache = pd.DataFrame(calculation_log_columns)
+    return _log_df_cache
 last_standard_results = {} # Store {standard_label: standard_value} from last calculation (mapped from raw)
 current_duct_id = None
 current_case_function = None
@@ -274,28 +524,37 @@ def style_button(btn, variant="normal"):
 
 # --- GUI Functions ---
 
+# Keywords marking a log column as an input (raw entered values keyed by
+# their standard labels); module-level so each save reuses the same tuple.
+_LOG_INPUT_KEYWORDS = ("ratio", "type", "angle", "diameter", "thickness", "width", "height", "length")
+
+
 def save_log_to_excel():
-    if not calculation_log:
+    if not _log_row_count:
         print("[INFO] No calculations to save.")
         messagebox.showinfo("Log Empty", "There are no calculations in the log to save.")
         return
     try:
-        df = pd.DataFrame(calculation_log)
+        df = _log_dataframe()
         cols = list(df.columns)
         ordered_cols = []
         if "Timestamp" in cols: ordered_cols.append(cols.pop(cols.index("Timestamp")))
         if "Duct ID" in cols: ordered_cols.append(cols.pop(cols.index("Duct ID")))
+        # Classify with O(1) set membership instead of list scans per column
+        seen = set(ordered_cols)
         # Identify inputs (raw entered values, keys are standard labels)
-        input_cols = [c for c in cols if "(" in c or any(k in c.lower() for k in ["ratio", "type", "angle", "diameter", "thickness", "width", "height", "length"]) and c not in ordered_cols]
+        input_cols = [c for c in cols if ("(" in c or any(k in c.lower() for k in _LOG_INPUT_KEYWORDS)) and c not in seen]
         ordered_cols.extend(sorted(input_cols))
+        seen.update(input_cols)
         # Identify outputs (raw returned keys like 'Output X: ...')
-        output_cols = [c for c in cols if "Output " in c and ":" in c and c not in ordered_cols]
+        output_cols = [c for c in cols if c.startswith("Output ") and ":" in c and c not in seen]
         ordered_cols.extend(sorted(output_cols))
+        seen.update(output_cols)
         # Add any remaining columns (like Error)
-        remaining_cols = [c for c in cols if c not in ordered_cols]
-        ordered_cols.extend(remaining_cols)
+        ordered_cols.extend(c for c in cols if c not in seen)
 
-        df = df[ordered_cols]
+        # reindex reorders by label without the full block copy df[cols] makes
+        df = df.reindex(columns=ordered_cols)
     except Exception as e:
          print(f"[ERROR] Failed to prepare log DataFrame: {e}")
          messagebox.showerror("Log Error", f"Failed to prepare log data for saving:\n{e}")
@@ -314,7 +573,8 @@ def save_log_to_excel():
             messagebox.showerror("Save Error", f"Failed to save log to Excel file:\n{e}")
 
 def view_log_popup():
-    if not calculation_log:
+    global _log_render_cache
+    if not _log_row_count:
         print("[INFO] Log is empty.")
         messagebox.showinfo("Log Empty", "There are no calculations in the log.")
         return
@@ -332,10 +592,17 @@ def view_log_popup():
     hsb.pack(side=BOTTOM, fill=X, padx=5, pady=(0,5))
     text_widget.config(xscrollcommand=hsb.set)
     try:
-        df = pd.DataFrame(calculation_log)
-        log_text = tabulate(df, headers='keys', tablefmt='grid', showindex=False, floatfmt=".3f", missingval="N/A")
+        if _log_render_cache is None:
+            # Only the most recent rows are rendered (more than fits on
+            # screen anyway); to_string keeps the formatting in pandas'
+            # C paths instead of tabulate's per-cell width measurement.
+            df = _log_dataframe()
+            _log_render_cache = df.tail(500).to_string(
+                index=False, float_format=lambda v: f"{v:.3f}", na_rep="N/A"
+            )
+        log_text = _log_render_cache
     except Exception as e:
-        log_text = f"[ERROR] Could not render log: {e}\n\nLog Data:\n{calculation_log}"
+        log_text = f"[ERROR] Could not render log: {e}\n\nLog Data:\n{calculation_log_columns}"
         print(f"[ERROR] Could not render log for popup: {e}")
     text_widget.insert(END, log_text)
     text_widget.config(state=DISABLED)
@@ -348,45 +615,70 @@ def toggle_units():
     print(f"[INFO] Unit mode toggled to: {mode_str}")
     mode_label.config(text=f"Mode: {mode_str}", fg="#007acc" if is_metric_mode else "#cc0000")
 
-    # Update Input Labels
-    for entry_widget, standard_label_key in input_entries:
+    # Update Input Labels (registered at creation; canonical text attached,
+    # so re-toggles never re-parse the current Tcl value)
+    for label_widget in input_label_widgets:
         try:
-            widget_index = input_widgets.index(entry_widget)
-            if widget_index > 0 and isinstance(input_widgets[widget_index - 1], Label):
-                label_widget = input_widgets[widget_index - 1]
-                new_display_label = converter.get_display_label(standard_label_key, is_metric_mode)
-                label_widget.config(text=f"{new_display_label}:")
-            else:
-                print(f"[WARN] No label found for input: {standard_label_key}")
-        except (ValueError, IndexError):
-            print(f"[WARN] Widget not found for input: {standard_label_key}")
+            new_display_label = converter.get_display_label(label_widget._canonical, is_metric_mode)
+            label_widget.config(text=f"{new_display_label}:")
         except Exception as e:
-            print(f"[ERROR] Updating input label '{standard_label_key}': {e}")
+            print(f"[ERROR] Updating input label '{label_widget._canonical}': {e}")
 
     # Update Output Labels (already-prepopulated outputs)
-    for widget in output_widgets:
-        if isinstance(widget, Label) and hasattr(widget, 'original_standard_label'):
-            original_label = widget.original_standard_label
-            new_label = converter.get_display_label(original_label, is_metric_mode)
-            widget.config(text=f"{new_label}:")
+    for widget in output_label_widgets:
+        new_label = converter.get_display_label(widget.original_standard_label, is_metric_mode)
+        widget.config(text=f"{new_label}:")
 
     # Update Output Values if Available
     if last_standard_results:
-        print("[DEBUG] Re-displaying outputs with new units using last standard results.")
+        if DEBUG:
+            print("[DEBUG] Re-displaying outputs with new units using last standard results.")
         display_outputs_from_standard(last_standard_results)
 
     print(f"[INFO] UI updated for {mode_str} mode.")
 
+def _forget_widget_tree(widget):
+    """Python-side bookkeeping for a widget torn down at the Tcl level:
+    mirrors what Misc.destroy() would have done (drop registered callback
+    commands and child references) without re-entering Tcl per widget."""
+    for child in list(widget.children.values()):
+        _forget_widget_tree(child)
+    widget.children.clear()
+    if widget._tclCommands:
+        for name in widget._tclCommands:
+            try:
+                widget.tk.deletecommand(name)
+            except Exception:
+                pass
+        widget._tclCommands = None
+
+
+def _destroy_children(parent_frame):
+    """Destroys every child of a frame in ONE Tcl 'destroy' call.
+
+    Per-widget .destroy() loops pay a Python->Tcl round-trip (plus a
+    geometry-manager nudge) for each widget; Tcl's destroy command takes
+    any number of windows and tears the whole batch down at C level."""
+    children = list(parent_frame.children.values())
+    if not children:
+        return
+    parent_frame.tk.call("destroy", *(str(w) for w in children))
+    for child in children:
+        _forget_widget_tree(child)
+    parent_frame.children.clear()
+
+
 def clear_inputs():
     """Fully clears all widgets in the input frame and resets tracking lists."""
     global input_widgets, input_entries
 
     # Destroy ALL widgets inside input_frame (not just tracked ones)
-    for widget in input_frame.winfo_children():
-        widget.destroy()
+    _destroy_children(input_frame)
 
     input_widgets.clear()
     input_entries.clear()
+    input_label_widgets.clear()
+    _obstruction_widgets.clear()
 
     # Safe unbind
     try:
@@ -399,8 +691,8 @@ def clear_inputs():
 def clear_outputs():
     """Destroys all widgets in the output frame and clears tracking lists."""
     global output_widgets, last_standard_results
-    for widget in output_widgets: widget.destroy()
-    output_widgets.clear(); last_standard_results.clear()
+    _destroy_children(output_frame)
+    output_widgets.clear(); output_label_widgets.clear(); last_standard_results.clear()
     print("[INFO] Output fields cleared.")
 
 def bind_navigation(entry_widget, entry_list_index):
@@ -453,7 +745,7 @@ OUTPUT_KEY_TO_STANDARD_LABEL_MAP = {
 }
 
 def store_inputs_and_calculate():
-    global input_entries, calculation_log, current_case_function, current_duct_id
+    global input_entries, current_case_function, current_duct_id
 
     if not current_case_function:
         messagebox.showerror("Error", "No calculation case loaded. Select a duct type first.")
@@ -512,15 +804,12 @@ def store_inputs_and_calculate():
             else:
                 try:
                     entered_value = float(raw_value_str)
-                    label_text = ""
-                    try:
-                        widget_index = input_widgets.index(entry_widget)
-                        if widget_index > 0 and isinstance(input_widgets[widget_index - 1], Label):
-                            label_text = input_widgets[widget_index - 1].cget("text")
-                    except:
-                        pass
-
-                    value_for_calc = converter.input_to_standard(label_text, entered_value)
+                    # Factor cached per standard label: no widget-list scan,
+                    # no cget round-trip, no substring chain per entry.
+                    if is_metric_mode:
+                        value_for_calc = entered_value * _input_factor(standard_label_key)
+                    else:
+                        value_for_calc = entered_value
                 except ValueError:
                     messagebox.showerror("Invalid Input", f"Invalid numeric input: {raw_value_str}")
                     entry_widget.focus_set()
@@ -577,13 +866,15 @@ def store_inputs_and_calculate():
         print("[WARN] Constraint check failed. Aborting calculation.")
         return
 
-    print("[DEBUG] Input values prepared for calculation function (Std Units):")
-    for k, v in calc_function_inputs.items():
-        print(f"  '{k}': {v} (Type: {type(v)})")
+    if DEBUG:
+        print("[DEBUG] Input values prepared for calculation function (Std Units):")
+        for k, v in calc_function_inputs.items():
+            print(f"  '{k}': {v} (Type: {type(v)})")
 
     try:
         output_results_raw = current_case_function(calc_function_inputs, data)
-        print(f"[DEBUG] Raw results returned from {current_case_function.__name__}: {output_results_raw}")
+        if DEBUG:
+            print(f"[DEBUG] Raw results returned from {current_case_function.__name__}: {output_results_raw}")
         if not isinstance(output_results_raw, dict):
             display_outputs_raw({"Error": "Calculation returned no valid data."})
             return
@@ -593,7 +884,7 @@ def store_inputs_and_calculate():
             log_entry = {"Timestamp": datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             log_entry.update(raw_inputs_for_log)
             log_entry.update(output_results_raw)
-            calculation_log.append(log_entry)
+            log_calculation(log_entry)
             print("[INFO] Calculation successfully logged.")
 
     except Exception as calc_err:
@@ -610,7 +901,8 @@ def display_outputs_raw(raw_results_dict):
     processed_results_for_display = []  # List of (standard_label, standard_value)
 
     if not raw_results_dict:
-        print("[DEBUG] display_outputs_raw called with empty results.")
+        if DEBUG:
+            print("[DEBUG] display_outputs_raw called with empty results.")
         return
 
     output_frame.configure(bg=current_theme["output_bg"])
@@ -652,12 +944,13 @@ def display_outputs_from_standard(standard_results_dict):
        Used directly by toggle_units and potentially by display_outputs_raw after mapping."""
     global output_widgets  # Don't clear last_standard_results here
     # Clear only widgets
-    for widget in output_widgets:
-        widget.destroy()
+    _destroy_children(output_frame)
     output_widgets.clear()
+    output_label_widgets.clear()
 
     if not standard_results_dict:
-        print("[DEBUG] display_outputs_from_standard called empty.")
+        if DEBUG:
+            print("[DEBUG] display_outputs_from_standard called empty.")
         return
 
     output_frame.configure(bg=current_theme["output_bg"])
@@ -677,35 +970,30 @@ def display_outputs_from_standard(standard_results_dict):
     output_type = getattr(current_case_function, "output_type", "standard")  # Infer type
 
     # --- Grouping and Sectioning logic (using standard_label) ---
-    sections = {}
-    processed_keys = set()
-    order = []
+    # One-shot partition into prebuilt buckets: prefixes are lowercased
+    # once and each label is lowercased once, instead of re-lowering the
+    # section names for every (section, label) pair.
     if output_type == "dual_branch":
         order = ["Branch 1", "Branch 2", "Main"]
     elif output_type == "branch_main":
         order = ["Branch", "Main"]
     else:
         order = ["Results"]
+    fallback_section = "Results" if "Results" in order else "Other Results"
+    prefixes = [(s, s.lower()) for s in order]
+    sections = {s: [] for s in order}
+    sections.setdefault(fallback_section, [])
 
     for std_label, std_value in standard_results_dict.items():
-        found_section = False
-        for section_prefix in order:
-            # Use lower case for robust prefix matching
-            if std_label and std_label.lower().startswith(section_prefix.lower()):
-                if section_prefix not in sections:
-                    sections[section_prefix] = []
+        label_lower = std_label.lower() if std_label else ""
+        for section_prefix, prefix_lower in prefixes:
+            if label_lower.startswith(prefix_lower):
                 sections[section_prefix].append((std_label, std_value))
-                processed_keys.add(std_label)
-                found_section = True
                 break
-        if not found_section:
-            fallback_section = "Results" if "Results" in order else "Other Results"
-            if fallback_section not in sections:
-                sections[fallback_section] = []
+        else:
             sections[fallback_section].append((std_label, std_value))
-            processed_keys.add(std_label)
-            if fallback_section not in order:
-                order.append(fallback_section)
+    if fallback_section not in order and sections[fallback_section]:
+        order.append(fallback_section)
 
     # --- Rendering Sections ---
     for section_title in order:
@@ -742,6 +1030,7 @@ def display_outputs_from_standard(standard_results_dict):
             output_label.grid(row=row_counter, column=0, sticky="w", padx=(20, 5), pady=1)
             output_label.original_standard_label = standard_label  # Store standard label
             output_widgets.append(output_label)
+            output_label_widgets.append(output_label)
 
             output_value_label = Label(
                 output_frame,
@@ -844,7 +1133,8 @@ def prepopulate_outputs():
     }
 
     sections = section_map.get(output_type, section_map["standard"])
-    print(f"[DEBUG] Pre-populating outputs for type '{output_type}'.")
+    if DEBUG:
+        print(f"[DEBUG] Pre-populating outputs for type '{output_type}'.")
 
     for section_title, labels in sections:
         if section_title:  # Header
@@ -872,6 +1162,7 @@ def prepopulate_outputs():
             lbl.grid(row=row_counter, column=0, sticky="w", padx=(20, 5), pady=1)
             lbl.original_standard_label = std_label
             output_widgets.append(lbl)
+            output_label_widgets.append(lbl)
 
             val = Label(
                 output_frame,
@@ -890,7 +1181,8 @@ def prepopulate_outputs():
 
             row_counter += 1
 
-    print(f"[DEBUG] Output fields prepopulated: {len(output_widgets) // 2}")
+    if DEBUG:
+        print(f"[DEBUG] Output fields prepopulated: {len(output_widgets) // 2}")
     output_frame.grid_columnconfigure(0, weight=0)
     output_frame.grid_columnconfigure(1, weight=1)
 
@@ -916,6 +1208,12 @@ def show_details_window():
         )
         return
 
+    # Deferred: matplotlib is only worth importing once a Details window
+    # is actually opened. The Axes3D import registers the 3d projection.
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+
     cfg = CASE_PLOT_CONFIG[current_duct_id]
     mode = cfg.get("mode", "surface_3d")
 
@@ -925,7 +1223,8 @@ def show_details_window():
         messagebox.showerror("Details Error", f"Failed to load case table for {current_duct_id}:\n{e}")
         return
 
-    case_name = duct_map.get(current_duct_id, {}).get("case", "")
+    duct_case = duct_map.get(current_duct_id)
+    case_name = duct_case.case if duct_case else ""
 
     # --- Build Details window ---
     win = tk.Toplevel(root)
@@ -1278,7 +1577,8 @@ def update_inputs_and_outputs(duct_id):
             # Load the special dynamic-inputs module from special_cases
             a12g_module_name = "special_cases.A12G_dynamic_inputs"
             a12g_module = importlib.import_module(a12g_module_name)
-            print("[DEBUG] A12G: Calling build_A12G_inputs()")
+            if DEBUG:
+                print("[DEBUG] A12G: Calling build_A12G_inputs()")
 
             a12g_module.build_A12G_inputs(
                 input_frame=input_frame,
@@ -1298,7 +1598,8 @@ def update_inputs_and_outputs(duct_id):
             from duct_functions.A12G_outputs import A12G_outputs
 
             current_case_function = A12G_outputs
-            print("[DEBUG] A12G inputs built.")
+            if DEBUG:
+                print("[DEBUG] A12G inputs built.")
         except Exception as e:
             error_msg = f"Failed during A12G setup: {e}"
             print(f"[ERROR] {error_msg}")
@@ -1320,7 +1621,8 @@ def update_inputs_and_outputs(duct_id):
         if data.empty:
             messagebox.showerror("Data Error", "Excel data is not loaded.")
             return
-        if duct_id not in data.index:
+        first_row = _row_cache.get(duct_id)
+        if first_row is None:
             error_msg = f"Duct ID '{duct_id}' not found in Excel data."
             messagebox.showwarning("Data Missing", error_msg)
             lbl = Label(input_frame, text=error_msg, fg="orange", bg="#eaf4ff")
@@ -1329,27 +1631,23 @@ def update_inputs_and_outputs(duct_id):
             return
 
         try:
-            print(f"[DEBUG] Loading standard inputs for {duct_id}.")
-            duct_data_row = data.loc[[duct_id]]
-            first_row = duct_data_row.iloc[0]
+            if DEBUG:
+                print(f"[DEBUG] Loading standard inputs for {duct_id}.")
 
             # duct_functions/ is on sys.path, so modules are just A10C_outputs, etc.
-            module_name = f"{duct_id}_outputs"
-            func_name = module_name
-
-            if module_name in sys.modules:
-                case_module = importlib.reload(sys.modules[module_name])
-            else:
-                case_module = importlib.import_module(module_name)
-
-            if hasattr(case_module, func_name):
-                current_case_function = getattr(case_module, func_name)
-            else:
-                raise AttributeError(f"Function '{func_name}' not found.")
-            print(
-                f"[DEBUG] Loaded function: {func_name}, "
-                f"Type: {getattr(current_case_function, 'output_type', 'standard')}"
-            )
+            current_case_function = _case_fn_cache.get(duct_id)
+            if current_case_function is None:
+                module_name = f"{duct_id}_outputs"
+                case_module = sys.modules.get(module_name) or importlib.import_module(module_name)
+                current_case_function = getattr(case_module, module_name, None)
+                if current_case_function is None:
+                    raise AttributeError(f"Function '{module_name}' not found.")
+                _case_fn_cache[duct_id] = current_case_function
+            if DEBUG:
+                print(
+                    f"[DEBUG] Loaded function: {current_case_function.__name__}, "
+                    f"Type: {getattr(current_case_function, 'output_type', 'standard')}"
+                )
 
             title_label = Label(
                 input_frame,
@@ -1361,7 +1659,6 @@ def update_inputs_and_outputs(duct_id):
             title_label.grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=(5, 10))
             input_widgets.append(title_label)
             grid_row_idx = 1
-            dynamic_widgets_ref = {}
             calculate_button = None
 
             # --- Special coupling for A7A1 / A7A2 (R-S paired dropdowns) ---
@@ -1375,6 +1672,7 @@ def update_inputs_and_outputs(duct_id):
             if special_rs_case:
                 try:
                     # Build list of (R, S) pairs from dropdown 3 / dropdown 4 in Excel rows
+                    duct_data_row = data.loc[[duct_id]]
                     for _, row in duct_data_row.iterrows():
                         rv = row.get("dropdown 3", np.nan)
                         sv = row.get("dropdown 4", np.nan)
@@ -1385,7 +1683,8 @@ def update_inputs_and_outputs(duct_id):
                     if rs_pairs:
                         r_values_ordered = [p[0] for p in rs_pairs]
                         s_values_ordered = [p[1] for p in rs_pairs]
-                    print(f"[DEBUG] A7A R/S pairs from Excel for {duct_id}: {rs_pairs}")
+                    if DEBUG:
+                        print(f"[DEBUG] A7A R/S pairs from Excel for {duct_id}: {rs_pairs}")
                 except Exception as e:
                     print(f"[ERROR] Failed to build R/S pairs for {duct_id}: {e}")
                     rs_pairs = []
@@ -1394,8 +1693,15 @@ def update_inputs_and_outputs(duct_id):
 
             def place_calculate_button(button_row):
                 nonlocal calculate_button
-                if calculate_button and calculate_button in input_widgets:
-                    input_widgets.remove(calculate_button)
+                if calculate_button is not None:
+                    # The button is always the most recently placed widget.
+                    if input_widgets and input_widgets[-1] is calculate_button:
+                        input_widgets.pop()
+                    else:
+                        try:
+                            input_widgets.remove(calculate_button)
+                        except ValueError:
+                            pass
                     calculate_button.destroy()
                 root.unbind("<Return>")
                 calculate_button = Button(
@@ -1415,23 +1721,25 @@ def update_inputs_and_outputs(duct_id):
                 calculate_button.grid(row=button_row, column=0, columnspan=2, pady=15, ipady=2)
                 input_widgets.append(calculate_button)
                 root.bind("<Return>", lambda event, b=calculate_button: b.invoke())
-                print(f"[DEBUG] Calculate button placed/moved to row {button_row}.")
+                if DEBUG:
+                    print(f"[DEBUG] Calculate button placed/moved to row {button_row}.")
 
             def update_dynamic_fields(trigger_widget, selected_value, base_row_after_trigger):
                 nonlocal grid_row_idx
-                trigger_key = trigger_widget.standard_label_key
-                if trigger_key in dynamic_widgets_ref:
-                    for widget in dynamic_widgets_ref[trigger_key]:
-                        if widget in input_widgets:
-                            input_widgets.remove(widget)
-                        input_entries[:] = [item for item in input_entries if item[0] != widget]
+                if _obstruction_widgets:
+                    # The widgets themselves are only tracked in their own
+                    # short list; entries/labels still need pruning from the
+                    # lists the store and unit-toggle paths walk.
+                    doomed = set(map(id, _obstruction_widgets))
+                    input_entries[:] = [item for item in input_entries if id(item[0]) not in doomed]
+                    input_label_widgets[:] = [w for w in input_label_widgets if id(w) not in doomed]
+                    for widget in _obstruction_widgets:
                         widget.destroy()
-                    del dynamic_widgets_ref[trigger_key]
+                    _obstruction_widgets.clear()
                     for i, (entry_w, _) in enumerate(input_entries):
                         bind_navigation(entry_w, i)
 
                 dynamic_row = base_row_after_trigger
-                dynamic_widgets_ref[trigger_key] = []
                 fields_to_add = []
                 if selected_value == "screen":
                     fields_to_add = [("n, free area ratio:", "ratio_n")]
@@ -1446,37 +1754,20 @@ def update_inputs_and_outputs(duct_id):
                     place_calculate_button(dynamic_row)
                     return
 
-                print(f"[DEBUG] Adding {len(fields_to_add)} dynamic fields for '{selected_value}'.")
+                if DEBUG:
+                    print(f"[DEBUG] Adding {len(fields_to_add)} dynamic fields for '{selected_value}'.")
                 new_entries_to_bind = []
                 for label_std, key_suffix in fields_to_add:
                     label_display = converter.get_display_label(label_std, is_metric_mode)
-                    lbl = Label(
-                        input_frame,
-                        text=f"{label_display}:",
-                        bg="#eaf4ff",
-                        fg="black",
-                        anchor="e",
-                        font=("Segoe UI", 10),
-                    )
+                    lbl = Label(input_frame, text=f"{label_display}:", **_INPUT_LABEL_OPTS)
                     lbl.grid(row=dynamic_row, column=0, sticky="e", padx=(10, 5), pady=1)
-                    input_widgets.append(lbl)
-                    dynamic_widgets_ref[trigger_key].append(lbl)
+                    _obstruction_widgets.append(lbl)
+                    lbl._canonical = label_std
+                    input_label_widgets.append(lbl)
 
-                    entry = Entry(
-                        input_frame,
-                        width=20,
-                        relief="solid",
-                        borderwidth=1,
-                        bg="white",
-                        fg="black",
-                        highlightthickness=1,
-                        highlightbackground="grey",
-                        highlightcolor="blue",
-                        font=("Segoe UI", 10),
-                    )
+                    entry = Entry(input_frame, **_INPUT_ENTRY_OPTS)
                     entry.grid(row=dynamic_row, column=1, sticky="w", padx=(5, 10), pady=1)
-                    input_widgets.append(entry)
-                    dynamic_widgets_ref[trigger_key].append(entry)
+                    _obstruction_widgets.append(entry)
                     new_entries_to_bind.append((entry, label_std))
                     dynamic_row += 1
 
@@ -1498,117 +1789,98 @@ def update_inputs_and_outputs(duct_id):
                 grid_row_idx = dynamic_row
                 place_calculate_button(grid_row_idx)
 
-            # --- Build static inputs from Excel definition ---
-            for idx, excel_col_name in enumerate(input_columns):
-                if excel_col_name in first_row and pd.notna(first_row[excel_col_name]):
-                    input_label_standard = str(first_row[excel_col_name]).strip()
-                    label_display_text = converter.get_display_label(input_label_standard, is_metric_mode)
+            # --- Build static inputs from the prebuilt schema ---
+            # _input_schema already holds (idx, stripped label, dropdown
+            # values or None, obstruction flag) per duct, so the per-click
+            # loop only rewrites the label for the current unit mode.
+            for idx, input_label_standard, cached_dropdown, is_obstruction in _input_schema.get(duct_id, ()):
+                label_display_text = converter.get_display_label(input_label_standard, is_metric_mode)
+                if DEBUG:
                     print(
                         f"[DEBUG] Creating input row {grid_row_idx}: "
                         f"'{input_label_standard}' (Display: '{label_display_text}')"
                     )
-                    lbl = Label(
+                lbl = Label(input_frame, text=f"{label_display_text}:", **_INPUT_LABEL_OPTS)
+                lbl.grid(row=grid_row_idx, column=0, sticky="e", padx=(10, 5), pady=1)
+                input_widgets.append(lbl)
+                lbl._canonical = input_label_standard
+                input_label_widgets.append(lbl)
+
+                # --- Special handling of R/S dropdowns for A7A1/A7A2 ---
+                if (
+                    special_rs_case
+                    and idx == 2
+                    and input_label_standard.upper().startswith("R")
+                    and r_values_ordered
+                ):
+                    dropdown_values = tuple(r_values_ordered)
+                    if DEBUG:
+                        print(f"[DEBUG] Using ordered R values for {duct_id}: {dropdown_values}")
+                elif (
+                    special_rs_case
+                    and idx == 3
+                    and input_label_standard.upper().startswith("S")
+                    and s_values_ordered
+                ):
+                    dropdown_values = tuple(s_values_ordered)
+                    if DEBUG:
+                        print(f"[DEBUG] Using ordered S values for {duct_id}: {dropdown_values}")
+                else:
+                    dropdown_values = cached_dropdown or ()
+
+                current_widget = None
+                if dropdown_values:
+                    combo = ttk.Combobox(
                         input_frame,
-                        text=f"{label_display_text}:",
-                        bg="#eaf4ff",
-                        fg="black",
-                        anchor="e",
-                        font=("Segoe UI", 10),
+                        values=dropdown_values,
+                        state="readonly",
+                        width=18,
+                        font=_INPUT_FONT,
                     )
-                    lbl.grid(row=grid_row_idx, column=0, sticky="e", padx=(10, 5), pady=1)
-                    input_widgets.append(lbl)
-
-                    dropdown_col_lookup = f"dropdown {idx + 1}"
-                    dropdown_values = []
-                    if dropdown_col_lookup in duct_data_row.columns:
-                        col_series = duct_data_row[dropdown_col_lookup].dropna()
-
-                        # --- Special handling of R/S dropdowns for A7A1/A7A2 ---
-                        if (
-                            special_rs_case
-                            and dropdown_col_lookup == "dropdown 3"
-                            and input_label_standard.strip().upper().startswith("R")
-                            and r_values_ordered
-                        ):
-                            dropdown_values = list(r_values_ordered)
-                            print(f"[DEBUG] Using ordered R values for {duct_id}: {dropdown_values}")
-                        elif (
-                            special_rs_case
-                            and dropdown_col_lookup == "dropdown 4"
-                            and input_label_standard.strip().upper().startswith("S")
-                            and s_values_ordered
-                        ):
-                            dropdown_values = list(s_values_ordered)
-                            print(f"[DEBUG] Using ordered S values for {duct_id}: {dropdown_values}")
-                        else:
-                            dropdown_values = [
-                                str(v).strip()
-                                for v in col_series.unique()
-                                if str(v).strip()
-                            ]
-
-                    current_widget = None
-                    if dropdown_values:
-                        combo = ttk.Combobox(
-                            input_frame,
-                            values=dropdown_values,
-                            state="readonly",
-                            width=18,
-                            font=("Segoe UI", 10),
-                        )
-                        combo.grid(row=grid_row_idx, column=1, sticky="w", padx=(5, 10), pady=1)
-                        input_widgets.append(combo)
-                        input_entries.append((combo, input_label_standard))
-                        current_widget = combo
-                        combo.standard_label_key = input_label_standard
-
-                        # Track R/S comboboxes for A7A1/A7A2
-                        if special_rs_case:
-                            label_upper = input_label_standard.strip().upper()
-                            if label_upper.startswith("R"):
-                                r_combo = combo
-                            elif label_upper.startswith("S"):
-                                s_combo = combo
-
-                        if "obstruction type" in input_label_standard.lower():
+                    combo.grid(row=grid_row_idx, column=1, sticky="w", padx=(5, 10), pady=1)
+                    input_widgets.append(combo)
+                    input_entries.append((combo, input_label_standard))
+                    current_widget = combo
+                    combo.standard_label_key = input_label_standard
+
+                    # Track R/S comboboxes for A7A1/A7A2
+                    if special_rs_case:
+                        label_upper = input_label_standard.upper()
+                        if label_upper.startswith("R"):
+                            r_combo = combo
+                        elif label_upper.startswith("S"):
+                            s_combo = combo
+
+                    if is_obstruction:
+                        if DEBUG:
                             print(
                                 f"[DEBUG] Binding dynamic update to dropdown: "
                                 f"'{input_label_standard}'"
                             )
-                            callback = lambda event, w=combo, r=grid_row_idx + 1: update_dynamic_fields(
-                                w, w.get().strip().lower(), r
-                            )
-                            combo.bind("<<ComboboxSelected>>", callback)
-                    else:
-                        entry = Entry(
-                            input_frame,
-                            width=20,
-                            relief="solid",
-                            borderwidth=1,
-                            bg="white",
-                            fg="black",
-                            highlightthickness=1,
-                            highlightbackground="grey",
-                            highlightcolor="blue",
-                            font=("Segoe UI", 10),
+                        callback = lambda event, w=combo, r=grid_row_idx + 1: update_dynamic_fields(
+                            w, w.get().strip().lower(), r
                         )
-                        entry.grid(row=grid_row_idx, column=1, sticky="w", padx=(5, 10), pady=1)
-                        input_widgets.append(entry)
-                        input_entries.append((entry, input_label_standard))
-                        current_widget = entry
+                        combo.bind("<<ComboboxSelected>>", callback)
+                else:
+                    entry = Entry(input_frame, **_INPUT_ENTRY_OPTS)
+                    entry.grid(row=grid_row_idx, column=1, sticky="w", padx=(5, 10), pady=1)
+                    input_widgets.append(entry)
+                    input_entries.append((entry, input_label_standard))
+                    current_widget = entry
 
-                    if current_widget:
-                        bind_navigation(current_widget, len(input_entries) - 1)
+                if current_widget:
+                    bind_navigation(current_widget, len(input_entries) - 1)
 
-                    grid_row_idx += 1
+                grid_row_idx += 1
 
             # --- Bind coupling behavior for A7A1/A7A2 R/S dropdowns ---
             if special_rs_case and r_combo is not None and s_combo is not None:
                 if len(r_values_ordered) == len(s_values_ordered) and len(r_values_ordered) > 0:
-                    print(
-                        f"[DEBUG] Binding R/S coupling for {duct_id} "
-                        f"(n={len(r_values_ordered)} pairs)."
-                    )
+                    if DEBUG:
+                        print(
+                            f"[DEBUG] Binding R/S coupling for {duct_id} "
+                            f"(n={len(r_values_ordered)} pairs)."
+                        )
 
                     def on_r_selected(event):
                         idx_sel = r_combo.current()
@@ -1644,7 +1916,8 @@ def update_inputs_and_outputs(duct_id):
             place_calculate_button(grid_row_idx)
             if input_entries:
                 input_entries[0][0].focus_set()
-            print(f"[DEBUG] Total static input fields created: {len(input_entries)}")
+            if DEBUG:
+                print(f"[DEBUG] Total static input fields created: {len(input_entries)}")
 
         except Exception as e:
             error_msg = f"Error during input generation for {duct_id}: {e}"
@@ -1671,6 +1944,10 @@ def update_inputs_and_outputs(duct_id):
 
 # --- Duct Map and Categories ---
 # (Your existing duct_map and categories_map - ensure images exist)
+# Entries are frozen into 2-slot DuctCase namedtuples below and the map is
+# wrapped read-only, so lookups hit an immutable table built exactly once.
+DuctCase = namedtuple("DuctCase", ["case", "image"])
+
 duct_map = {
     "A7A": {"case": "Smooth Radius (Die Stamped)", "image": "smooth_radius_90_deg.png"},
     "A7B": {"case": "3 to 5 Piece, 90°", "image": "3_to_5_piece_90_deg.png"},
@@ -1794,6 +2071,8 @@ duct_map = {
     "A15L": {"case": "Case A15L", "image": "A15L.png"},
 }
 
+duct_map = MappingProxyType({k: DuctCase(**v) for k, v in duct_map.items()})
+
 categories_map = {
     "Round": {
         "Elbows": ["A7A", "A7B", "A7C", "A7K"],
@@ -1831,6 +2110,37 @@ CATEGORY_SERIES_PREFIX = {
     "Obstructions": "A15 Series: ",
 }
 
+
+def _build_tree_rows():
+    """
+    Flatten categories_map/duct_map into Treeview insert rows, built once.
+
+    Each row is (parent_slot, text, values): parent_slot indexes an
+    earlier row in the list (-1 for top level), so population is a single
+    tight loop over precomputed strings with no per-row dict lookups.
+    """
+    rows = []
+    for shape, subcategories in categories_map.items():
+        shape_slot = len(rows)
+        rows.append((-1, shape, None))
+        for category, ids in subcategories.items():
+            prefix = CATEGORY_SERIES_PREFIX.get(category, "")
+            category_slot = len(rows)
+            rows.append((shape_slot, f"{prefix}{category}", None))
+            for duct_id in ids:
+                details = duct_map.get(duct_id)
+                if details is not None:
+                    rows.append((category_slot, details.case, (duct_id,)))
+                else:
+                    print(
+                        f"[WARN] Duct ID '{duct_id}' in categories_map "
+                        f"but not in duct_map."
+                    )
+    return tuple(rows)
+
+
+_TREE_ROWS = _build_tree_rows()
+
 # --- Case plot configuration (for Details window) ---
 CASE_PLOT_CONFIG = {
     # Rectangular Conical Exit
@@ -1865,9 +2175,20 @@ CASE_PLOT_CONFIG = {
 }
 
 # --- Treeview Selection Handler ---
+# Decoded source images and canvas-sized PhotoImages, LRU-bounded so
+# revisiting a node (or toggling between a few) skips the PNG decode and
+# the LANCZOS resample — the dominant cost of a tree click. Keys carry
+# the dark-mode flag since dark mode shows the inverted image.
+_IMG_CACHE_SIZE = 32
+_raw_img_cache = OrderedDict()  # (path, dark) -> PIL Image
+_photo_cache = OrderedDict()    # (path, dark, canvas_w, canvas_h) -> PhotoImage
+
+
 def display_image(image_file=DEFAULT_IMAGE):
     """Displays the specified image, centered and aspect-ratio preserved.
        In dark mode, show a color-inverted (negative) version on a dark canvas."""
+    from PIL import Image, ImageTk, ImageOps  # deferred; cheap after first call
+
     canvas.delete("all")
     img_path = os.path.join(IMAGE_FOLDER, image_file)
     status_text = ""
@@ -1885,39 +2206,54 @@ def display_image(image_file=DEFAULT_IMAGE):
             else:
                 raise FileNotFoundError(status_text)
 
-        img = Image.open(img_path).convert("RGB")
-
-        # --- Dark mode: show negative image for better contrast ---
-        if is_dark_mode:
-            img = ImageOps.invert(img)
-
         canvas_width = canvas.winfo_width()
         canvas_height = canvas.winfo_height()
         if canvas_width <= 1 or canvas_height <= 1:
             canvas.after(150, lambda: display_image(image_file))
             return
 
-        img_width, img_height = img.size
-        img_aspect = img_width / img_height
-        canvas_aspect = canvas_width / canvas_height
-
-        pad_factor = 0.95
-        if img_aspect > canvas_aspect:
-            new_width = int(canvas_width * pad_factor)
-            new_height = int(new_width / img_aspect)
-        else:
-            new_height = int(canvas_height * pad_factor)
-            new_width = int(new_height * img_aspect)
+        photo_key = (img_path, is_dark_mode, canvas_width, canvas_height)
+        photo = _photo_cache.get(photo_key)
+        if photo is None:
+            raw_key = (img_path, is_dark_mode)
+            img = _raw_img_cache.get(raw_key)
+            if img is None:
+                img = Image.open(img_path).convert("RGB")
+                # --- Dark mode: show negative image for better contrast ---
+                if is_dark_mode:
+                    img = ImageOps.invert(img)
+                _raw_img_cache[raw_key] = img
+                if len(_raw_img_cache) > _IMG_CACHE_SIZE:
+                    _raw_img_cache.popitem(last=False)
+            else:
+                _raw_img_cache.move_to_end(raw_key)
 
-        if new_width < 1 or new_height < 1:
-            status_text = "Image display error:\nCalculated size too small."
-            raise ValueError(status_text)
+            img_width, img_height = img.size
+            img_aspect = img_width / img_height
+            canvas_aspect = canvas_width / canvas_height
 
-        img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(img_resized)
+            pad_factor = 0.95
+            if img_aspect > canvas_aspect:
+                new_width = int(canvas_width * pad_factor)
+                new_height = int(new_width / img_aspect)
+            else:
+                new_height = int(canvas_height * pad_factor)
+                new_width = int(new_height * img_aspect)
+
+            if new_width < 1 or new_height < 1:
+                status_text = "Image display error:\nCalculated size too small."
+                raise ValueError(status_text)
+
+            img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            photo = ImageTk.PhotoImage(img_resized)
+            _photo_cache[photo_key] = photo
+            if len(_photo_cache) > _IMG_CACHE_SIZE:
+                _photo_cache.popitem(last=False)
+        else:
+            _photo_cache.move_to_end(photo_key)
 
-        x_center = (canvas_width - new_width) // 2
-        y_center = (canvas_height - new_height) // 2
+        x_center = (canvas_width - photo.width()) // 2
+        y_center = (canvas_height - photo.height()) // 2
         canvas.create_image(x_center, y_center, image=photo, anchor=NW)
         canvas.image = photo
 
@@ -2049,7 +2385,7 @@ def on_tree_select(event):
     update_inputs_and_outputs(duct_id)
 
     # Update image for this duct
-    image_file = duct_map[duct_id].get("image", DEFAULT_IMAGE)
+    image_file = duct_map[duct_id].image or DEFAULT_IMAGE
     display_image(image_file)
 
     # Enable/disable Details button depending on whether we have a plot config
@@ -2099,7 +2435,7 @@ if __name__ == "__main__":
         top_ribbon,
         text="Clear Log",
         command=lambda: (
-            calculation_log.clear(),
+            clear_log(),
             print("[INFO] Log Cleared"),
             messagebox.showinfo("Log Cleared", "Calculation log has been cleared.")
         )
@@ -2158,35 +2494,23 @@ if __name__ == "__main__":
     if data.empty:
         tree.insert("", "end", text="Error: Excel data not loaded.")
     else:
-        # Preserve insertion order from categories_map (no sorting),
-        # and prepend "A## Series:" to each category label.
-        for shape, subcategories in categories_map.items():
-            shape_node = tree.insert("", "end", text=shape, open=False)
-
-            for category, ids in subcategories.items():
-                prefix = CATEGORY_SERIES_PREFIX.get(category, "")
-                category_label = f"{prefix}{category}"
-                category_node = tree.insert(
-                    shape_node, "end", text=category_label, open=False
-                )
-
-                for duct_id in ids:
-                    if duct_id in duct_map:
-                        details = duct_map[duct_id]
-                        tree.insert(
-                            category_node,
-                            "end",
-                            text=details["case"],
-                            values=(duct_id,),
-                        )
-                    else:
-                        print(
-                            f"[WARN] Duct ID '{duct_id}' in categories_map "
-                            f"but not in duct_map."
-                        )
+        # Insertion order (and the "A## Series:" labels) come precomputed
+        # from _TREE_ROWS; this is just one tight loop of inserts before
+        # the widget is first drawn.
+        insert = tree.insert
+        node_ids = []
+        for parent_slot, text, values in _TREE_ROWS:
+            parent = node_ids[parent_slot] if parent_slot >= 0 else ""
+            if values is None:
+                node_ids.append(insert(parent, "end", text=text, open=False))
+            else:
+                node_ids.append(insert(parent, "end", text=text, values=values))
 
     tree.bind("<<TreeviewSelect>>", on_tree_select)
     root.update_idletasks()
     display_image()
+    # Fill the dispatch table off the UI thread so the window appears
+    # immediately and first selections still hit warm cache entries.
+    threading.Thread(target=_warm_case_functions, daemon=True, name="case-warm").start()
     print("[INFO] Application started. Select a duct fitting from the list.")
     root.mainloop()
\ No newline at end of file